@@ -0,0 +1,14 @@
+"""
+KeepWatch core library.
+
+Everything in this package is importable without Streamlit so that the
+web app, command-line tools and background services share one
+implementation of the prayer-watch logic.
+"""
+import os
+
+# Files keepwatch writes at runtime (caches, logs, batch output). The default is
+# data/ beside the package rather than the working directory, so the app and
+# the command-line tools find the same files wherever they are started from.
+STATE_DIR = os.environ.get(
+    "KEEPWATCH_STATE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"))
@@ -0,0 +1,62 @@
+"""
+Minimal aladhan.com client with no Streamlit dependency.
+
+Point ``ALADHAN_BASE_URL`` at ``scripts/aladhan_stub.py`` to run the app or
+load tests without touching the real API.
+"""
+import os
+from datetime import datetime
+
+import requests
+
+from keepwatch.caching import StaleWhileRevalidate
+
+ALADHAN_BASE_URL = os.environ.get("ALADHAN_BASE_URL", "https://api.aladhan.com/v1").rstrip("/")
+REQUEST_TIMEOUT = 10
+DEFAULT_METHOD = 2
+
+
+class AladhanError(Exception):
+    """The API answered, but not with usable timings."""
+
+
+def _get(path, params):
+    response = requests.get(f"{ALADHAN_BASE_URL}/{path}", params=params, timeout=REQUEST_TIMEOUT)
+    try:
+        data = response.json()
+    except ValueError:
+        raise AladhanError(f"HTTP {response.status_code}: non-JSON response")
+    if response.status_code != 200 or data.get("code") != 200:
+        raise AladhanError(str(data.get("status") or data.get("data") or f"HTTP {response.status_code}"))
+    return data["data"]
+
+
+def fetch_timings_by_city(city, country, date_obj=None, method=DEFAULT_METHOD):
+    params = {"city": city, "country": country, "method": method}
+    if date_obj:
+        params["date"] = date_obj.strftime("%d-%m-%Y")
+    return _get("timingsByCity", params)
+
+
+def fetch_calendar(latitude, longitude, timezone, year, month, method=DEFAULT_METHOD):
+    """
+    All days of one month at a coordinate, in a single request.
+
+    Returns ``{date: timings}`` where timings hold aladhan's 'HH:MM (TZ)'
+    strings in ``timezone``.
+    """
+    days = _get(f"calendar/{year}/{month}", {
+        "latitude": latitude,
+        "longitude": longitude,
+        "method": method,
+        "timezonestring": timezone,
+    })
+    return {
+        datetime.strptime(day["date"]["gregorian"]["date"], "%d-%m-%Y").date(): day["timings"]
+        for day in days
+    }
+
+
+# Shared by all sessions: an expired entry is served at once and refreshed in
+# the background instead of blocking the next user on a 10 s request.
+cached_timings_by_city = StaleWhileRevalidate(fetch_timings_by_city, ttl=3600, name="aladhan_city")
@@ -0,0 +1,271 @@
+"""
+Small JSON API for clients that only need watch times, verse links or trivia.
+
+Runs next to the Streamlit app (no websocket, session state or script run per
+lookup) on the same keepwatch code. It is a separate process, so its caches are
+its own; like the app, it seeds the schedule cache from the nightly watch table:
+
+    python -m keepwatch.api --port 8600
+
+    GET  /v1/watches?city=Paris&country=France[&date=YYYY-MM-DD]
+    GET  /v1/watches?latitude=48.85&longitude=2.35&timezone=Europe/Paris
+    GET  /v1/verses?text=Read+John+3:16          (or POST {"text": ...})
+    GET  /v1/trivia?count=5[&seed=42][&reference=John+3]
+    GET  /healthz, /metrics
+
+Successful responses are kept in an in-process LRU keyed by the normalized
+request, carry an ``ETag`` and ``Cache-Control``, and answer
+``If-None-Match`` with 304. ``/metrics`` is only served to clients on the
+loopback interface unless the server is started with ``--public-metrics``.
+"""
+import argparse
+import hashlib
+import ipaddress
+import json
+import random
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+import requests
+
+from keepwatch import metrics
+from keepwatch.aladhan import AladhanError
+from keepwatch.batch import seed_schedule_cache
+from keepwatch.caching import LRUCache
+from keepwatch.gazetteer import Location, resolve_location
+from keepwatch.references import parse_reference
+from keepwatch.trivia import generate_bible_trivia_questions, questions_touching
+from keepwatch.verses import link_bible_verses
+from keepwatch.watches import SCHEDULE_CACHE, WATCHES, get_day_schedule
+
+RESPONSE_CACHE = LRUCache(maxsize=4096, name="api_response")
+MAX_TEXT_LENGTH = 20000
+MAX_TRIVIA_QUESTIONS = 20
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(query, name, default=None):
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def _location_from_query(query):
+    if "latitude" in query and "longitude" in query:
+        try:
+            latitude, longitude = float(_param(query, "latitude")), float(_param(query, "longitude"))
+        except ValueError:
+            raise ApiError(400, "latitude and longitude must be numbers")
+        tz_name = _param(query, "timezone", "UTC")
+        if tz_name not in pytz.all_timezones_set:
+            raise ApiError(400, f"Unknown timezone '{tz_name}'")
+        return Location(f"{latitude:.4f}, {longitude:.4f}", "", "", latitude, longitude, tz_name, 0)
+    city = (_param(query, "city") or "").strip()
+    if not city:
+        raise ApiError(400, "Pass city (and optionally country), or latitude/longitude/timezone")
+    location = resolve_location(city, _param(query, "country"))
+    if location is None:
+        raise ApiError(404, f"Unknown location '{city}'")
+    return location
+
+
+def watches_endpoint(query):
+    location = _location_from_query(query)
+    if "date" in query:
+        try:
+            day = datetime.strptime(_param(query, "date"), "%Y-%m-%d").date()
+        except ValueError:
+            raise ApiError(400, "date must be YYYY-MM-DD")
+    else:
+        day = datetime.now(pytz.timezone(location.timezone)).date()
+
+    def build():
+        try:
+            schedule = get_day_schedule(location, day)
+        except (AladhanError, requests.exceptions.RequestException) as e:
+            raise ApiError(502, f"Prayer times unavailable: {e}")
+        if schedule is None:
+            raise ApiError(404, f"No sunrise/sunset at this location on {day}")
+        return {
+            "location": {
+                "name": location.label,
+                "latitude": location.latitude,
+                "longitude": location.longitude,
+                "timezone": location.timezone,
+            },
+            "date": day.isoformat(),
+            "sunrise": schedule["sunrise"].isoformat(),
+            "sunset": schedule["sunset"].isoformat(),
+            "watches": [
+                {"key": w["key"], "name": w["name"], "period": w["period"],
+                 "start": start.isoformat(), "end": end.isoformat()}
+                for w, (start, end) in zip(WATCHES, schedule["windows"])
+            ],
+        }
+
+    # Keyed on the resolved place, so every spelling of a city shares one entry.
+    return ("watches", location, day), build, "public, max-age=3600"
+
+
+def verses_endpoint(query, body=None):
+    text = (body or {}).get("text") if body is not None else _param(query, "text")
+    if not isinstance(text, str) or not text:
+        raise ApiError(400, "text is required")
+    if len(text) > MAX_TEXT_LENGTH:
+        raise ApiError(413, f"text is longer than {MAX_TEXT_LENGTH} characters")
+    return ("verses", text), lambda: {"text": text, "markdown": link_bible_verses(text)}, "public, max-age=86400"
+
+
+def trivia_endpoint(query):
+    try:
+        count = min(max(int(_param(query, "count", 5)), 1), MAX_TRIVIA_QUESTIONS)
+        seed = _param(query, "seed")
+        seed = None if seed is None else int(seed)
+    except ValueError:
+        raise ApiError(400, "count and seed must be integers")
+    reference = _param(query, "reference")
+    if reference and not parse_reference(reference):
+        raise ApiError(400, f"Not a Bible reference: '{reference}'")
+    if reference and not questions_touching(reference):
+        raise ApiError(404, f"No trivia questions about {reference}")
+
+    def build():
+        rng = random if seed is None else random.Random(seed)
+        questions = generate_bible_trivia_questions(count, rng=rng, reference=reference)
+        return {"seed": seed, "reference": reference, "questions": questions}
+
+    if seed is None:
+        return None, build, "no-store"  # a fresh quiz on every call
+    return ("trivia", count, seed, reference), build, "public, max-age=86400"
+
+
+ROUTES = {
+    "/v1/watches": watches_endpoint,
+    "/v1/verses": verses_endpoint,
+    "/v1/trivia": trivia_endpoint,
+}
+
+
+def _encode(payload):
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return body, '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an ``If-None-Match`` header (``*`` or a list of tags, weak or strong) names ``etag``."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def respond(key, build, cache_control):
+    """``(body, etag, cache_control)`` for a route, from the response cache when possible."""
+    if key is None:
+        return (*_encode(build()), cache_control)
+    return RESPONSE_CACHE.get_or_compute(key, lambda: (*_encode(build()), cache_control))
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "KeepWatchAPI/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, etag=None, cache_control="no-store"):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", cache_control)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, _encode({"error": message})[0])
+
+    def _metrics_allowed(self):
+        return self.server.public_metrics or ipaddress.ip_address(self.client_address[0]).is_loopback
+
+    def _handle(self, body=None):
+        started = time.perf_counter()
+        url = urlparse(self.path)
+        path = url.path.rstrip("/")
+        query = parse_qs(url.query)
+        metrics.incr(f"api.requests.{path or '/'}")
+        try:
+            if path == "/healthz":
+                return self._send(200, _encode({"status": "ok", "date": date.today().isoformat()})[0])
+            if path == "/metrics":
+                if not self._metrics_allowed():
+                    return self._error(403, "Metrics are only served to localhost")
+                return self._send(200, _encode(metrics.snapshot())[0])
+            route = ROUTES.get(path)
+            if route is None:
+                return self._error(404, f"No such endpoint '{url.path}'")
+            key, build, cache_control = route(query, body) if body is not None else route(query)
+            payload, etag, cache_control = respond(key, build, cache_control)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.end_headers()
+                return
+            self._send(200, payload, etag, cache_control)
+        except ApiError as e:
+            metrics.incr(f"api.errors.{e.status}")
+            self._error(e.status, str(e))
+        except Exception as e:
+            metrics.incr("api.errors.500")
+            self._error(500, f"{type(e).__name__}: {e}")
+        finally:
+            metrics.observe(f"api.latency_ms.{path or '/'}", (time.perf_counter() - started) * 1000)
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/v1/verses":
+            return self._error(405, "Only /v1/verses accepts POST")
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._error(400, "Body must be JSON")
+        if not isinstance(body, dict):
+            return self._error(400, 'Body must be a JSON object like {"text": "..."}')
+        self._handle(body)
+
+
+def serve(host="127.0.0.1", port=8600, public_metrics=False):
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.public_metrics = public_metrics
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--public-metrics", action="store_true", help="serve /metrics to any client, not only localhost")
+    args = parser.parse_args()
+    seeded = seed_schedule_cache(SCHEDULE_CACHE)
+    server = serve(args.host, args.port, args.public_metrics)
+    print(f"KeepWatch API on http://{args.host}:{args.port} ({seeded} precomputed schedules)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
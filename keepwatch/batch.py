@@ -0,0 +1,182 @@
+"""
+Nightly batch computation of tomorrow's watches for every user.
+
+All users' coordinates go through ``sun_times``/``watch_windows`` as arrays,
+so N users cost one NumPy pass instead of N ``parse_time``/``calculate_hours``
+round trips. The result is a columnar ``.npz`` file (epoch seconds, one row
+per user, one column per watch) that the app and the reminder service load
+as-is:
+
+    python -m keepwatch.batch users.csv
+
+``users.csv`` uses the same columns as the reminder service's subscriber file.
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytz
+
+from keepwatch import STATE_DIR
+from keepwatch.gazetteer import load_locations
+from keepwatch.watches import CELL_DEGREES, WATCHES, sun_times, watch_windows
+
+WATCH_TABLE_PATH = os.environ.get("KEEPWATCH_WATCH_TABLE", os.path.join(STATE_DIR, "watch_table.npz"))
+
+
+def local_dates(timezones, days_ahead=1, now=None):
+    """Each user's local calendar date ``days_ahead`` from ``now``, one pytz call per distinct zone."""
+    now = now or datetime.now(timezone.utc)
+    zones, inverse = np.unique(np.asarray(timezones), return_inverse=True)
+    per_zone = np.array(
+        [np.datetime64(now.astimezone(pytz.timezone(z)).date() + timedelta(days=days_ahead), "D") for z in zones],
+        dtype="datetime64[D]",
+    )
+    return per_zone[inverse]
+
+
+def compute_watch_table(user_ids, latitudes, longitudes, timezones, dates):
+    """Column arrays for every user: sunrise/sunset (N,) and watch starts/ends (N, 8) in epoch seconds."""
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    sunrise, sunset = sun_times(latitudes, longitudes, dates)
+    starts, ends = watch_windows(sunrise, sunset)
+
+    tz_names, tz_index = np.unique(np.asarray(timezones), return_inverse=True)
+    # Same rounding as location_cell, so rows line up with SCHEDULE_CACHE keys.
+    cells = np.stack([np.round(latitudes / CELL_DEGREES), np.round(longitudes / CELL_DEGREES)], axis=-1).astype(np.int32)
+
+    def seconds(values):
+        # NaT (no sunrise/sunset) is stored as the int64 minimum, like NumPy does.
+        return values.astype("datetime64[s]").astype(np.int64)
+
+    return {
+        "user_id": np.asarray(user_ids, dtype=str),
+        "date": np.asarray(dates, dtype="datetime64[D]"),
+        "cell": cells,
+        "tz_index": tz_index.astype(np.uint16),
+        "tz_names": tz_names.astype(str),
+        "sunrise": seconds(sunrise),
+        "sunset": seconds(sunset),
+        "starts": seconds(starts),
+        "ends": seconds(ends),
+        "watch_keys": np.array([w["key"] for w in WATCHES]),
+    }
+
+
+def write_watch_table(path, table):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp.npz"
+    np.savez(tmp, **table)
+    os.replace(tmp, path)
+
+
+class WatchTable:
+    """
+    Read side of the batch file. Columns are loaded lazily by ``np.load``;
+    lookups by user or by (cell, date) only index into them.
+    """
+
+    _NAT = np.iinfo(np.int64).min
+
+    def __init__(self, path=WATCH_TABLE_PATH):
+        self.path = path
+        data = np.load(path)
+        self.user_id = data["user_id"]
+        self.date = data["date"]
+        self.cell = data["cell"]
+        self.tz_index = data["tz_index"]
+        self.tz_names = data["tz_names"]
+        self.sunrise = data["sunrise"]
+        self.sunset = data["sunset"]
+        self.starts = data["starts"]
+        self.ends = data["ends"]
+        self._row_of_user = {uid: i for i, uid in enumerate(self.user_id.tolist())}
+        self._row_of_cell = {}
+        for i, (lat_cell, lon_cell) in enumerate(self.cell.tolist()):
+            key = (lat_cell, lon_cell, str(self.tz_names[self.tz_index[i]]), self.date[i].item().isoformat())
+            self._row_of_cell.setdefault(key, i)
+
+    def __len__(self):
+        return len(self.user_id)
+
+    def _to_datetime(self, seconds, tz):
+        if seconds == self._NAT:
+            return None
+        return datetime.fromtimestamp(int(seconds), timezone.utc).astimezone(tz)
+
+    def row_schedule(self, row):
+        """The ``{"sunrise", "sunset", "windows"}`` dict the app caches, for one row."""
+        tz = pytz.timezone(str(self.tz_names[self.tz_index[row]]))
+        windows = [
+            (self._to_datetime(start, tz), self._to_datetime(end, tz))
+            for start, end in zip(self.starts[row], self.ends[row])
+        ]
+        if any(start is None for start, _ in windows):
+            return None
+        return {
+            "sunrise": self._to_datetime(self.sunrise[row], tz),
+            "sunset": self._to_datetime(self.sunset[row], tz),
+            "windows": windows,
+        }
+
+    def for_user(self, user_id):
+        row = self._row_of_user.get(user_id)
+        return None if row is None else (self.date[row].item(), self.row_schedule(row))
+
+    def cell_windows(self, cell, day):
+        """Raw epoch-second (starts, ends) for a schedule cell on ``day``, or None."""
+        row = self._row_of_cell.get((*cell, day.isoformat()))
+        return None if row is None else (self.starts[row], self.ends[row])
+
+    def schedules_by_key(self):
+        """``{schedule_key: schedule}`` for every distinct cell/date in the file."""
+        result = {}
+        for key, row in self._row_of_cell.items():
+            schedule = self.row_schedule(row)
+            if schedule:
+                result[key] = schedule
+        return result
+
+
+def seed_schedule_cache(cache, path=WATCH_TABLE_PATH):
+    """Load a batch file into ``SCHEDULE_CACHE``; returns the number of entries added."""
+    if not os.path.exists(path):
+        return 0
+    schedules = WatchTable(path).schedules_by_key()
+    for key, schedule in schedules.items():
+        cache.put(key, schedule)
+    return len(schedules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("users", help="CSV of users and their locations")
+    parser.add_argument("--out", default=WATCH_TABLE_PATH)
+    parser.add_argument("--days-ahead", type=int, default=1, help="1 = tomorrow in each user's timezone")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    locations, unresolved = load_locations(args.users)
+    loaded = time.perf_counter()
+
+    user_ids = [user_id for user_id, _ in locations]
+    timezones = [loc.timezone for _, loc in locations]
+    table = compute_watch_table(
+        user_ids,
+        [loc.latitude for _, loc in locations],
+        [loc.longitude for _, loc in locations],
+        timezones,
+        local_dates(timezones, args.days_ahead),
+    )
+    computed = time.perf_counter()
+    write_watch_table(args.out, table)
+
+    print(f"{len(user_ids)} users ({len(unresolved)} unresolved) -> {args.out}")
+    print(f"load {loaded - started:.2f}s, compute {computed - loaded:.3f}s, write {time.perf_counter() - computed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+biblehub.com chapter fetches for Hangman verse sentences.
+
+A chapter page is downloaded once and reduced to its verse spans, so every
+word referencing the same chapter is served from one cached entry.
+"""
+import os
+import re
+
+import requests
+from bs4 import BeautifulSoup
+
+from keepwatch.caching import StaleWhileRevalidate
+
+BIBLEHUB_BASE_URL = os.environ.get("BIBLEHUB_BASE_URL", "https://biblehub.com").rstrip("/")
+REQUEST_TIMEOUT = 10
+_VERSE_SPAN_ID = re.compile(r"^v\d+$")
+
+
+def fetch_chapter_verses(book_slug, chapter, version="bsb"):
+    """``{span id: verse text}`` for one chapter page, e.g. ``{'v1716': '...'}``."""
+    response = requests.get(f"{BIBLEHUB_BASE_URL}/{version}/{book_slug}/{chapter}.htm", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, "html.parser")
+    return {span["id"]: span.get_text(strip=True) for span in soup.find_all("span", id=_VERSE_SPAN_ID)}
+
+
+# Scripture text does not change; a day-old page is as good as a fresh one.
+cached_chapter_verses = StaleWhileRevalidate(fetch_chapter_verses, ttl=24 * 3600, name="biblehub_chapter")
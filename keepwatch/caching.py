@@ -0,0 +1,260 @@
+"""
+In-process caches shared across Streamlit sessions.
+
+``st.cache_data`` keys on the exact function arguments, so the same city typed
+two ways is fetched twice. These caches are keyed by whatever the caller
+normalizes to and report their hit rates through ``keepwatch.metrics``.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from keepwatch import metrics
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize, name):
+        self.maxsize = maxsize
+        self.name = name
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+        metrics.incr(f"cache.{self.name}.{'miss' if value is _MISSING else 'hit'}")
+        return default if value is _MISSING else value
+
+    def put(self, key, value):
+        evicted = 0
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+        if evicted:
+            metrics.incr(f"cache.{self.name}.eviction", evicted)
+
+    def get_or_compute(self, key, compute):
+        """
+        Cached value for ``key``, computing and storing it on a miss.
+
+        ``compute`` runs outside the lock; a ``None`` result is returned but
+        not cached so failures are retried on the next call.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block until it finishes and receive the same result (or
+    exception). Nothing is remembered afterwards - pair it with a cache.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.incr(f"singleflight.{self.name}.coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        metrics.incr(f"singleflight.{self.name}.executed")
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+class StaleWhileRevalidate:
+    """
+    Cache around a fetch function that never makes a user wait on a refresh.
+
+    Fresh entries (younger than ``ttl`` seconds) are returned as-is. Expired
+    entries are still returned immediately while a background thread fetches
+    a replacement; if that fetch fails the last good value stays in place.
+    Only a cold miss calls ``fetch`` on the caller's thread, and its
+    exceptions propagate so failures are never cached. Concurrent fetches of
+    one key (cold misses and background refreshes alike) share a single
+    request through ``SingleFlight``.
+
+    Wrap a function with ``stale_while_revalidate(ttl, name)`` and call it
+    like the original; ``age(*args)`` reports how old the cached value is.
+    """
+
+    def __init__(self, fetch, ttl, name, maxsize=1024):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.name = name
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (value, fetched_at)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight(name)
+
+    @staticmethod
+    def _key(args, kwargs):
+        return args + tuple(sorted(kwargs.items()))
+
+    def __call__(self, *args, **kwargs):
+        return self.get_with_age(*args, **kwargs)[0]
+
+    def get_with_age(self, *args, **kwargs):
+        """``(value, age_seconds)``; age is 0 for a value fetched by this call."""
+        key = self._key(args, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            metrics.incr(f"swr.{self.name}.miss")
+            return self._load(key, args, kwargs), 0.0
+
+        value, fetched_at = entry
+        age = time.time() - fetched_at
+        if age <= self.ttl:
+            metrics.incr(f"swr.{self.name}.fresh")
+        else:
+            metrics.incr(f"swr.{self.name}.stale")
+            metrics.observe(f"swr.{self.name}.stale_age_s", age)
+            self._refresh_in_background(key, args, kwargs)
+        return value, age
+
+    def age(self, *args, **kwargs):
+        """Seconds since the cached value was fetched, or None if there is none."""
+        with self._lock:
+            entry = self._entries.get(self._key(args, kwargs))
+        return None if entry is None else time.time() - entry[1]
+
+    def is_stale(self, *args, **kwargs):
+        age = self.age(*args, **kwargs)
+        return age is not None and age > self.ttl
+
+    def _load(self, key, args, kwargs):
+        value = self._flight.do(key, self._fetch, *args, **kwargs)
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _refresh_in_background(self, key, args, kwargs):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key, args, kwargs), daemon=True,
+                         name=f"swr-{self.name}").start()
+
+    def _refresh(self, key, args, kwargs):
+        try:
+            self._load(key, args, kwargs)
+            metrics.incr(f"swr.{self.name}.refresh_ok")
+        except Exception:
+            metrics.incr(f"swr.{self.name}.refresh_error")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            ages = [now - fetched_at for _, fetched_at in self._entries.values()]
+            refreshing = len(self._refreshing)
+        return {
+            "name": self.name,
+            "size": len(ages),
+            "maxsize": self.maxsize,
+            "stale": sum(age > self.ttl for age in ages),
+            "refreshing": refreshing,
+            "oldest_age_s": round(max(ages), 1) if ages else None,
+        }
+
+
+def stale_while_revalidate(ttl, name, maxsize=1024):
+    """Decorator form of ``StaleWhileRevalidate``."""
+    def decorator(fetch):
+        return StaleWhileRevalidate(fetch, ttl=ttl, name=name, maxsize=maxsize)
+    return decorator
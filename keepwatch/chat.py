@@ -0,0 +1,223 @@
+"""
+Faith Companion replies from Groq, streamed, with no Streamlit dependency.
+
+``stream_reply`` yields text deltas as the model produces them and records
+time to first token (``chat.ttft_ms``), the latency users actually feel, next
+to the full reply time, overall and per model (``chat.reply_ms.<model>``).
+Both include the wait in the LLM queue; ``chat.call_ms.<model>`` times the
+call alone, from when the dispatcher starts it, and is what ``model_router``
+reads. ``linked_stream`` adds verse links on the way to the page without
+rescanning the growing reply on every chunk.
+
+A call with no text by its model's p95 time to first token gets a hedged
+duplicate (``KEEPWATCH_CHAT_HEDGE_MODEL``, the same model by default); the
+first to produce text is streamed and the other cancelled. Hedges are only
+sent when the LLM queue has a free slot, so they never add to a backlog, and
+``KEEPWATCH_CHAT_HEDGE=0`` turns them off. ``chat.hedges`` over
+``chat.requests`` is the hedge rate; ``chat.hedge_wins`` counts duplicates
+that answered first. Every call, duplicates and retries included, is recorded
+in ``llm_accounting.LEDGER`` under the model it went to.
+
+``message_markdown`` renders a history bubble once per distinct message as
+plain (safe) markdown; message text never goes into unsafe HTML. The static
+``COPY_BUTTON`` sits in its own element next to the bubble, and every button
+is served by the single ``COPY_SCRIPT``, so a rerun of a long conversation
+re-sends neither links nor per-message scripts.
+"""
+import os
+import queue
+import time
+from functools import lru_cache
+
+from keepwatch import metrics
+from keepwatch.chat_context import estimate_tokens, message_tokens
+from keepwatch.llm_accounting import LEDGER
+from keepwatch.llm_dispatch import DISPATCHER
+from keepwatch.verses import IncrementalVerseLinker, link_bible_verses
+
+CHAT_MODEL = "llama-3.3-70b-versatile"
+HEDGE_ENABLED = os.environ.get("KEEPWATCH_CHAT_HEDGE", "1") != "0"
+HEDGE_MODEL = os.environ.get("KEEPWATCH_CHAT_HEDGE_MODEL", "same")
+HEDGE_PERCENTILE = 95
+HEDGE_DEFAULT_MS = 4000     # deadline until a model has MIN_HEDGE_SAMPLES replies
+HEDGE_MIN_MS = 1000
+MIN_HEDGE_SAMPLES = 20
+HEDGE_POLL_S = 0.02
+SPEAKERS = {"user": "You", "assistant": "Watcher"}
+COPY_BUTTON = '<button class="kw-copy" title="Copy message">📋</button>'
+
+# One delegated click handler on the page for every copy button. Each bubble
+# and its button share a container; the handler copies the text of the first
+# markdown element in the button's container, so no message text is duplicated
+# into scripts. Re-binding on each load replaces a handler left by an older iframe.
+COPY_SCRIPT = """
+<script>
+const page = window.parent;
+if (page.kwCopyHandler) {
+    page.document.removeEventListener("click", page.kwCopyHandler);
+}
+page.kwCopyHandler = (event) => {
+    const button = event.target.closest("button.kw-copy");
+    if (!button) return;
+    const block = button.closest('[data-testid="stVerticalBlock"]');
+    const bubble = block && block.querySelector('[data-testid="stMarkdownContainer"]');
+    if (!bubble) return;
+    const text = bubble.innerText.trim();
+    page.navigator.clipboard.writeText(text).then(() => {
+        button.innerText = "✅";
+        setTimeout(() => { button.innerText = "📋"; }, 1500);
+    });
+};
+page.document.addEventListener("click", page.kwCopyHandler);
+</script>
+"""
+
+
+def _text(chunk):
+    return chunk.choices[0].delta.content if chunk.choices else None
+
+
+def hedge_after_ms(model):
+    """How long a started call may go without text before it is hedged."""
+    if metrics.counter(f"chat.replies.{model}") < MIN_HEDGE_SAMPLES:
+        return HEDGE_DEFAULT_MS
+    p = metrics.percentiles(f"chat.call_ttft_ms.{model}", (HEDGE_PERCENTILE,))
+    return max(p[HEDGE_PERCENTILE], HEDGE_MIN_MS) if p else HEDGE_DEFAULT_MS
+
+
+def _hedged(job, hedge, deadline_ms):
+    """
+    ``job``'s chunks, unless it has no text ``deadline_ms`` after starting:
+    then ``hedge()`` submits a duplicate and whichever produces text first is
+    streamed while the other is cancelled.
+    """
+    racers = [job]
+    try:
+        deadline = time.monotonic() + deadline_ms / 1000
+        while (timeout := deadline - time.monotonic()) > 0:
+            try:
+                chunk = job.get(timeout)
+            except (queue.Empty, StopIteration):
+                break
+            if _text(chunk):
+                yield chunk
+                yield from job.stream()
+                return
+        if job.finished:
+            return  # ended without any text
+        if not DISPATCHER.has_capacity():
+            metrics.incr("chat.hedges_skipped")
+            yield from job.stream()
+            return
+
+        metrics.incr("chat.hedges")
+        racers.append(hedge())
+        while racers:
+            for racer in list(racers):
+                try:
+                    chunk = racer.get(HEDGE_POLL_S)
+                except queue.Empty:
+                    continue
+                except StopIteration:
+                    chunk = None  # finished without text: let it "win" with an empty reply
+                except Exception:
+                    racers.remove(racer)
+                    if racers:
+                        continue  # the other call may still answer
+                    raise
+                if chunk is not None and not _text(chunk):
+                    continue
+                for loser in racers:
+                    if loser is not racer:
+                        loser.cancel()
+                metrics.incr("chat.hedge_wins" if racer is not job else "chat.hedge_primary_wins")
+                if chunk is not None:
+                    yield chunk
+                    yield from racer.stream()
+                return
+    finally:
+        for racer in racers:
+            if not racer.finished:
+                racer.cancel()
+
+
+def stream_reply(client, messages, model=CHAT_MODEL, session=None, on_wait=None, hedge=HEDGE_ENABLED):
+    """
+    Yield the reply's text deltas as they arrive.
+
+    The call goes through the process-wide LLM queue as ``session``; while it
+    waits, ``on_wait(position)`` is called about every quarter second.
+    Time to first token includes that wait, since the user feels it too.
+    With ``hedge``, a call that is slow to start talking is raced against a
+    duplicate.
+    """
+    started = time.perf_counter()
+    metrics.incr("chat.requests")
+    first_token = None
+    cost = sum(map(message_tokens, messages))
+
+    def submit(model, hedged=False):
+        call = LEDGER.track(
+            lambda: client.chat.completions.create(messages=messages, model=model, stream=True),
+            session, "chat", model, prompt_tokens=cost, stream=True, hedged=hedged, estimate=estimate_tokens,
+        )
+        return DISPATCHER.submit(session, call, cost=cost, stream=True)
+
+    job = submit(model)
+    try:
+        while not job.started.wait(0.25):
+            if on_wait:
+                on_wait(job.position())
+    except BaseException:
+        job.cancel()  # e.g. a rerun interrupted the wait; give up the place in line
+        raise
+    call_started = time.perf_counter()
+    hedge_model = model if HEDGE_MODEL == "same" else HEDGE_MODEL
+    chunks = _hedged(job, lambda: submit(hedge_model, hedged=True), hedge_after_ms(model)) if hedge else job.stream()
+    try:
+        for chunk in chunks:
+            delta = _text(chunk)
+            if not delta:
+                continue
+            if first_token is None:
+                first_token = time.perf_counter()
+                metrics.observe("chat.ttft_ms", (first_token - started) * 1000)
+                metrics.observe(f"chat.ttft_ms.{model}", (first_token - started) * 1000)
+                metrics.observe(f"chat.call_ttft_ms.{model}", (first_token - call_started) * 1000)
+            yield delta
+    except Exception:
+        metrics.incr("chat.errors")
+        raise
+    finally:
+        chunks.close()
+    finished = time.perf_counter()
+    metrics.observe("chat.reply_ms", (finished - started) * 1000)
+    metrics.observe(f"chat.reply_ms.{model}", (finished - started) * 1000)
+    metrics.observe(f"chat.call_ms.{model}", (finished - call_started) * 1000)
+    metrics.incr(f"chat.replies.{model}")
+
+
+def linked_stream(deltas, parts):
+    """
+    Re-yield ``deltas`` as verse-linked markdown, appending the raw text to ``parts``.
+
+    Text near the end of the stream is held back until no reference in it can
+    still grow ("John 3:" waiting for "16"), then released already linked.
+    """
+    linker = IncrementalVerseLinker()
+    released = 0
+    for delta in deltas:
+        parts.append(delta)
+        text = linker.feed(delta)
+        if text:
+            released += len(text)
+            yield text
+    tail = linker.flush()[released:]
+    if tail:
+        yield tail
+
+
+@lru_cache(maxsize=4096)
+def message_markdown(role, content):
+    """Markdown for one chat bubble: speaker and verse-linked text. Render it without unsafe HTML."""
+    return f"**{SPEAKERS[role]}:** {link_bible_verses(content)}"
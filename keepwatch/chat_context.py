@@ -0,0 +1,133 @@
+"""
+Token-budgeted context for Faith Companion requests.
+
+Sending the whole conversation every turn makes long chats slower and
+costlier each turn and eventually overflows the model's context. A
+``ChatContext`` sends the system prompt, a rolling summary of older turns and
+as many recent turns as fit in ``budget`` tokens. Turns that fall out of the
+window are folded into the summary by a small model on a background thread
+after the reply has been shown, so summarizing never delays an answer.
+
+Token counts are a local estimate rather than the model's tokenizer: words
+are split into pieces of up to four characters and punctuation counts as one
+token, which is close enough to budget with and needs no download.
+"""
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from keepwatch import metrics
+from keepwatch.llm_accounting import LEDGER
+from keepwatch.llm_dispatch import DISPATCHER
+
+CONTEXT_BUDGET = int(os.environ.get("KEEPWATCH_CHAT_CONTEXT_TOKENS", "6000"))
+SUMMARY_MODEL = "llama-3.1-8b-instant"
+SUMMARY_MAX_TOKENS = 300
+MESSAGE_OVERHEAD = 4   # role and separator tokens per message
+MIN_TURNS_TO_SUMMARIZE = 2
+
+_TOKEN_PIECE = re.compile(r"\w{1,4}|[^\w\s]")
+_summarizer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-summary")
+
+SUMMARY_PROMPT = (
+    "Summarize the earlier part of a conversation between a user and Watcher, a Bible study assistant, "
+    "in under 150 words. Keep the user's name and situation if given, the questions asked, the Bible "
+    "references discussed and anything Watcher promised to follow up on. Write plain prose."
+)
+
+
+@lru_cache(maxsize=4096)
+def estimate_tokens(text):
+    return len(_TOKEN_PIECE.findall(text))
+
+
+def message_tokens(message):
+    return estimate_tokens(message["content"]) + MESSAGE_OVERHEAD
+
+
+def _summarize(client, summary, turns, session=None):
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in turns)
+    if summary:
+        transcript = f"Summary so far: {summary}\n\nLater turns:\n{transcript}"
+    messages = [{"role": "system", "content": SUMMARY_PROMPT}, {"role": "user", "content": transcript}]
+    cost = sum(map(message_tokens, messages))
+    # Summaries queue as their own "session", so they take turns with users rather than
+    # jumping ahead; the ledger bills them to the conversation they summarize
+    call = LEDGER.track(
+        lambda: client.chat.completions.create(messages=messages, model=SUMMARY_MODEL, max_tokens=SUMMARY_MAX_TOKENS),
+        session, "summary", SUMMARY_MODEL, prompt_tokens=cost, estimate=estimate_tokens,
+    )
+    completion = DISPATCHER.call("background:summaries", call, cost=cost)
+    return completion.choices[0].message.content.strip()
+
+
+class ChatContext:
+    """
+    Per-conversation window state; keep one in the session next to the messages.
+
+        context = ChatContext()
+        sent = context.window(messages)        # what to send this turn
+        ... stream the reply, append it ...
+        context.compact(client, messages)      # background summary of dropped turns
+    """
+
+    def __init__(self, budget=CONTEXT_BUDGET):
+        self.budget = budget
+        self.summary = ""
+        self.summarized = 1        # messages[1:summarized] are covered by the summary
+        self.last_start = 1        # first turn sent in the latest window
+        self.last_sent_tokens = 0
+        self.last_saved_tokens = 0
+        self._pending = None
+        self._lock = threading.Lock()
+
+    def _summary_message(self):
+        return {"role": "system", "content": f"Summary of the earlier conversation: {self.summary}"}
+
+    def window(self, messages):
+        """The messages to send: system prompt, summary, then the newest turns within budget."""
+        system = messages[:1]
+        with self._lock:
+            head = system + ([self._summary_message()] if self.summary else [])
+            summarized = self.summarized
+        remaining = self.budget - sum(map(message_tokens, head))
+
+        start = len(messages) - 1  # the latest message is always sent
+        remaining -= message_tokens(messages[start])
+        while start - 1 >= max(summarized, 1) and message_tokens(messages[start - 1]) <= remaining:
+            start -= 1
+            remaining -= message_tokens(messages[start])
+        sent = head + messages[start:]
+
+        total = sum(map(message_tokens, messages))
+        self.last_start = start
+        self.last_sent_tokens = sum(map(message_tokens, sent))
+        self.last_saved_tokens = max(total - self.last_sent_tokens, 0)
+        metrics.observe("chat.context_tokens", self.last_sent_tokens)
+        metrics.observe("chat.tokens_saved", self.last_saved_tokens)
+        if start > 1:
+            metrics.incr("chat.windowed_requests")
+        return sent
+
+    def compact(self, client, messages, session=None):
+        """Fold turns that fell out of the last window into the summary, off the request path."""
+        with self._lock:
+            if self._pending is not None or self.last_start - self.summarized < MIN_TURNS_TO_SUMMARIZE:
+                return None
+            end = self.last_start
+            turns = [dict(m) for m in messages[self.summarized:end]]
+            future = self._pending = _summarizer.submit(_summarize, client, self.summary, turns, session)
+        future.add_done_callback(lambda done: self._finish(done, end))
+        return future
+
+    def _finish(self, future, end):
+        with self._lock:
+            self._pending = None
+            if future.exception() is not None:
+                metrics.incr("chat.summary_errors")
+                return  # the turns stay unsummarized and are retried next turn
+            self.summary = future.result()
+            self.summarized = end
+        metrics.incr("chat.summaries")
@@ -0,0 +1,235 @@
+"""
+Related verses: a cross-reference graph over verse IDs in CSR form.
+
+Edges are read from a TSV in the OpenBible.info cross-reference format
+(``From Verse<TAB>To Verse<TAB>Votes`` with OSIS references such as
+``Gen.1.1`` or ``Prov.8.22-Prov.8.30``) and stored as NumPy arrays:
+
+    verses.npy       sorted source verse IDs                  (n,)
+    indptr.npy       edge offsets per source verse            (n + 1,)
+    targets.npy      first verse ID of each target            (edges,)
+    target_ends.npy  last verse ID of each target (ranges)    (edges,)
+    votes.npy        edge weight, rows sorted by it desc.     (edges,)
+
+The arrays are memory-mapped, so a lookup is a ``searchsorted`` plus a slice
+and nothing is parsed into Python objects. Because rows are sorted by verse,
+a whole chapter or verse range is also one contiguous slice of edges.
+
+``keepwatch/data/crossrefs.tsv`` is a small curated seed (its weights are an
+editorial ranking, not OpenBible votes) that is compiled on first use. For
+the full ~340k-edge dataset, download ``cross_references.zip`` from
+https://www.openbible.info/labs/cross-references/ (CC-BY) and run:
+
+    python -m keepwatch.crossrefs cross_references.txt --min-votes 5
+"""
+import argparse
+import os
+import shutil
+import threading
+
+import numpy as np
+
+from keepwatch import STATE_DIR, metrics
+from keepwatch.references import BOOKS, format_id, parse_reference, split_id, valid_ids, verse_id
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SEED_PATH = os.path.join(DATA_DIR, "crossrefs.tsv")
+CROSSREF_DIR = os.environ.get("KEEPWATCH_CROSSREF_DIR", os.path.join(STATE_DIR, "crossrefs"))
+ARRAYS = ("verses", "indptr", "targets", "target_ends", "votes")
+
+# OSIS book codes in canonical order (book number = position + 1)
+OSIS_CODES = (
+    "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam", "1Kgs", "2Kgs",
+    "1Chr", "2Chr", "Ezra", "Neh", "Esth", "Job", "Ps", "Prov", "Eccl", "Song", "Isa", "Jer",
+    "Lam", "Ezek", "Dan", "Hos", "Joel", "Amos", "Obad", "Jonah", "Mic", "Nah", "Hab", "Zeph",
+    "Hag", "Zech", "Mal", "Matt", "Mark", "Luke", "John", "Acts", "Rom", "1Cor", "2Cor", "Gal",
+    "Eph", "Phil", "Col", "1Thess", "2Thess", "1Tim", "2Tim", "Titus", "Phlm", "Heb", "Jas",
+    "1Pet", "2Pet", "1John", "2John", "3John", "Jude", "Rev",
+)
+assert len(OSIS_CODES) == len(BOOKS)
+_BOOK_BY_OSIS = {code: number for number, code in enumerate(OSIS_CODES, 1)}
+
+
+def osis_id(ref):
+    """Verse ID for ``Book.Chapter.Verse``, or 0 if it is not one."""
+    try:
+        book, chapter, verse = ref.split(".")
+        return verse_id(_BOOK_BY_OSIS.get(book, 0), int(chapter), int(verse))
+    except ValueError:
+        return 0
+
+
+def read_edges(path, min_votes=0):
+    """``(sources, targets, target_ends, votes)`` arrays from an OpenBible-format TSV."""
+    sources, targets, target_ends, votes = [], [], [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith(("#", "From Verse")):
+                continue
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) < 3:
+                continue
+            first, _, last = cols[1].partition("-")
+            sources.append(osis_id(cols[0]))
+            targets.append(osis_id(first))
+            target_ends.append(osis_id(last) if last else targets[-1])
+            votes.append(int(cols[2] or 0))
+
+    sources, targets, target_ends, votes = (
+        np.array(column, dtype=np.int32) for column in (sources, targets, target_ends, votes)
+    )
+    keep = (valid_ids(sources) & valid_ids(targets) & valid_ids(target_ends)
+            & (target_ends >= targets) & (votes >= min_votes))
+    return sources[keep], targets[keep], target_ends[keep], votes[keep]
+
+
+def build(source=SEED_PATH, out_dir=CROSSREF_DIR, min_votes=0):
+    """Compile a TSV into CSR arrays in ``out_dir``; returns ``(verses, edges)``."""
+    sources, targets, target_ends, votes = read_edges(source, min_votes)
+    # Rows by source verse, strongest edges first within a row
+    order = np.lexsort((targets, -votes.astype(np.int64), sources))
+    sources, targets, target_ends, votes = sources[order], targets[order], target_ends[order], votes[order]
+    verses, counts = np.unique(sources, return_counts=True)
+    indptr = np.zeros(len(verses) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+
+    # Write next to the destination and swap it in, so readers never see half a graph
+    tmp_dir = f"{out_dir}.tmp-{os.getpid()}"
+    os.makedirs(tmp_dir, exist_ok=True)
+    for name, array in zip(ARRAYS, (verses, indptr, targets, target_ends, votes)):
+        np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    os.replace(tmp_dir, out_dir)
+    return len(verses), len(targets)
+
+
+class CrossReferences:
+    """Read side of the compiled graph; every array is memory-mapped."""
+
+    def __init__(self, directory=CROSSREF_DIR):
+        self.directory = directory
+        # Plain ndarray views of the maps: same pages, without np.memmap's per-slice overhead
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r").view(np.ndarray)
+            for name in ARRAYS
+        }
+        self.verses = arrays["verses"]
+        self.indptr = arrays["indptr"]
+        self.targets = arrays["targets"]
+        self.target_ends = arrays["target_ends"]
+        self.votes = arrays["votes"]
+
+    def __len__(self):
+        return len(self.targets)
+
+    def _row(self, vid):
+        row = int(np.searchsorted(self.verses, vid))
+        return row if row < len(self.verses) and self.verses[row] == vid else -1
+
+    def _edges(self, lo, hi):
+        return slice(int(self.indptr[lo]), int(self.indptr[hi]))
+
+    def neighbors(self, vid, limit=None):
+        """``[(start_id, end_id, votes)]`` cross-references of one verse, strongest first."""
+        row = self._row(vid)
+        if row < 0:
+            return []
+        edges = self._edges(row, row + 1)
+        if limit is not None:
+            edges = slice(edges.start, min(edges.stop, edges.start + limit))
+        return list(zip(self.targets[edges].tolist(), self.target_ends[edges].tolist(), self.votes[edges].tolist()))
+
+    def _rank(self, targets, target_ends, votes, limit, intervals=(), ids=()):
+        """Sum weights per target, drop targets inside ``intervals`` or in ``ids``, keep the top ``limit``."""
+        if not len(targets):
+            return []
+        order = np.argsort(targets, kind="stable")
+        targets, target_ends, votes = targets[order], target_ends[order], votes[order]
+        first = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]])
+        keys = targets[first]
+        totals = np.add.reduceat(votes.astype(np.int64), first)
+        ends = np.maximum.reduceat(target_ends, first)
+        keep = ~np.isin(keys, ids)
+        for start, end in intervals:
+            keep &= (keys < start) | (keys > end)
+        ranked = np.flatnonzero(keep)[np.argsort(-totals[keep], kind="stable")][:limit]
+        return [(int(keys[i]), int(ends[i]), int(totals[i])) for i in ranked]
+
+    def related(self, reference, limit=10):
+        """
+        Verses related to every verse of ``reference`` ("John 3", "Ps 23:1-3"),
+        weights summed per target; targets inside the reference itself are left out.
+        """
+        intervals = parse_reference(reference)
+        slices = []
+        for start, end in intervals:
+            lo = int(np.searchsorted(self.verses, start, side="left"))
+            hi = int(np.searchsorted(self.verses, end, side="right"))
+            if hi > lo:
+                slices.append(self._edges(lo, hi))
+        if not slices:
+            return []
+        pick = np.r_[tuple(slices)]
+        return self._rank(self.targets[pick], self.target_ends[pick], self.votes[pick], limit, intervals=intervals)
+
+    def two_hop(self, vid, limit=10):
+        """Verses reached through one intermediate reference and not directly, by summed weight."""
+        row = self._row(vid)
+        if row < 0:
+            return []
+        first = self._edges(row, row + 1)
+        hops = np.asarray(self.targets[first])
+        rows = np.searchsorted(self.verses, hops)
+        found = rows < len(self.verses)
+        found[found] = self.verses[rows[found]] == hops[found]
+        rows = rows[found]
+        starts, stops = self.indptr[rows], self.indptr[rows + 1]
+        lengths = stops - starts
+        # Concatenated edge indices of all second-hop rows, without a Python loop
+        pick = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self._rank(self.targets[pick], self.target_ends[pick], self.votes[pick], limit, ids=np.append(hops, vid))
+
+
+def format_target(start, end):
+    """ "John 3:16", "Prov 8:22-30" or "Matt 5:1-7:29" for a target interval."""
+    text = format_id(start)
+    if end == start:
+        return text
+    if end // 1000 == start // 1000:
+        return f"{text}-{end % 1000}"
+    if end // 1_000_000 == start // 1_000_000:
+        _, chapter, verse = split_id(end)
+        return f"{text}-{chapter}:{verse}"
+    return f"{text}-{format_id(end)}"
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def load(directory=CROSSREF_DIR):
+    """The process-wide graph, compiled from the bundled seed the first time if needed."""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                if not os.path.exists(os.path.join(directory, "indptr.npy")):
+                    build(SEED_PATH, directory)
+                    metrics.incr("crossrefs.seed_builds")
+                _graph = CrossReferences(directory)
+    return _graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", nargs="?", default=SEED_PATH, help="OpenBible-format TSV (default: bundled seed)")
+    parser.add_argument("--out", default=CROSSREF_DIR, help="directory for the .npy arrays")
+    parser.add_argument("--min-votes", type=int, default=0, help="drop edges with fewer votes")
+    args = parser.parse_args()
+    verses, edges = build(args.source, args.out, args.min_votes)
+    print(f"{edges:,} cross-references from {verses:,} verses -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Offline gazetteer.
+
+Resolves the free-form "City" / "Country" strings typed on the Prayer Watch
+Reminders page to coordinates and an IANA timezone using the bundled
+GeoNames-style dataset in ``keepwatch/data``. Nothing here touches the
+network; timezones missing from the dataset are resolved with
+``timezonefinder``.
+
+Regenerate the dataset from a full GeoNames dump with
+``python scripts/build_gazetteer.py``.
+"""
+import bisect
+import csv
+import difflib
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+from timezonefinder import TimezoneFinder
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+CITIES_PATH = os.environ.get("KEEPWATCH_CITIES_PATH", os.path.join(DATA_DIR, "cities.tsv"))
+COUNTRIES_PATH = os.environ.get("KEEPWATCH_COUNTRIES_PATH", os.path.join(DATA_DIR, "countries.tsv"))
+
+FUZZY_CUTOFF = 0.8
+FUZZY_SHORTLIST = 64  # keys sharing the most trigrams with the query that difflib then scores
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+class Location(NamedTuple):
+    name: str
+    country_code: str
+    admin1: str
+    latitude: float
+    longitude: float
+    timezone: str
+    population: int
+
+    @property
+    def label(self):
+        region = f", {self.admin1}" if self.admin1 and not self.admin1.isdigit() else ""
+        return f"{self.name}{region}, {self.country_code}"
+
+
+def normalize_name(text):
+    """Case-fold, strip accents and punctuation: 'Zürich ' -> 'zurich'."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text.casefold()).strip()
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@lru_cache(maxsize=1)
+def _timezone_finder():
+    return TimezoneFinder(in_memory=True)
+
+
+def timezone_at(latitude, longitude):
+    """IANA timezone for a coordinate, resolved offline."""
+    return _timezone_finder().timezone_at(lat=float(latitude), lng=float(longitude))
+
+
+class Gazetteer:
+    """
+    Compact in-memory city index.
+
+    Coordinates, populations and timezone ids are stored in NumPy columns;
+    names are kept once in a sorted key list (prefix search via bisect) and a
+    key -> rows dict (exact match). Rows for a key are ordered by population so
+    the most likely city comes first. Fuzzy matching first shortlists keys
+    through a trigram index (CSR arrays, built on the first fuzzy lookup) and
+    only runs difflib on that shortlist.
+    """
+
+    def __init__(self, cities_path=CITIES_PATH, countries_path=COUNTRIES_PATH):
+        self._countries = {}
+        self._load_countries(countries_path)
+
+        names, admin1, country_codes = [], [], []
+        lats, lons, pops, tz_ids = [], [], [], []
+        timezones, tz_lookup = [], {}
+        rows_by_key = {}
+
+        with open(cities_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                name, ascii_name, alternates, cc, a1, lat, lon, pop, tz = line.rstrip("\n").split("\t")
+                lat, lon = float(lat), float(lon)
+                tz = tz or timezone_at(lat, lon) or "UTC"
+                if tz not in tz_lookup:
+                    tz_lookup[tz] = len(timezones)
+                    timezones.append(tz)
+
+                row = len(names)
+                names.append(name)
+                admin1.append(a1)
+                country_codes.append(cc)
+                lats.append(lat)
+                lons.append(lon)
+                pops.append(int(pop or 0))
+                tz_ids.append(tz_lookup[tz])
+
+                for alias in {name, ascii_name, *alternates.split(",")}:
+                    key = normalize_name(alias)
+                    if key:
+                        rows_by_key.setdefault(key, []).append(row)
+
+        self._names = names
+        self._admin1 = admin1
+        self._country_codes = country_codes
+        self._lat = np.array(lats, dtype=np.float32)
+        self._lon = np.array(lons, dtype=np.float32)
+        self._population = np.array(pops, dtype=np.int32)
+        self._tz_ids = np.array(tz_ids, dtype=np.uint16)
+        self._timezones = timezones
+
+        self._rows = {
+            key: tuple(sorted(set(rows), key=lambda r: -self._population[r]))
+            for key, rows in rows_by_key.items()
+        }
+        self._keys = sorted(self._rows)
+        self._trigrams = None
+
+    def __len__(self):
+        return len(self._names)
+
+    def _load_countries(self, path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                iso2, iso3, name, *rest = line.rstrip("\n").split("\t")
+                aliases = rest[0].split(",") if rest else []
+                for alias in (iso2, iso3, name, *aliases):
+                    key = normalize_name(alias)
+                    if key:
+                        self._countries.setdefault(key, iso2)
+
+    def country_code(self, text):
+        """ISO 3166 alpha-2 code for a country name, alias or code, or None."""
+        return self._countries.get(normalize_name(text or ""))
+
+    def location(self, row):
+        return Location(
+            name=self._names[row],
+            country_code=self._country_codes[row],
+            admin1=self._admin1[row],
+            latitude=round(float(self._lat[row]), 5),
+            longitude=round(float(self._lon[row]), 5),
+            timezone=self._timezones[self._tz_ids[row]],
+            population=int(self._population[row]),
+        )
+
+    def _prefix_keys(self, key, limit):
+        start = bisect.bisect_left(self._keys, key)
+        matches = []
+        for candidate in self._keys[start:]:
+            if not candidate.startswith(key) or len(matches) >= limit:
+                break
+            matches.append(candidate)
+        return matches
+
+    def _trigram_index(self):
+        """``(gram -> id, indptr, key indices, key lengths)``: for each trigram, the keys containing it."""
+        if self._trigrams is None:
+            gram_ids, grams, keys = {}, [], []
+            for index, key in enumerate(self._keys):
+                for gram in _trigrams(key):
+                    grams.append(gram_ids.setdefault(gram, len(gram_ids)))
+                    keys.append(index)
+            grams = np.array(grams, dtype=np.int32)
+            order = np.argsort(grams, kind="stable")
+            indptr = np.zeros(len(gram_ids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(grams, minlength=len(gram_ids)), out=indptr[1:])
+            lengths = np.array([len(key) for key in self._keys], dtype=np.int32)
+            self._trigrams = gram_ids, indptr, np.array(keys, dtype=np.int32)[order], lengths
+        return self._trigrams
+
+    def _shortlist(self, key):
+        """
+        Keys that could reach ``FUZZY_CUTOFF``: a length difflib's ratio allows,
+        ranked by trigrams shared with ``key``; at most ``FUZZY_SHORTLIST``.
+        """
+        gram_ids, indptr, postings, lengths = self._trigram_index()
+        ids = {gram_ids[gram] for gram in _trigrams(key) if gram in gram_ids}
+        if not ids:
+            return []
+        candidates, shared = np.unique(
+            np.concatenate([postings[indptr[i]:indptr[i + 1]] for i in ids]), return_counts=True)
+        # ratio = 2 * matches / (len(a) + len(b)) <= 2 * min / (len(a) + len(b))
+        low, high = len(key) * FUZZY_CUTOFF / (2 - FUZZY_CUTOFF), len(key) * (2 - FUZZY_CUTOFF) / FUZZY_CUTOFF
+        keep = (lengths[candidates] >= low) & (lengths[candidates] <= high)
+        candidates, shared = candidates[keep], shared[keep]
+        if len(candidates) > FUZZY_SHORTLIST:
+            top = np.argpartition(-shared, FUZZY_SHORTLIST - 1)[:FUZZY_SHORTLIST]
+            candidates = candidates[top]
+        return [self._keys[i] for i in sorted(candidates)]
+
+    def _fuzzy_keys(self, key, limit):
+        shortlist = self._shortlist(key)
+        same_initial = [candidate for candidate in shortlist if candidate[0] == key[0]]
+        matches = difflib.get_close_matches(key, same_initial, n=limit, cutoff=FUZZY_CUTOFF)
+        if not matches:
+            matches = difflib.get_close_matches(key, shortlist, n=limit, cutoff=FUZZY_CUTOFF)
+        return matches
+
+    def _qualifier_score(self, row, qualifiers):
+        score = 0
+        for qualifier in qualifiers:
+            if qualifier == normalize_name(self._admin1[row]) or self.country_code(qualifier) == self._country_codes[row]:
+                score += 1
+        return score
+
+    def _rank(self, rows, country_code, qualifiers):
+        if country_code:
+            rows = [r for r in rows if self._country_codes[r] == country_code]
+        return sorted(rows, key=lambda r: (-self._qualifier_score(r, qualifiers), -self._population[r]))
+
+    def resolve(self, city, country=None):
+        """
+        Best match for user input such as ('Brooklyn, NY', 'USA').
+
+        Text after a comma in ``city`` is treated as a region or country
+        qualifier. Exact names win over fuzzy ones; ties go to the larger city.
+        Returns a ``Location`` or None.
+        """
+        parts = [p for p in (normalize_name(p) for p in (city or "").split(",")) if p]
+        if not parts:
+            return None
+        key, qualifiers = parts[0], parts[1:]
+        country_code = self.country_code(country) if country else None
+
+        rows = list(self._rows.get(key, ()))
+        if not self._rank(rows, country_code, qualifiers):
+            rows = [r for k in self._fuzzy_keys(key, 5) for r in self._rows[k]]
+        ranked = self._rank(rows, country_code, qualifiers)
+        return self.location(ranked[0]) if ranked else None
+
+    def search(self, query, country=None, limit=10):
+        """Autocomplete candidates: exact, then prefix, then fuzzy matches."""
+        key = normalize_name(query or "")
+        if not key:
+            return []
+        country_code = self.country_code(country) if country else None
+
+        exact = list(self._rows.get(key, ()))
+        prefix = [r for k in self._prefix_keys(key, limit * 4) if k != key for r in self._rows[k]]
+        groups = [exact, prefix]
+        if len(exact) + len(prefix) < limit:
+            groups.append([r for k in self._fuzzy_keys(key, limit) for r in self._rows[k]])
+
+        results, seen = [], set()
+        for rows in groups:
+            for row in self._rank(rows, country_code, ()):
+                if row not in seen:
+                    seen.add(row)
+                    results.append(self.location(row))
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer():
+    return Gazetteer()
+
+
+@lru_cache(maxsize=4096)
+def resolve_location(city, country=None):
+    """Cached ``Gazetteer.resolve`` on the shared index."""
+    return get_gazetteer().resolve(city, country)
+
+
+def load_locations(path, id_column="id"):
+    """
+    Read ``(id, Location)`` pairs from a CSV file.
+
+    Rows give either ``latitude``/``longitude``/``timezone`` or a free-form
+    ``city`` (and optional ``country``) resolved through the gazetteer.
+    Unresolvable rows are returned in a separate list of ids.
+    """
+    locations, unresolved = [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row_id = (row.get(id_column) or "").strip() or str(len(locations) + len(unresolved) + 1)
+            if row.get("latitude") and row.get("longitude"):
+                lat, lon = float(row["latitude"]), float(row["longitude"])
+                tz = (row.get("timezone") or "").strip() or timezone_at(lat, lon) or "UTC"
+                name = (row.get("city") or row_id).strip()
+                locations.append((row_id, Location(name, (row.get("country") or "").strip(), "", lat, lon, tz, 0)))
+                continue
+            location = resolve_location((row.get("city") or "").strip(), (row.get("country") or "").strip() or None)
+            if location:
+                locations.append((row_id, location))
+            else:
+                unresolved.append(row_id)
+    return locations, unresolved
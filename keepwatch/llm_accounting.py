@@ -0,0 +1,313 @@
+"""
+Per-call accounting for Groq requests: tokens, latency, cost, errors.
+
+``LEDGER.track`` wraps a call before it is handed to the LLM queue, so every
+attempt the dispatcher makes is recorded once it ends: the first try, each
+retry after a 429, a hedged duplicate and a call cancelled half way. A row
+holds the model actually called, session, prompt and completion tokens (from
+the API's usage field, or the local estimate when the call ended without
+one), time from submission to this attempt, time to first token and latency
+of the attempt, error class and estimated cost.
+
+Records go into an in-memory ring buffer for the admin page's "recent calls"
+view and are written to SQLite in batches by a background thread every
+``FLUSH_INTERVAL_S`` seconds, so the request path never waits on disk. The
+admin aggregates are SQL queries over that file.
+"""
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+from keepwatch import STATE_DIR, metrics
+
+ACCOUNTING_PATH = os.environ.get("KEEPWATCH_LLM_ACCOUNTING", os.path.join(STATE_DIR, "llm_calls.sqlite3"))
+RING_SIZE = 1000
+FLUSH_INTERVAL_S = 30
+RETENTION_DAYS = 90
+
+logger = logging.getLogger("keepwatch.llm_accounting")
+
+# USD per million (prompt, completion) tokens, from Groq's price list; update when it changes
+PRICES = {
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+}
+
+FIELDS = ("ts", "session", "kind", "model", "prompt_tokens", "completion_tokens", "usage_estimated",
+          "queue_ms", "ttft_ms", "latency_ms", "error", "hedged", "cost_usd")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+    ts REAL NOT NULL,
+    session TEXT,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    usage_estimated INTEGER NOT NULL DEFAULT 0,
+    queue_ms REAL,
+    ttft_ms REAL,
+    latency_ms REAL,
+    error TEXT,
+    hedged INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL
+);
+CREATE INDEX IF NOT EXISTS llm_calls_ts ON llm_calls (ts);
+CREATE INDEX IF NOT EXISTS llm_calls_model_ts ON llm_calls (model, ts);
+"""
+
+
+def cost_usd(model, prompt_tokens, completion_tokens):
+    """Estimated cost of one call, or None for a model without a known price."""
+    if model not in PRICES:
+        return None
+    prompt_price, completion_price = PRICES[model]
+    return ((prompt_tokens or 0) * prompt_price + (completion_tokens or 0) * completion_price) / 1e6
+
+
+def usage_of(response):
+    """``(prompt_tokens, completion_tokens)`` from a completion or final stream chunk, or None."""
+    usage = getattr(response, "usage", None) or getattr(getattr(response, "x_groq", None), "usage", None)
+    if usage is None or getattr(usage, "prompt_tokens", None) is None:
+        return None
+    return usage.prompt_tokens, usage.completion_tokens
+
+
+def _chunk_text(chunk):
+    choices = getattr(chunk, "choices", None)
+    return getattr(choices[0].delta, "content", None) if choices else None
+
+
+def _response_text(response):
+    choices = getattr(response, "choices", None)
+    return getattr(choices[0].message, "content", None) if choices else None
+
+
+class _Attempt:
+    """Timing and usage of one call attempt; ``finish`` records it exactly once."""
+
+    def __init__(self, ledger, call, submitted):
+        self.ledger = ledger
+        self.call = call
+        self.started = time.perf_counter()
+        self.queue_ms = (self.started - submitted) * 1000
+        self.first_token = None
+        self.usage = None
+        self.text = []
+        self._done = threading.Lock()
+
+    def finish(self, error=None):
+        if not self._done.acquire(blocking=False):
+            return
+        call, estimate = self.call, self.call["estimate"]
+        self.ledger.record(
+            call["session"], call["kind"], call["model"],
+            prompt_tokens=self.usage[0] if self.usage else call["prompt_tokens"],
+            completion_tokens=self.usage[1] if self.usage else (estimate("".join(self.text)) if estimate else None),
+            usage_estimated=self.usage is None,
+            queue_ms=self.queue_ms,
+            ttft_ms=(self.first_token - self.started) * 1000 if self.first_token else None,
+            latency_ms=(time.perf_counter() - self.started) * 1000,
+            error=error,
+            hedged=call["hedged"],
+        )
+
+
+class _TrackedStream:
+    """
+    Iterates a streamed response, recording the attempt when it ends. ``close``
+    may be called from another thread to abort the read; it closes the
+    underlying response, which wakes the reader.
+    """
+
+    def __init__(self, items, attempt):
+        self._items = items
+        self._iter = iter(items)
+        self._attempt = attempt
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            chunk = next(self._iter)
+        except StopIteration:
+            self._attempt.finish()
+            raise
+        except Exception as e:
+            self._attempt.finish(type(e).__name__)
+            raise
+        attempt = self._attempt
+        attempt.usage = usage_of(chunk) or attempt.usage  # Groq sends usage on the final chunk
+        text = _chunk_text(chunk)
+        if text:
+            attempt.first_token = attempt.first_token or time.perf_counter()
+            attempt.text.append(text)
+        return chunk
+
+    def close(self):
+        self._attempt.finish("Cancelled")  # no-op if the stream already ended
+        close = getattr(self._items, "close", None)
+        if close:
+            close()
+
+
+class CallLedger:
+    """Ring buffer of recent calls plus a batched SQLite log of all of them."""
+
+    def __init__(self, path=ACCOUNTING_PATH, ring_size=RING_SIZE, flush_interval=FLUSH_INTERVAL_S):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._recent = deque(maxlen=ring_size)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._flusher = None
+
+    def track(self, fn, session, kind, model, prompt_tokens=None, stream=False, hedged=False, estimate=None):
+        """
+        Wrap ``fn`` (one Groq call, as handed to the dispatcher) so that every
+        attempt at it is recorded. ``prompt_tokens`` and ``estimate(text)``
+        stand in for the usage field when a call ends without one.
+        """
+        call = {"session": session, "kind": kind, "model": model, "prompt_tokens": prompt_tokens,
+                "hedged": hedged, "estimate": estimate}
+        submitted = time.perf_counter()
+
+        def attempt():
+            current = _Attempt(self, call, submitted)
+            try:
+                response = fn()
+            except Exception as e:
+                current.finish(type(e).__name__)  # e.g. a 429 the dispatcher will retry
+                raise
+            if stream:
+                return _TrackedStream(response, current)
+            current.usage = usage_of(response)
+            text = _response_text(response)
+            current.text.append(text or "")
+            current.first_token = time.perf_counter() if text else None
+            current.finish()
+            return response
+
+        return attempt
+
+    def record(self, session, kind, model, prompt_tokens=None, completion_tokens=None, usage_estimated=False,
+               queue_ms=None, ttft_ms=None, latency_ms=None, error=None, hedged=False):
+        row = {
+            "ts": time.time(), "session": session, "kind": kind, "model": model,
+            "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+            "usage_estimated": int(usage_estimated), "queue_ms": queue_ms, "ttft_ms": ttft_ms,
+            "latency_ms": latency_ms, "error": error, "hedged": int(hedged),
+            "cost_usd": cost_usd(model, prompt_tokens, completion_tokens),
+        }
+        with self._lock:
+            self._recent.append(row)
+            self._pending.append(row)
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_forever, name="llm-accounting", daemon=True)
+                self._flusher.start()
+        return row
+
+    def recent(self, limit=50):
+        """The newest ``limit`` calls, newest first."""
+        with self._lock:
+            rows = list(self._recent)[-limit:]
+        return rows[::-1]
+
+    def _connect(self):
+        if self._db is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def flush(self):
+        """Write pending records to SQLite; returns how many were written."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return 0
+        try:
+            with self._db_lock:
+                db = self._connect()
+                with db:
+                    db.execute("BEGIN")
+                    db.executemany(
+                        f"INSERT INTO llm_calls ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})",
+                        [tuple(row[field] for field in FIELDS) for row in rows],
+                    )
+                    db.execute("DELETE FROM llm_calls WHERE ts < ?", (time.time() - RETENTION_DAYS * 86400,))
+        except (sqlite3.Error, OSError) as e:
+            with self._lock:
+                # Retried on the next flush; beyond the ring size the oldest rows are dropped
+                kept = (rows + self._pending)[-self._recent.maxlen:]
+                dropped = len(rows) + len(self._pending) - len(kept)
+                self._pending = kept
+            metrics.incr("llm.accounting.flush_errors")
+            if dropped:
+                metrics.incr("llm.accounting.dropped_rows", dropped)
+            logger.warning("Could not write %d LLM call records to %s (%d dropped): %s", len(rows), self.path, dropped, e)
+            return 0
+        return len(rows)
+
+    def _flush_forever(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def _query(self, sql, params):
+        self.flush()
+        with self._db_lock:
+            cursor = self._connect().execute(sql, params)
+            return [column[0] for column in cursor.description], cursor.fetchall()
+
+    def _percentile(self, column, model, since, q):
+        """Nearest-rank percentile of ``column`` for one model, computed in SQLite."""
+        _, ((count,),) = self._query(
+            f"SELECT COUNT({column}) FROM llm_calls WHERE model = ? AND ts >= ?", (model, since))
+        if not count:
+            return None
+        _, ((value,),) = self._query(
+            f"SELECT {column} FROM llm_calls WHERE model = ? AND ts >= ? AND {column} IS NOT NULL "
+            f"ORDER BY {column} LIMIT 1 OFFSET ?", (model, since, min(int(count * q / 100), count - 1)))
+        return round(value)
+
+    def by_model(self, since=None):
+        """Calls, errors, tokens, cost and latency percentiles per model."""
+        since = since or 0
+        columns, rows = self._query(
+            "SELECT model, COUNT(*) AS calls, COUNT(error) AS errors, SUM(hedged) AS hedges, "
+            "COALESCE(SUM(prompt_tokens), 0) AS prompt_tokens, COALESCE(SUM(completion_tokens), 0) AS completion_tokens, "
+            "ROUND(COALESCE(SUM(cost_usd), 0), 4) AS cost_usd "
+            "FROM llm_calls WHERE ts >= ? GROUP BY model ORDER BY model", (since,))
+        table = pd.DataFrame(rows, columns=columns).set_index("model")
+        for column in ("ttft_ms", "latency_ms"):
+            for q in (50, 95):
+                table[f"{column[:-3]}_p{q}_ms"] = [self._percentile(column, model, since, q) for model in table.index]
+        return table
+
+    def by_session(self, since=None, limit=20):
+        """The ``limit`` most expensive sessions."""
+        columns, rows = self._query(
+            "SELECT session, COUNT(*) AS calls, COUNT(error) AS errors, "
+            "COALESCE(SUM(prompt_tokens), 0) + COALESCE(SUM(completion_tokens), 0) AS tokens, "
+            "ROUND(COALESCE(SUM(cost_usd), 0), 4) AS cost_usd, MAX(ts) AS last_call "
+            "FROM llm_calls WHERE ts >= ? GROUP BY session ORDER BY SUM(cost_usd) DESC LIMIT ?",
+            (since or 0, limit))
+        table = pd.DataFrame(rows, columns=columns).set_index("session")
+        table["last_call"] = pd.to_datetime(table["last_call"], unit="s")
+        return table
+
+
+LEDGER = CallLedger()
+atexit.register(LEDGER.flush)
@@ -0,0 +1,328 @@
+"""
+Process-wide queue for Groq calls.
+
+Every Streamlit session runs in its own script thread, so without
+coordination a busy evening sends every request at once and the provider
+answers 429. All LLM calls go through one ``LLMDispatcher`` instead:
+
+* sessions are served round-robin, so one user's follow-ups cannot starve
+  everyone else's first question;
+* at most ``max_concurrency`` calls run at a time, and token buckets keep
+  starts under the requests- (and optionally tokens-) per-minute limits;
+* a 429 before any output is retried with exponential backoff and full
+  jitter (or the provider's ``Retry-After``), and pauses new starts for the
+  same time so the retry isn't racing fresh requests;
+* callers can ask for their place in line while they wait.
+
+The scheduler is an asyncio loop on a daemon thread; the blocking Groq calls
+run on worker threads and hand results back through a queue, so callers stay
+plain synchronous code.
+"""
+import asyncio
+import itertools
+import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+
+from keepwatch import metrics
+
+MAX_CONCURRENCY = int(os.environ.get("KEEPWATCH_LLM_CONCURRENCY", "4"))
+REQUESTS_PER_MINUTE = float(os.environ.get("KEEPWATCH_LLM_RPM", "30"))
+TOKENS_PER_MINUTE = float(os.environ.get("KEEPWATCH_LLM_TPM", "0"))  # 0 = no token limit
+MAX_RETRIES = 4
+BASE_BACKOFF_S = 1.0
+MAX_BACKOFF_S = 30.0
+
+_DONE = object()
+
+
+class RateLimited(Exception):
+    """The provider still answered 429 after every retry."""
+
+
+def is_rate_limit(error):
+    return getattr(error, "status_code", None) == 429
+
+
+def retry_after(error):
+    """Seconds from a ``Retry-After`` header on the error's response, if any."""
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Refills at ``per_minute / 60`` per second up to ``capacity``; used only by the scheduler coroutine."""
+
+    def __init__(self, per_minute, capacity=None):
+        self.rate = per_minute / 60
+        self.capacity = capacity or max(per_minute / 2, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def take(self, cost=1):
+        cost = min(cost, self.capacity)  # an oversized request waits for a full bucket, not forever
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return
+            await asyncio.sleep((cost - self.tokens) / self.rate)
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+class Job:
+    """One queued call. Results arrive through ``stream()`` (or ``result()``) on the caller's thread."""
+
+    def __init__(self, dispatcher, session, fn, cost, streaming):
+        self.dispatcher = dispatcher
+        self.session = session
+        self.fn = fn
+        self.cost = cost
+        self.streaming = streaming
+        self.submitted = time.monotonic()
+        self.started = threading.Event()
+        self.cancelled = False
+        self.finished = False
+        self.delivered = 0
+        self._items = queue.Queue()
+        self._source = None  # the streamed response being read, once the call has started
+
+    def position(self):
+        """1-based place in line, or 0 once the call has started."""
+        return self.dispatcher.position(self)
+
+    def get(self, timeout=None):
+        """
+        The next result. Raises ``StopIteration`` once the call is done, the
+        call's error if it failed, and ``queue.Empty`` after ``timeout`` seconds.
+        """
+        item = self._items.get(timeout=timeout)
+        if item is _DONE:
+            self.finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self.finished = True
+            raise item.error
+        return item
+
+    def stream(self):
+        """Yield results as they arrive; re-raises the call's error here."""
+        try:
+            while True:
+                try:
+                    item = self.get()
+                except StopIteration:
+                    return
+                yield item
+        finally:
+            if not self.finished:
+                self.cancel()  # the reader went away (e.g. a Streamlit rerun)
+
+    def result(self):
+        for item in self.stream():
+            return item
+
+    def cancel(self):
+        """
+        Drop the call from the queue, or abort it if it is already streaming:
+        closing the response wakes the worker blocked on the next chunk, so
+        the slot is released now rather than when that chunk arrives.
+        """
+        self.cancelled = True
+        self.dispatcher._remove(self)
+        close = getattr(self._source, "close", None)
+        if close:
+            try:
+                close()
+            except ValueError:
+                pass  # a generator can't be closed while it runs; the worker stops at its next item
+
+    def _put(self, item):
+        self.delivered += 1
+        self._items.put(item)
+
+
+class LLMDispatcher:
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, requests_per_minute=REQUESTS_PER_MINUTE,
+                 tokens_per_minute=TOKENS_PER_MINUTE, max_retries=MAX_RETRIES):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.running = 0
+        self._queues = OrderedDict()  # session -> deque of jobs; first key is served next
+        self._next = None             # popped, waiting for a free slot or the rate limiter
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._loop = None
+        self._wakeup = None
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._wakeup = asyncio.Event()
+            ready = threading.Event()
+            threading.Thread(target=self._run_loop, args=(ready,), name="llm-dispatcher", daemon=True).start()
+        ready.wait()
+
+    def _run_loop(self, ready):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(ready.set)
+        self._loop.run_until_complete(self._schedule())
+
+    def submit(self, session, fn, cost=1, stream=False):
+        """
+        Queue ``fn`` (a blocking call) for ``session``. With ``stream=True``,
+        ``fn`` returns an iterable whose items are passed on one by one.
+        """
+        self._ensure_loop()
+        job = Job(self, session, fn, cost, stream)
+        with self._lock:
+            self._queues.setdefault(session, deque()).append(job)
+            depth = self._depth()
+        metrics.incr("llm.submitted")
+        metrics.set_gauge("llm.queue_depth", depth)
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        return job
+
+    def call(self, session, fn, cost=1):
+        """Blocking helper: queue ``fn`` and return its result."""
+        return self.submit(session, fn, cost).result()
+
+    def has_capacity(self):
+        """True when a new call would start right away: a free slot and nobody waiting."""
+        with self._lock:
+            return self.running < self.max_concurrency and not self._depth()
+
+    def _depth(self):
+        return sum(map(len, self._queues.values())) + (self._next is not None)
+
+    def _line(self):
+        """Waiting jobs in the order they will start: round-robin over sessions."""
+        rounds = itertools.zip_longest(*self._queues.values())
+        waiting = [job for round_ in rounds for job in round_ if job is not None]
+        return ([self._next] if self._next is not None else []) + waiting
+
+    def position(self, job):
+        with self._lock:
+            if job.started.is_set():
+                return 0
+            line = self._line()
+        return line.index(job) + 1 if job in line else 0
+
+    def _remove(self, job):
+        with self._lock:
+            jobs = self._queues.get(job.session)
+            if jobs and job in jobs:
+                jobs.remove(job)
+                if not jobs:
+                    del self._queues[job.session]
+
+    def _pop(self):
+        with self._lock:
+            if not self._queues:
+                return None
+            session, jobs = self._queues.popitem(last=False)
+            job = jobs.popleft()
+            if jobs:
+                self._queues[session] = jobs  # back of the round
+            self._next = job
+            return job
+
+    async def _schedule(self):
+        slots = asyncio.Semaphore(self.max_concurrency)
+        requests = TokenBucket(self.requests_per_minute) if self.requests_per_minute else None
+        tokens = TokenBucket(self.tokens_per_minute) if self.tokens_per_minute else None
+        while True:
+            self._wakeup.clear()
+            job = self._pop()
+            if job is None:
+                await self._wakeup.wait()
+                continue
+            await slots.acquire()
+            while (pause := self._paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            if requests:
+                await requests.take(1)
+            if tokens:
+                await tokens.take(job.cost)
+            with self._lock:
+                self._next = None
+                depth = self._depth()
+            metrics.set_gauge("llm.queue_depth", depth)
+            if job.cancelled:
+                slots.release()
+                continue
+            asyncio.ensure_future(self._run(job, slots))
+
+    async def _run(self, job, slots):
+        self.running += 1
+        metrics.set_gauge("llm.running", self.running)
+        metrics.observe("llm.queue_wait_ms", (time.monotonic() - job.submitted) * 1000)
+        job.started.set()
+        try:
+            for attempt in itertools.count():
+                try:
+                    await asyncio.to_thread(self._pump, job)
+                    job._items.put(_DONE)
+                    return
+                except Exception as e:
+                    if not is_rate_limit(e) or job.delivered:
+                        metrics.incr("llm.errors")
+                        job._items.put(_Failure(e))
+                        return
+                    metrics.incr("llm.rate_limited")
+                    if attempt >= self.max_retries or job.cancelled:
+                        job._items.put(_Failure(RateLimited(str(e))))
+                        return
+                    backoff = min(MAX_BACKOFF_S, BASE_BACKOFF_S * 2 ** attempt)
+                    delay = (retry_after(e) or 0) + random.uniform(0, backoff)
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                    metrics.incr("llm.retries")
+                    await asyncio.sleep(delay)
+        finally:
+            self.running -= 1
+            metrics.set_gauge("llm.running", self.running)
+            slots.release()
+
+    @staticmethod
+    def _pump(job):
+        if not job.streaming:
+            job._put(job.fn())
+            return
+        items = job._source = job.fn()
+        try:
+            if job.cancelled:
+                return  # cancelled while the request was being sent
+            for item in items:
+                if job.cancelled:
+                    break
+                job._put(item)
+        except Exception:
+            if not job.cancelled:
+                raise
+            # reading a response closed by Job.cancel fails; that is the cancellation, not an error
+        finally:
+            if job.cancelled:
+                metrics.incr("llm.cancelled")
+            close = getattr(items, "close", None)
+            if close:
+                close()
+
+
+DISPATCHER = LLMDispatcher()
@@ -0,0 +1,75 @@
+"""
+Process-wide metrics registry.
+
+Streamlit runs every session in the same Python process, so module-level
+state here is shared by all users. Counters only ever go up, gauges hold the
+latest value, and summaries keep a rolling window of observations for
+percentiles. The admin page renders ``snapshot()``.
+"""
+import threading
+from collections import defaultdict, deque
+
+import numpy as np
+
+SUMMARY_WINDOW = 1024
+
+_lock = threading.Lock()
+_counters = defaultdict(float)
+_gauges = {}
+_summaries = defaultdict(lambda: deque(maxlen=SUMMARY_WINDOW))
+
+
+def incr(name, value=1):
+    with _lock:
+        _counters[name] += value
+
+
+def set_gauge(name, value):
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(name, value):
+    with _lock:
+        _summaries[name].append(value)
+
+
+def counter(name):
+    with _lock:
+        return _counters.get(name, 0)
+
+
+def percentiles(name, qs=(50, 95)):
+    """Rolling percentiles for a summary, or None before the first observation."""
+    with _lock:
+        values = list(_summaries.get(name, ()))
+    if not values:
+        return None
+    return dict(zip(qs, np.percentile(values, qs).tolist()))
+
+
+def snapshot():
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+        summaries = {name: list(values) for name, values in _summaries.items() if values}
+    return {
+        "counters": counters,
+        "gauges": gauges,
+        "summaries": {
+            name: {
+                "count": len(values),
+                "p50": float(np.percentile(values, 50)),
+                "p95": float(np.percentile(values, 95)),
+                "max": float(max(values)),
+            }
+            for name, values in summaries.items()
+        },
+    }
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _summaries.clear()
@@ -0,0 +1,117 @@
+"""
+Pick the chat model per message.
+
+"Thanks!" and "What does John 3:16 say?" don't need a 70B model; "Why did
+Jesus tell the disciples to watch and pray, and how does it relate to the
+night watches?" does. ``route`` scores the prompt with a few cheap
+heuristics (length, words that ask for reasoning, personal or painful
+situations, how many references are involved, how long the conversation is) and sends low
+scores to ``FAST_MODEL`` and high scores to ``LARGE_MODEL``.
+
+The cut-off moves with observed latency: when the large model's rolling p95
+call time (``chat.call_ms.<model>``, from the dispatcher starting the call, so
+queue wait that either model would sit through doesn't count) is over
+``LATENCY_BUDGET_MS``, more middling prompts go to the fast model, as long as
+the fast model is actually faster. ``KEEPWATCH_CHAT_MODEL`` (or a per-session override) pins a model.
+
+Every decision is counted (``chat.route.<model>``, ``chat.route.reason.<reason>``)
+and fast routes add the large-vs-fast p50 difference to
+``chat.route.latency_saved_ms``.
+"""
+import os
+import re
+from collections import namedtuple
+
+from keepwatch import metrics
+from keepwatch.chat import CHAT_MODEL
+from keepwatch.verses import BIBLE_VERSE_PATTERN
+
+FAST_MODEL = "llama-3.1-8b-instant"
+LARGE_MODEL = CHAT_MODEL
+MODEL_OVERRIDE = os.environ.get("KEEPWATCH_CHAT_MODEL", "auto")
+
+COMPLEXITY_THRESHOLD = 0.3
+BUSY_THRESHOLD = 0.5          # used while the large model is over its latency budget
+LATENCY_BUDGET_MS = 8000
+LONG_PROMPT_WORDS = 30
+MIN_LATENCY_SAMPLES = 20
+
+_SMALL_TALK = re.compile(
+    r"^(thanks?( you)?|thank you so much|thx|ok(ay)?|amen|hi|hello|hey|good (morning|evening|night)|"
+    r"bye|goodbye|great|cool|got it|yes|no|god bless( you)?)[\s!.,🙏]*$",
+    re.IGNORECASE,
+)
+_REASONING = re.compile(
+    r"\b(why|how|explain|compare|difference|differences|meaning|mean|interpret|interpretation|relate|"
+    r"relationship|context|history|historical|theolog\w*|doctrine|contradict\w*|reconcile|analy[sz]e|"
+    r"summari[sz]e|plan|study|sermon|devotional|greek|hebrew)\b",
+    re.IGNORECASE,
+)
+
+# Personal or painful situations deserve the careful model even when short
+_PASTORAL = re.compile(
+    r"\b(struggl\w*|anxi\w*|afraid|fear\w*|depress\w*|grie\w*|griev\w*|sick|ill|cancer|died|death|dying|"
+    r"divorce\w*|lonely|suicid\w*|addict\w*|abuse\w*|doubt\w*|guilt\w*|forgive\w*|marriage|hurt\w*)\b",
+    re.IGNORECASE,
+)
+
+Route = namedtuple("Route", "model reason score")
+
+# Labels for a per-session override; "Auto" defers to ``route`` (and ``KEEPWATCH_CHAT_MODEL``)
+MODEL_CHOICES = {"Auto": None, "Fast": FAST_MODEL, "Thorough": LARGE_MODEL}
+
+
+def complexity(prompt, history_turns=0):
+    """0.0 (small talk) .. 1.0 (long, multi-part, reasoning-heavy)."""
+    text = prompt.strip()
+    if _SMALL_TALK.match(text):
+        return 0.0
+    words = len(text.split())
+    score = min(words / LONG_PROMPT_WORDS, 1.0) * 0.4
+    score += min(len(_REASONING.findall(text)), 2) * 0.3
+    if _PASTORAL.search(text):
+        score += 0.3
+    references = len(BIBLE_VERSE_PATTERN.findall(text))
+    if references > 1:
+        score += 0.3
+    elif references == 1 and words <= 8:
+        score -= 0.1  # "What does John 3:16 say?" is a lookup
+    questions = text.count("?")
+    if questions > 1:
+        score += min(questions, 3) * 0.05  # several questions in one message
+    score += min(history_turns / 20, 1.0) * 0.1
+    return max(0.0, min(score, 1.0))
+
+
+def _p(model, q):
+    if metrics.counter(f"chat.replies.{model}") < MIN_LATENCY_SAMPLES:
+        return None
+    values = metrics.percentiles(f"chat.call_ms.{model}", (q,))
+    return values[q] if values else None
+
+
+def route(prompt, history_turns=0, override=None):
+    """The model to answer ``prompt`` with, and why."""
+    override = override or MODEL_OVERRIDE
+    if override and override != "auto":
+        decision = Route(override, "override", None)
+    else:
+        score = complexity(prompt, history_turns)
+        threshold = COMPLEXITY_THRESHOLD
+        large_p95, fast_p95 = _p(LARGE_MODEL, 95), _p(FAST_MODEL, 95)
+        busy = large_p95 is not None and large_p95 > LATENCY_BUDGET_MS and (fast_p95 is None or fast_p95 < large_p95)
+        if busy:
+            threshold = BUSY_THRESHOLD
+        if score < threshold:
+            reason = "simple" if score < COMPLEXITY_THRESHOLD else "large_model_slow"
+            decision = Route(FAST_MODEL, reason, score)
+        else:
+            decision = Route(LARGE_MODEL, "complex", score)
+
+    metrics.incr(f"chat.route.{decision.model}")
+    metrics.incr(f"chat.route.reason.{decision.reason}")
+    if decision.model == FAST_MODEL:
+        large_p50, fast_p50 = _p(LARGE_MODEL, 50), _p(FAST_MODEL, 50)
+        if large_p50 is not None and fast_p50 is not None and large_p50 > fast_p50:
+            metrics.incr("chat.route.latency_saved_ms", large_p50 - fast_p50)
+    return decision
@@ -0,0 +1,188 @@
+"""
+Canonical verse IDs and a range index over Bible references.
+
+A verse is the integer ``BBCCCVVV`` (book 1-66, chapter, verse), so
+"John 3:16" is 43003016 and ordering IDs orders the Bible. Verse 999 stands
+for "end of chapter", which lets a whole chapter be the interval
+``BBCCC001..BBCCC999``. ``parse_reference`` turns free text such as
+"Matt 26:69-74", "1 Sam 17:49; Ps 23" or "Matt 5:1-7:29" into inclusive ID
+intervals, and ``ReferenceIndex`` answers range and chapter queries over
+many references with NumPy comparisons instead of regexes.
+"""
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from keepwatch.verses import BIBLE_VERSE_PATTERN, BOOK_NAME_REGEX, book_slug
+
+# (name, biblehub slug, chapters), in canonical order: book number = position + 1
+BOOKS = (
+    ("Genesis", "genesis", 50), ("Exodus", "exodus", 40), ("Leviticus", "leviticus", 27),
+    ("Numbers", "numbers", 36), ("Deuteronomy", "deuteronomy", 34), ("Joshua", "joshua", 24),
+    ("Judges", "judges", 21), ("Ruth", "ruth", 4), ("1 Samuel", "1_samuel", 31), ("2 Samuel", "2_samuel", 24),
+    ("1 Kings", "1_kings", 22), ("2 Kings", "2_kings", 25), ("1 Chronicles", "1_chronicles", 29),
+    ("2 Chronicles", "2_chronicles", 36), ("Ezra", "ezra", 10), ("Nehemiah", "nehemiah", 13),
+    ("Esther", "esther", 10), ("Job", "job", 42), ("Psalms", "psalms", 150), ("Proverbs", "proverbs", 31),
+    ("Ecclesiastes", "ecclesiastes", 12), ("Song of Solomon", "song_of_solomon", 8), ("Isaiah", "isaiah", 66),
+    ("Jeremiah", "jeremiah", 52), ("Lamentations", "lamentations", 5), ("Ezekiel", "ezekiel", 48),
+    ("Daniel", "daniel", 12), ("Hosea", "hosea", 14), ("Joel", "joel", 3), ("Amos", "amos", 9),
+    ("Obadiah", "obadiah", 1), ("Jonah", "jonah", 4), ("Micah", "micah", 7), ("Nahum", "nahum", 3),
+    ("Habakkuk", "habakkuk", 3), ("Zephaniah", "zephaniah", 3), ("Haggai", "haggai", 2),
+    ("Zechariah", "zechariah", 14), ("Malachi", "malachi", 4), ("Matthew", "matthew", 28), ("Mark", "mark", 16),
+    ("Luke", "luke", 24), ("John", "john", 21), ("Acts", "acts", 28), ("Romans", "romans", 16),
+    ("1 Corinthians", "1_corinthians", 16), ("2 Corinthians", "2_corinthians", 13), ("Galatians", "galatians", 6),
+    ("Ephesians", "ephesians", 6), ("Philippians", "philippians", 4), ("Colossians", "colossians", 4),
+    ("1 Thessalonians", "1_thessalonians", 5), ("2 Thessalonians", "2_thessalonians", 3),
+    ("1 Timothy", "1_timothy", 6), ("2 Timothy", "2_timothy", 4), ("Titus", "titus", 3),
+    ("Philemon", "philemon", 1), ("Hebrews", "hebrews", 13), ("James", "james", 5), ("1 Peter", "1_peter", 5),
+    ("2 Peter", "2_peter", 3), ("1 John", "1_john", 5), ("2 John", "2_john", 1), ("3 John", "3_john", 1),
+    ("Jude", "jude", 1), ("Revelation", "revelation", 22),
+)
+BOOK_NAMES = tuple(name for name, _, _ in BOOKS)
+BOOK_CHAPTERS = {name: chapters for name, _, chapters in BOOKS}
+BOOK_CHAPTERS["Psalm"] = BOOK_CHAPTERS["Psalms"]
+# Index 0 unused so CHAPTER_COUNTS[book] works for book numbers 1-66
+CHAPTER_COUNTS = np.array([0] + [chapters for _, _, chapters in BOOKS], dtype=np.int32)
+
+_BOOK_BY_SLUG = {slug: number for number, (_, slug, _) in enumerate(BOOKS, 1)}
+_BOOK_BY_SLUG["song_of_songs"] = _BOOK_BY_SLUG["song_of_solomon"]
+
+MAX_VERSE = 176    # Psalm 119
+END_OF_CHAPTER = 999
+
+# ", 18", ", 18-20" or ", 5:3" after a reference continues the same book,
+# unless the number starts the next book ("John 3:16, 2 Peter 1:3").
+_CONTINUATION = re.compile(
+    r"\s*[,;]\s*(?!(?:" + BOOK_NAME_REGEX + r")\s+\d)(?:(\d{1,3}):)?(\d{1,3})(?:\s*[-–]\s*(\d{1,3}))?(?![\d:])",
+    re.IGNORECASE,
+)
+# "Matt 5:1-7:29": the verse pattern stops at "5:1-7", this picks up ":29"
+_CROSS_CHAPTER_END = re.compile(r":(\d{1,3})")
+# Whole chapters: "Psalm 23", "Ps 23-24"
+_CHAPTER_ONLY = re.compile(
+    r"\b(" + BOOK_NAME_REGEX + r")\s(\d{1,3})(?:\s*[-–]\s*(\d{1,3}))?(?![\d:])",
+    re.IGNORECASE,
+)
+
+
+def verse_id(book, chapter, verse):
+    return book * 1_000_000 + chapter * 1000 + verse
+
+
+def split_id(vid):
+    return vid // 1_000_000, vid // 1000 % 1000, vid % 1000
+
+
+def book_number(name):
+    """1-66 for a book name or abbreviation, or None."""
+    return _BOOK_BY_SLUG.get(book_slug(name) or "")
+
+
+def chapter_bounds(book, chapter):
+    return verse_id(book, chapter, 1), verse_id(book, chapter, END_OF_CHAPTER)
+
+
+def format_id(vid):
+    book, chapter, verse = split_id(vid)
+    name = BOOK_NAMES[book - 1]
+    return f"{name} {chapter}" if verse == END_OF_CHAPTER else f"{name} {chapter}:{verse}"
+
+
+@lru_cache(maxsize=8192)
+def parse_reference(text):
+    """
+    Inclusive ``(start_id, end_id)`` intervals for every reference in ``text``.
+
+    Understands single verses, verse ranges, cross-chapter ranges, whole
+    chapters and comma/semicolon continuations of the same book. Unknown
+    books, impossible chapters/verses and reversed ranges are dropped.
+    """
+    intervals, covered = [], []
+    for match in BIBLE_VERSE_PATTERN.finditer(text):
+        book = book_number(match.group(1)) or 0
+        chapter, verse = int(match.group(2)), int(match.group(3))
+        end_chapter, end_verse = chapter, int(match.group(4) or verse)
+        pos = match.end()
+        cross = _CROSS_CHAPTER_END.match(text, pos) if match.group(4) else None
+        if cross:
+            end_chapter, end_verse = int(match.group(4)), int(cross.group(1))
+            pos = cross.end()
+        intervals.append((verse_id(book, chapter, verse), verse_id(book, end_chapter, end_verse)))
+        while (more := _CONTINUATION.match(text, pos)) is not None:
+            chapter = int(more.group(1) or chapter)
+            first = int(more.group(2))
+            intervals.append((verse_id(book, chapter, first), verse_id(book, chapter, int(more.group(3) or first))))
+            pos = more.end()
+        covered.append((match.start(), pos))
+
+    for match in _CHAPTER_ONLY.finditer(text):
+        if not any(start <= match.start() < end for start, end in covered):
+            book = book_number(match.group(1)) or 0
+            first, last = int(match.group(2)), int(match.group(3) or match.group(2))
+            intervals.append((verse_id(book, first, 1), verse_id(book, last, END_OF_CHAPTER)))
+
+    if not intervals:
+        return ()
+    bounds = np.array(intervals, dtype=np.int64)
+    keep = valid_ids(bounds).all(axis=1) & (bounds[:, 0] <= bounds[:, 1])
+    return tuple(sorted(map(tuple, bounds[keep].tolist())))
+
+
+def valid_ids(ids):
+    """Vectorized check that each ID names a real book and chapter and a plausible verse."""
+    ids = np.asarray(ids, dtype=np.int64)
+    book, chapter, verse = ids // 1_000_000, ids // 1000 % 1000, ids % 1000
+    in_range = (book >= 1) & (book <= len(BOOKS))
+    chapters = CHAPTER_COUNTS[np.where(in_range, book, 0)]
+    return in_range & (chapter >= 1) & (chapter <= chapters) & (
+        ((verse >= 1) & (verse <= MAX_VERSE)) | (verse == END_OF_CHAPTER)
+    )
+
+
+class ReferenceIndex:
+    """
+    Sorted interval index from references to the items that cite them.
+
+    Built from ``(key, reference_text)`` pairs; each parsed interval becomes
+    one row of parallel ``starts``/``ends``/``items`` arrays sorted by start.
+    """
+
+    def __init__(self, entries):
+        starts, ends, items = [], [], []
+        self.keys = []
+        for key, text in entries:
+            intervals = parse_reference(text)
+            if not intervals:
+                continue
+            self.keys.append(key)
+            for start, end in intervals:
+                starts.append(start)
+                ends.append(end)
+                items.append(len(self.keys) - 1)
+        order = np.argsort(np.array(starts, dtype=np.int32), kind="stable")
+        self.starts = np.array(starts, dtype=np.int32)[order]
+        self.ends = np.array(ends, dtype=np.int32)[order]
+        self.items = np.array(items, dtype=np.int32)[order]
+        # Longest interval bounds how far left an overlapping start can be
+        self._max_span = int((self.ends - self.starts).max()) if len(self.starts) else 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def overlapping(self, start, end):
+        """Keys with any interval intersecting ``[start, end]``, in index order."""
+        lo = np.searchsorted(self.starts, start - self._max_span, side="left")
+        hi = np.searchsorted(self.starts, end, side="right")
+        hits = self.items[lo:hi][self.ends[lo:hi] >= start]
+        return [self.keys[i] for i in np.unique(hits)]
+
+    def touching(self, reference):
+        """Keys overlapping any interval of a reference string ("John 3", "Gen 1:1-3")."""
+        found = []
+        for start, end in parse_reference(reference):
+            found += [key for key in self.overlapping(start, end) if key not in found]
+        return found
+
+    def in_chapter(self, book, chapter):
+        return self.overlapping(*chapter_bounds(book, chapter))
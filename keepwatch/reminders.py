@@ -0,0 +1,293 @@
+"""
+Background service that actually sends prayer-watch reminders.
+
+Subscribers are grouped by location cell (the same key as the schedule
+cache), and the timer heap holds one entry per cell and watch rather than per
+user, so ~13k users in a few hundred cities cost a few thousand heap entries.
+Each cell's next day is computed lazily from ``sun_times`` when its current
+day runs out; nothing is fetched from aladhan. Days covered by the nightly
+batch file (``--watch-table``, see ``keepwatch.batch``) are read from it
+instead of recomputed.
+
+Run it from the command line:
+
+    python -m keepwatch.reminders subscribers.csv --sink log --lead-minutes 5
+
+where subscribers.csv has ``id`` plus either ``city``/``country`` or
+``latitude``/``longitude``/``timezone`` columns.
+"""
+import argparse
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+import numpy as np
+import pytz
+import requests
+
+from keepwatch import metrics
+from keepwatch.batch import WatchTable
+from keepwatch.gazetteer import load_locations
+from keepwatch.watches import WATCHES, location_cell, sun_times, watch_windows
+
+logger = logging.getLogger("keepwatch.reminders")
+
+_REFILL = -1  # heap entry that computes a cell's next day instead of notifying
+_NAT = np.iinfo(np.int64).min  # NaT as epoch seconds
+
+
+class Reminder(NamedTuple):
+    user_id: str
+    watch_key: str
+    watch_name: str
+    start: datetime
+    end: datetime
+    location: str
+
+    def message(self):
+        return f"{self.watch_name} begins at {self.start.strftime('%I:%M %p')} (until {self.end.strftime('%I:%M %p')})."
+
+    def as_dict(self):
+        return {
+            "user_id": self.user_id,
+            "watch": self.watch_key,
+            "name": self.watch_name,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "location": self.location,
+        }
+
+
+class LogSink:
+    """Writes reminders to the log and keeps them in ``sent`` (handy in tests)."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, reminder):
+        self.sent.append(reminder)
+        logger.info("reminder %s: %s", reminder.user_id, reminder.message())
+
+
+class DesktopSink:
+    """Native notification on the machine running the service, via plyer."""
+
+    def __init__(self, timeout=30):
+        from plyer import notification
+        self._notification = notification
+        self.timeout = timeout
+
+    def send(self, reminder):
+        self._notification.notify(
+            title=f"KeepWatch — {reminder.watch_name}",
+            message=reminder.message(),
+            app_name="KeepWatch",
+            timeout=self.timeout,
+        )
+
+
+class WebhookSink:
+    """POSTs each reminder as JSON to ``url``."""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, reminder):
+        requests.post(self.url, json=reminder.as_dict(), timeout=self.timeout).raise_for_status()
+
+
+class ReminderScheduler:
+    """
+    Timer heap of upcoming watches, fanned out to subscribers on fire.
+
+    ``sinks`` are objects with a ``send(reminder)`` method; every subscriber
+    is notified through all of them. Sends run on a small thread pool so a
+    slow webhook never delays the next timer.
+    """
+
+    def __init__(self, sinks, lead_minutes=0, clock=time.time, max_workers=4, watch_table=None):
+        self.sinks = list(sinks)
+        self.watch_table = watch_table
+        self.lead = lead_minutes * 60
+        self._clock = clock
+        self._heap = []
+        self._seq = itertools.count()
+        self._subscribers = defaultdict(dict)  # cell -> {user_id: location}
+        self._cell_of = {}                     # user_id -> cell
+        self._generation = defaultdict(int)    # cell -> bumped when a cell is re-created
+        self._cond = threading.Condition()
+        self._running = False
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reminder-sink")
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def subscribe(self, user_id, location):
+        cell = location_cell(location.latitude, location.longitude, location.timezone)
+        with self._cond:
+            self.unsubscribe(user_id)
+            is_new_cell = not self._subscribers[cell]
+            self._subscribers[cell][user_id] = location
+            self._cell_of[user_id] = cell
+            if is_new_cell:
+                self._generation[cell] += 1
+                today = datetime.fromtimestamp(self._clock(), pytz.timezone(location.timezone)).date()
+                self._schedule_day(cell, location, today - timedelta(days=1), refill=False)
+                self._schedule_day(cell, location, today)
+            self._cond.notify()
+
+    def unsubscribe(self, user_id):
+        with self._cond:
+            cell = self._cell_of.pop(user_id, None)
+            if cell is not None:
+                self._subscribers[cell].pop(user_id, None)
+                if not self._subscribers[cell]:
+                    del self._subscribers[cell]  # its heap entries are dropped when they fire
+
+    @property
+    def cell_count(self):
+        return len(self._subscribers)
+
+    def _schedule_day(self, cell, location, day, refill=True):
+        # Called with the lock held. Yesterday is included on subscribe because
+        # its night watches run past midnight into today.
+        precomputed = self.watch_table.cell_windows(cell, day) if self.watch_table is not None else None
+        if precomputed is not None:
+            metrics.incr("reminders.precomputed_days")
+            starts, ends = precomputed
+        else:
+            sunrise, sunset = sun_times(location.latitude, location.longitude, np.datetime64(day, "D"))
+            starts, ends = (w.astype("datetime64[s]").astype("int64") for w in watch_windows(sunrise, sunset))
+        now = self._clock()
+        last = None
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            if start == _NAT:
+                continue
+            start_s, end_s = int(start), int(end)
+            last = max(last or start_s, start_s)
+            if start_s - self.lead > now:
+                heapq.heappush(self._heap, (start_s - self.lead, next(self._seq), cell, self._generation[cell], index, start_s, end_s))
+        metrics.set_gauge("reminders.heap_size", len(self._heap))
+        if not refill:
+            return
+        # Compute the following day once this one's last watch has started
+        # (or around the next day's noon when the sun never rises or sets).
+        refill_at = last if last is not None else int(np.datetime64(day, "D").astype("datetime64[s]").astype("int64")) + 36 * 3600
+        heapq.heappush(self._heap, (refill_at - self.lead, next(self._seq), cell, self._generation[cell], _REFILL, day.toordinal() + 1, 0))
+        metrics.set_gauge("reminders.heap_size", len(self._heap))
+
+    def _fire(self, cell, index, start_s, end_s):
+        subscribers = self._subscribers.get(cell)
+        if not subscribers:
+            return []
+        tz = pytz.timezone(cell[2])
+        watch = WATCHES[index]
+        start = datetime.fromtimestamp(start_s, timezone.utc).astimezone(tz)
+        end = datetime.fromtimestamp(end_s, timezone.utc).astimezone(tz)
+        return [
+            Reminder(user_id, watch["key"], watch["name"], start, end, location.label)
+            for user_id, location in subscribers.items()
+        ]
+
+    def _send(self, reminder):
+        for sink in self.sinks:
+            try:
+                sink.send(reminder)
+                metrics.incr(f"reminders.sent.{type(sink).__name__}")
+            except Exception as e:
+                metrics.incr(f"reminders.failed.{type(sink).__name__}")
+                logger.warning("%s failed for %s: %s", type(sink).__name__, reminder.user_id, e)
+
+    def run_due(self):
+        """Process every heap entry that is due now. Returns the reminders dispatched."""
+        reminders = []
+        with self._cond:
+            now = self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, cell, generation, index, a, b = heapq.heappop(self._heap)
+                if cell not in self._subscribers or generation != self._generation[cell]:
+                    continue
+                if index == _REFILL:
+                    location = next(iter(self._subscribers[cell].values()))
+                    self._schedule_day(cell, location, datetime.fromordinal(a).date())
+                else:
+                    reminders.extend(self._fire(cell, index, a, b))
+            metrics.set_gauge("reminders.heap_size", len(self._heap))
+        for reminder in reminders:
+            self._pool.submit(self._send, reminder)
+        return reminders
+
+    def next_fire_in(self):
+        with self._cond:
+            return None if not self._heap else max(0.0, self._heap[0][0] - self._clock())
+
+    def run_forever(self):
+        self._running = True
+        while self._running:
+            self.run_due()
+            with self._cond:
+                if not self._running:
+                    break
+                wait = None if not self._heap else max(0.0, self._heap[0][0] - self._clock())
+                self._cond.wait(timeout=wait if wait is None else min(wait, 3600))
+
+    def start(self):
+        thread = threading.Thread(target=self.run_forever, daemon=True, name="reminder-scheduler")
+        thread.start()
+        return thread
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._pool.shutdown(wait=True)
+
+
+def _build_sinks(specs):
+    sinks = []
+    for spec in specs:
+        kind, _, arg = spec.partition("=")
+        if kind == "log":
+            sinks.append(LogSink())
+        elif kind == "desktop":
+            sinks.append(DesktopSink())
+        elif kind == "webhook" and arg:
+            sinks.append(WebhookSink(arg))
+        else:
+            raise SystemExit(f"Unknown sink '{spec}'. Use log, desktop or webhook=URL.")
+    return sinks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("subscribers", help="CSV of subscribers")
+    parser.add_argument("--sink", action="append", default=[], help="log, desktop or webhook=URL (repeatable)")
+    parser.add_argument("--lead-minutes", type=int, default=0, help="notify this many minutes before a watch starts")
+    parser.add_argument("--watch-table", help="nightly batch file from keepwatch.batch to read watch times from")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    watch_table = WatchTable(args.watch_table) if args.watch_table else None
+    scheduler = ReminderScheduler(_build_sinks(args.sink or ["log"]), lead_minutes=args.lead_minutes,
+                                  watch_table=watch_table)
+    locations, unresolved = load_locations(args.subscribers)
+    for user_id, location in locations:
+        scheduler.subscribe(user_id, location)
+    if unresolved:
+        logger.warning("Skipped %d subscribers with unknown locations: %s", len(unresolved), ", ".join(unresolved[:10]))
+    logger.info("Scheduling reminders for %d subscribers in %d cells", len(scheduler), scheduler.cell_count)
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Persistent cache of Faith Companion answers to first-turn questions.
+
+Many users open with the same question ("What is the fourth watch?",
+"Explain Psalm 23"), and each costs a full 70B generation. Answers are kept
+in SQLite keyed by model, system prompt and the normalized question, so they
+survive restarts and are shared by every session and worker process.
+
+On an exact miss, an optional TF-IDF near-duplicate search over the cached
+questions for the same model and system prompt accepts a match whose cosine
+similarity (unigrams and bigrams) reaches ``near_threshold`` and whose
+anchors (numbers, ordinals, verse references, book, people and place names)
+are exactly the question's, so "the third watch" never answers "the fourth
+watch". Similarity can't tell "Who was Moses?" from "Who was Moses really?",
+so the search is off unless ``KEEPWATCH_RESPONSE_CACHE_NEAR`` sets a
+threshold, e.g. 0.75. It runs on an in-memory inverted index that is loaded
+once, updated on every write and caught up with rows other processes wrote
+before each lookup, so a miss never waits for the index to be rebuilt.
+
+Entries expire after ``ttl`` seconds and the least recently used ones are evicted once the
+cache holds more than ``max_entries`` answers or ``max_bytes`` of text.
+"""
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+from keepwatch import STATE_DIR, metrics
+
+RESPONSE_CACHE_PATH = os.environ.get("KEEPWATCH_RESPONSE_CACHE", os.path.join(STATE_DIR, "response_cache.sqlite3"))
+NEAR_THRESHOLD = float(os.environ["KEEPWATCH_RESPONSE_CACHE_NEAR"]) if os.environ.get("KEEPWATCH_RESPONSE_CACHE_NEAR") else None
+NEAR_CANDIDATES = 8   # most similar prompts checked for matching anchors
+
+_NON_WORD = re.compile(r"[^\w\s:]+")
+_SPACES = re.compile(r"\s+")
+_NUMBER_WORDS = frozenset(
+    "one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen sixteen "
+    "seventeen eighteen nineteen twenty thirty forty fifty sixty seventy eighty ninety hundred thousand "
+    "first second third fourth fifth sixth seventh eighth ninth tenth eleventh twelfth".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_hit REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope);
+CREATE INDEX IF NOT EXISTS responses_last_hit ON responses (last_hit);
+CREATE INDEX IF NOT EXISTS responses_created ON responses (created);
+"""
+
+
+def normalize_prompt(text):
+    """Case, accents, punctuation and spacing folded away: "Explain  Psalm 23?" -> "explain psalm 23"."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text)).strip()
+
+
+def _sha1(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _terms(prompt):
+    words = prompt.split()
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+@lru_cache(maxsize=1)
+def _proper_names():
+    from keepwatch.references import BOOK_CHAPTERS
+    from keepwatch.trivia import people_pool, places_pool
+    return tuple({normalize_prompt(name) for name in (*BOOK_CHAPTERS, *people_pool, *places_pool)})
+
+
+def anchors(prompt):
+    """Tokens of a normalized prompt that a near match must share exactly: numbers, ordinals, verse references, names."""
+    found = {word for word in prompt.split() if word in _NUMBER_WORDS or any(ch.isdigit() for ch in word)}
+    padded = f" {prompt} "
+    found.update(name for name in _proper_names() if f" {name} " in padded)
+    return frozenset(found)
+
+
+class _TermIndex:
+    """
+    Inverted TF-IDF index over the cached prompts of one scope.
+
+    Postings map each term to the rows containing it, so a lookup touches only
+    the rows that share a term with the question; the best scoring rows whose
+    ``anchors`` differ from the question's are skipped. Rows are added and removed
+    in place; row norms are recomputed by ``maintain`` once the number of live
+    rows (and with it every idf) has drifted by a quarter, and dead rows are
+    dropped once they outnumber live ones.
+    """
+
+    def __init__(self):
+        self.keys = []        # row -> key
+        self.rows = {}        # key -> row, live rows only
+        self.terms = []       # row -> Counter of terms, None once removed
+        self.anchors = []     # row -> frozenset of anchors
+        self.created = array("d")
+        self.alive = bytearray()
+        self.norms = array("f")
+        self.postings = {}    # term -> (array of rows, array of counts)
+        self.df = Counter()
+        self.live = 0
+        self.norms_live = 0   # live rows when the norms were last computed
+
+    def idf(self, term):
+        return math.log((1 + self.live) / (1 + self.df[term])) + 1
+
+    def _norm(self, counts):
+        return math.sqrt(sum((n * self.idf(term)) ** 2 for term, n in counts.items())) or 1e-12
+
+    def add(self, key, prompt, created):
+        self._add(key, Counter(_terms(prompt)), anchors(prompt), created)
+
+    def _add(self, key, counts, prompt_anchors, created):
+        self.remove(key)
+        row = len(self.keys)
+        self.keys.append(key)
+        self.rows[key] = row
+        self.terms.append(counts)
+        self.anchors.append(prompt_anchors)
+        self.created.append(created)
+        self.alive.append(1)
+        for term, n in counts.items():
+            rows, ns = self.postings.setdefault(term, (array("i"), array("f")))
+            rows.append(row)
+            ns.append(n)
+            self.df[term] += 1
+        self.live += 1
+        self.norms.append(self._norm(counts))
+
+    def remove(self, key):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        for term in self.terms[row]:
+            self.df[term] -= 1
+        self.terms[row] = None
+        self.alive[row] = 0
+        self.live -= 1
+
+    def maintain(self):
+        """Compact dead rows and refresh norms when they have drifted; called on writes, never on lookups."""
+        if len(self.keys) - self.live > max(self.live, 64):
+            live = [(key, self.terms[row], self.anchors[row], self.created[row]) for key, row in self.rows.items()]
+            self.__init__()
+            for key, counts, prompt_anchors, created in live:
+                self._add(key, counts, prompt_anchors, created)
+        elif not 0.8 * self.norms_live <= self.live <= 1.25 * self.norms_live:
+            for row in self.rows.values():
+                self.norms[row] = self._norm(self.terms[row])
+        else:
+            return
+        self.norms_live = self.live
+
+    def best(self, prompt, since):
+        """
+        ``(key, similarity)`` of the closest live prompt created after ``since``
+        with the same anchors as ``prompt``, or ``(None, 0.0)``.
+        """
+        if not self.live:
+            return None, 0.0
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        query_norm = 0.0  # terms no cached prompt has still count against similarity
+        for term, n in Counter(_terms(prompt)).items():
+            weight = n * self.idf(term)
+            query_norm += weight ** 2
+            if self.df[term] > 0:
+                rows, ns = self.postings[term]
+                scores[np.frombuffer(rows, dtype=np.int32)] += weight * self.idf(term) * np.frombuffer(ns, dtype=np.float32)
+        if query_norm == 0:
+            return None, 0.0
+        scores /= np.frombuffer(self.norms, dtype=np.float32) * math.sqrt(query_norm)
+        scores[np.frombuffer(self.created, dtype=np.float64) <= since] = 0   # expired
+        scores[np.frombuffer(self.alive, dtype=np.uint8) == 0] = 0           # removed or replaced
+        wanted = anchors(prompt)
+        for _ in range(NEAR_CANDIDATES):
+            best = int(scores.argmax())
+            if scores[best] <= 0:
+                break
+            if self.anchors[best] == wanted:
+                return self.keys[best], float(scores[best])
+            scores[best] = 0
+        return None, 0.0
+
+
+class ResponseCache:
+    """SQLite-backed answer cache with TTL, LRU size bounds and hit-rate counters."""
+
+    def __init__(self, path=RESPONSE_CACHE_PATH, ttl=7 * 24 * 3600, max_entries=5000,
+                 max_bytes=20_000_000, near_threshold=NEAR_THRESHOLD, name="chat_response"):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.near_threshold = near_threshold
+        self.name = name
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._indexes = defaultdict(_TermIndex)   # scope -> near-duplicate index
+        self._synced = 0.0   # newest ``created`` already in the indexes
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        if near_threshold is not None:
+            with self._lock:
+                self._sync(time.time())
+                for index in self._indexes.values():
+                    index.maintain()
+
+    @staticmethod
+    def scope(model, system_prompt):
+        """Answers are only reused for the same model and system prompt."""
+        return f"{model}:{_sha1(system_prompt or '')[:16]}"
+
+    def _key(self, scope, prompt):
+        return _sha1(f"{scope}\0{prompt}")
+
+    def get(self, question, model, system_prompt=""):
+        """Cached answer for ``question``, or None."""
+        scope, prompt = self.scope(model, system_prompt), normalize_prompt(question)
+        if not prompt:
+            return None
+        now = time.time()
+        with self._lock:
+            key = self._key(scope, prompt)
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ? AND created > ?", (key, now - self.ttl)
+            ).fetchone()
+            kind = "hit"
+            if row is None and self.near_threshold is not None:
+                key, similarity = self._near(scope, prompt, now)
+                if key is not None and similarity >= self.near_threshold:
+                    row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+                    kind = "near_hit"
+                    if row is None:
+                        self._indexes[scope].remove(key)  # evicted by another process
+            if row is None:
+                self.misses += 1
+                kind = "miss"
+            else:
+                self._db.execute("UPDATE responses SET last_hit = ?, hits = hits + 1 WHERE key = ?", (now, key))
+                if kind == "hit":
+                    self.hits += 1
+                else:
+                    self.near_hits += 1
+        metrics.incr(f"cache.{self.name}.{kind}")
+        return row[0] if row else None
+
+    def _sync(self, now):
+        """Add rows written since the last sync, by this or any other process."""
+        rows = self._db.execute(
+            "SELECT key, scope, prompt, created FROM responses WHERE created > ? ORDER BY created",
+            (max(self._synced, now - self.ttl),),
+        ).fetchall()
+        for key, scope, prompt, created in rows:
+            self._indexes[scope].add(key, prompt, created)
+        if rows:
+            self._synced = rows[-1][3]
+
+    def _near(self, scope, prompt, now):
+        self._sync(now)
+        if scope not in self._indexes:
+            return None, 0.0
+        return self._indexes[scope].best(prompt, now - self.ttl)
+
+    def put(self, question, model, system_prompt, response):
+        scope, prompt = self.scope(model, system_prompt), normalize_prompt(question)
+        if not prompt or not response:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, scope, prompt, response, created, last_hit, hits, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0, ?)",
+                (self._key(scope, prompt), scope, prompt, response, now, now, len(response.encode("utf-8"))),
+            )
+            evicted = self._evict(now)
+            if self.near_threshold is not None:
+                self._sync(now)
+                self._indexes[scope].maintain()
+        if evicted:
+            metrics.incr(f"cache.{self.name}.eviction", evicted)
+
+    def _evict(self, now):
+        """Drop expired entries, then least recently used ones until within both bounds."""
+        doomed = self._db.execute("SELECT key FROM responses WHERE created <= ?", (now - self.ttl,)).fetchall()
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        evicted = len(doomed)
+        count, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count > self.max_entries or size > self.max_bytes:
+            excess_rows = max(count - self.max_entries, 0)
+            excess_bytes = max(size - self.max_bytes, 0)
+            freed, expired = 0, len(doomed)
+            for key, entry_size in self._db.execute("SELECT key, size FROM responses ORDER BY last_hit"):
+                if len(doomed) - expired >= excess_rows and freed >= excess_bytes:
+                    break
+                doomed.append((key,))
+                freed += entry_size
+            self._db.executemany("DELETE FROM responses WHERE key = ?", doomed[expired:])
+            evicted = len(doomed)
+        if evicted:
+            for (key,) in doomed:
+                for index in self._indexes.values():
+                    index.remove(key)
+            for index in self._indexes.values():
+                index.maintain()
+            self.evictions += evicted
+        return evicted
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._indexes.clear()
+
+    def stats(self):
+        with self._lock:
+            count, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            lookups = self.hits + self.near_hits + self.misses
+            return {
+                "name": self.name,
+                "size": count,
+                "maxsize": self.max_entries,
+                "bytes": size,
+                "hits": self.hits,
+                "near_hits": self.near_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.near_hits) / lookups, 3) if lookups else None,
+            }
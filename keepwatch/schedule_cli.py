@@ -0,0 +1,140 @@
+"""
+Watch schedules for many locations at once, without Streamlit or aladhan.
+
+Reads a CSV of locations (``id`` plus ``city``/``country`` or
+``latitude``/``longitude``/``timezone``, as for the reminder service),
+computes every watch for every day in the range on a process pool, and
+streams the results out as they finish:
+
+    python -m keepwatch.schedule_cli parishes.csv --start 2026-01-01 --end 2026-12-31 \\
+        --csv schedules.csv --ics-dir calendars/
+
+Throughput (location-days per second) is reported on stderr.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from keepwatch.gazetteer import load_locations
+from keepwatch.watches import WATCHES, schedule_to_ics, watch_schedule
+
+CSV_HEADER = ["location_id", "location", "date", "key", "watch", "start", "end"]
+
+
+def _isoformat(values):
+    """``Timestamp.isoformat()`` text for a tz-aware column, without pandas' per-element formatting."""
+    local = values.dt.tz_localize(None).to_numpy("datetime64[s]")
+    utc = values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy("datetime64[s]")
+    # Only a couple of distinct UTC offsets per location (DST), so format each once
+    offsets, index = np.unique((local - utc).astype(np.int64), return_inverse=True)
+    suffixes = np.array([f"{'+' if o >= 0 else '-'}{abs(o) // 3600:02d}:{abs(o) % 3600 // 60:02d}" for o in offsets],
+                        dtype=str)  # str even when empty: a polar location can have no windows in the range
+    return np.char.add(np.datetime_as_string(local, unit="s"), suffixes[index.ravel()])
+
+
+def render_location(job):
+    """Worker: ``(location_id, csv_rows, ics_text_or_None, days)`` for one location."""
+    location_id, location, start, end, with_ics = job
+    schedule = watch_schedule(location, start, end)
+    rows = schedule[schedule["start"].notna()]
+    csv_rows = pd.DataFrame({
+        "location_id": location_id,
+        "location": location.label,
+        "date": rows["date"].astype(str),
+        "key": rows["key"],
+        "watch": rows["watch"],
+        "start": _isoformat(rows["start"]),
+        "end": _isoformat(rows["end"]),
+    }).to_csv(index=False, header=False, lineterminator="\r\n")
+    ics = schedule_to_ics(schedule, location) if with_ics else None
+    return location_id, csv_rows, ics, len(schedule) // len(WATCHES)
+
+
+def _ics_filename(location_id):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", location_id).strip("_") or "location"
+
+
+def generate(locations, start, end, csv_out=None, ics_dir=None, workers=None, progress=sys.stderr):
+    """
+    Compute and write schedules for ``[(id, Location)]``; returns ``(location_days, seconds)``.
+
+    ``workers=1`` runs in this process, which is easier to debug and faster
+    for a handful of locations.
+    """
+    if ics_dir:
+        os.makedirs(ics_dir, exist_ok=True)
+    if csv_out:
+        csv_out.write(",".join(CSV_HEADER) + "\r\n")
+
+    jobs = [(location_id, location, start, end, bool(ics_dir)) for location_id, location in locations]
+    started = time.perf_counter()
+    location_days = 0
+
+    def consume(results):
+        nonlocal location_days
+        for done, (location_id, rows, ics, days) in enumerate(results, 1):
+            if csv_out:
+                csv_out.write(rows)
+            if ics is not None:
+                with open(os.path.join(ics_dir, f"{_ics_filename(location_id)}.ics"), "w", encoding="utf-8", newline="") as f:
+                    f.write(ics)
+            location_days += days
+            if progress and (done % 50 == 0 or done == len(jobs)):
+                elapsed = time.perf_counter() - started
+                progress.write(f"\r{done}/{len(jobs)} locations, {location_days / elapsed:,.0f} location-days/s")
+                progress.flush()
+
+    if workers == 1 or len(jobs) <= 1:
+        consume(map(render_location, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map keeps input order, so the CSV is deterministic while still streaming
+            consume(pool.map(render_location, jobs, chunksize=max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 8))))
+    if progress:
+        progress.write("\n")
+    return location_days, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("locations", help="CSV of locations")
+    parser.add_argument("--start", type=date.fromisoformat, default=date.today(), help="first day, YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day, YYYY-MM-DD (default: --start)")
+    parser.add_argument("--csv", help="combined CSV output file, '-' for stdout")
+    parser.add_argument("--ics-dir", help="write one .ics calendar per location into this directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    end = args.end or args.start
+    if end < args.start:
+        parser.error("--end is before --start")
+    if not (args.csv or args.ics_dir):
+        parser.error("pass --csv and/or --ics-dir")
+
+    locations, unresolved = load_locations(args.locations)
+    if unresolved:
+        print(f"Skipping {len(unresolved)} unresolved locations: {', '.join(unresolved[:10])}", file=sys.stderr)
+
+    csv_out = None
+    if args.csv == "-":
+        csv_out = sys.stdout
+    elif args.csv:
+        csv_out = open(args.csv, "w", encoding="utf-8", newline="")
+    try:
+        location_days, seconds = generate(locations, args.start, end, csv_out, args.ics_dir, args.workers)
+    finally:
+        if csv_out not in (None, sys.stdout):
+            csv_out.close()
+    print(f"{len(locations)} locations x {(end - args.start).days + 1} days = {location_days:,} location-days "
+          f"in {seconds:.2f}s ({location_days / max(seconds, 1e-9):,.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1335 @@
+"""
+Bible trivia question bank and question generation, with no Streamlit dependency.
+"""
+import random
+from functools import lru_cache
+
+from keepwatch.references import ReferenceIndex
+
+# Category pools for distractors and Hangman words
+people_pool = [
+    "Moses", "Jonah", "David", "Noah", "Abraham", "Isaac", "Jacob", "Joseph", "Samuel", "Solomon",
+    "Elijah", "Elisha", "Jeremiah", "Daniel", "Peter", "Paul", "John", "James", "Matthew", "Mark",
+    "Luke", "Timothy", "Titus", "Philemon", "Rahab", "Ruth", "Esther", "Mary", "Martha", "Lazarus",
+    "Cain", "Abel", "Seth", "Enoch", "Methuselah", "Lamech", "Shem", "Ham", "Japheth", "Esau",
+    "Leah", "Rachel", "Bilhah", "Zilpah", "Dinah", "Judah", "Reuben", "Simeon", "Levi", "Issachar",
+    "Zebulun", "Dan", "Naphtali", "Gad", "Asher", "Benjamin", "Manasseh", "Ephraim", "Sarah", "Rebekah",
+    "Goliath", "Samson", "Deborah", "Gideon", "Barak", "Jael", "Naomi", "Boaz", "Hannah", "Eli",
+    "Saul", "Jonathan", "Michal", "Absalom", "Bathsheba", "Nathan", "Zadok", "Hagar", "Keturah",
+    "Balaam", "Jethro", "Miriam", "Aaron", "Hur", "Joshua", "Caleb", "Achan", "Othniel", "Ehud"
+]
+
+places_pool = [
+    "Garden of Eden", "Bethlehem", "Jerusalem", "Nazareth", "Galilee", "Judea", "Samaria", "Canaan",
+    "Egypt", "Babylon", "Nineveh", "Sodom", "Gomorrah", "Gethsemane", "Calvary", "Mount Sinai",
+    "Mount Zion", "Mount of Olives", "Jordan River", "Dead Sea", "Red Sea", "Nile River",
+    "Euphrates River", "Tigris River", "Philistia", "Moab", "Edom", "Ammon", "Syria", "Persia",
+    "Greece", "Rome", "Jericho", "Ai", "Hebron", "Shechem", "Bethel", "Shiloh", "Gilgal", "Gaza",
+    "Ashdod", "Ashkelon", "Ekron", "Gath", "Damascus", "Tyre", "Sidon", "Capernaum", "Bethsaida",
+    "Magdala", "Caesarea", "Antioch", "Ephesus", "Corinth", "Athens", "Patmos", "Penuel", "Haran"
+]
+
+objects_pool = [
+    "Ark", "Manger", "Cross", "Stone tablets", "Sling", "Harp", "Sword", "Shield", "Crown", "Robe",
+    "Sandals", "Bread", "Wine", "Fish", "Loaves", "Water", "Oil", "Vinegar", "Myrrh", "Frankincense",
+    "Gold", "Silver", "Bronze", "Iron", "Wood", "Stone", "Clay", "Dust", "Ashes", "Fire", "Wind", "Earth",
+    "Crucifixion", "Rib", "Serpent", "Crown of Thorns", "Dust of the ground", "Ark of bulrushes",
+    "Linen clothes", "Two tables of stone", "Altar", "Lampstand", "Incense", "Veil", "Mercy seat",
+    "Pomegranate", "Bells", "Staff", "Rod", "Bud", "Manna", "Jar", "Scroll", "Parchment", "Reed",
+    "Net", "Boat", "Anchor", "Millstone", "Yoke", "Plough", "Spear", "Javelin", "Bow", "Arrow"
+]
+
+numbers_pool = [
+    "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "12", "40", "50", "70", "100", "120", "300",
+    "400", "500", "1000", "5000", "10000", "Forty", "Twelve", "Three", "Seven", "Ten", "Fifty",
+    "Seventy", "One hundred", "One thousand", "Five thousand", "Ten thousand", "Two", "Four", "Six",
+    "Eight", "Nine"
+]
+
+static_question_bank = [
+    {"question": "What was the name of Jesus' mother?", "correct": "Mary", "reference": "Matt 1:18"},
+    {"question": "What was the name of the garden where Adam and Eve lived?", "correct": "Garden of Eden", "reference": "Gen 2:8"},
+    {"question": "With what food did Jesus feed 5,000 people?", "correct": "Loaves of bread and fishes", "reference": "Matt 14:19"},
+    {"question": "What method did the Romans use to kill Jesus?", "correct": "Crucifixion", "reference": "Mark 15:25"},
+    {"question": "From which part of Adam's body did God create Eve?", "correct": "Rib", "reference": "Gen 2:21"},
+    {"question": "Who, when accused of being with Jesus, lied and said that he did not know him, three times?", "correct": "Peter", "reference": "Matt 26:69-74"},
+    {"question": "Which creature tricked Eve into eating of the forbidden fruit?", "correct": "Serpent", "reference": "Gen 3:1-6"},
+    {"question": "At Christ's crucifixion what did the soldiers place on his head?", "correct": "Crown of Thorns", "reference": "Matt 27:29"},
+    {"question": "What is the first line of the Lord's Prayer?", "correct": "Our Father which art in heaven", "reference": "Matt 6:9"},
+    {"question": "What relationship was Ruth to Naomi?", "correct": "Daughter-in-law", "reference": "Ruth 1:4"},
+    {"question": "Who lied to God when he was asked where his brother was?", "correct": "Cain", "reference": "Gen 4:9"},
+    {"question": "Which Old Testament character showed his faith by being willing to offer his son on an altar to God?", "correct": "Abraham", "reference": "Jam 2:21-22"},
+    {"question": "What significant event is recorded in Genesis chapters 1 and 2?", "correct": "Creation", "reference": "Gen 1:1 - Gen 2:1"},
+    {"question": "What was inscribed above Jesus' cross?", "correct": "King of the Jews", "reference": "Mark 15:26"},
+    {"question": "Whose mother placed him in an ark of bulrushes?", "correct": "Moses", "reference": "Exo 2:3"},
+    {"question": "For how many days and nights did it rain in the story of the flood?", "correct": "Forty", "reference": "Gen 7:12"},
+    {"question": "What was special about Jesus' mother?", "correct": "She was a virgin", "reference": "Matt 1:23"},
+    {"question": "Who gave gifts to Jesus when he was a young child?", "correct": "Wise men", "reference": "Matt 2:7-10"},
+    {"question": "What happened to Jonah after he was thrown overboard?", "correct": "He was swallowed by a great fish", "reference": "Jon 1:17"},
+    {"question": "In whose image was man created?", "correct": "God's", "reference": "Gen 1:27"},
+    {"question": "How many apostles did Jesus choose?", "correct": "Twelve", "reference": "Luke 6:13"},
+    {"question": "What are the wages of sin?", "correct": "Death", "reference": "Rom 6:23"},
+    {"question": "Who is the first mother mentioned in the Bible?", "correct": "Eve", "reference": "Gen 4:1"},
+    {"question": "Who else, other than the wise men, came to visit Jesus when he was a small child?", "correct": "Shepherds", "reference": "Luke 2:16"},
+    {"question": "Who lied when he was asked to reveal the source of his great strength?", "correct": "Samson", "reference": "Jdg 16:15"},
+    {"question": "What was the name of the man Jesus' mother was engaged to at the time she became pregnant?", "correct": "Joseph", "reference": "Matt 1:19"},
+    {"question": "Which book of the Bible records many of the hymns David wrote?", "correct": "Psalms", "reference": "Ps 1:1-150:6"},
+    {"question": "From what disaster did the Ark save Noah?", "correct": "Flood", "reference": "Gen 7:7"},
+    {"question": "What happened to Jesus forty days after his resurrection?", "correct": "He ascended into heaven", "reference": "Acts 1:3-11"},
+    {"question": "What animals did Jesus cause to run into the sea and drown?", "correct": "Pigs", "reference": "Matt 8:32"},
+    {"question": "On what were the Ten Commandments written?", "correct": "Two tables of stone", "reference": "Deut 5:22"},
+    {"question": "What did Jesus sleep in after he was born?", "correct": "Manger", "reference": "Luke 2:7"},
+    {"question": "What was man created from?", "correct": "Dust of the ground", "reference": "Gen 2:7"},
+    {"question": "What did Jesus do to each of the disciples during the Last Supper?", "correct": "Washed their feet", "reference": "John 13:1-5"},
+    {"question": "To which city did God ask Jonah to take his message?", "correct": "Nineveh", "reference": "Jon 1:2"},
+    {"question": "Who was David's father?", "correct": "Jesse", "reference": "Ruth 4:22"},
+    {"question": "Which of the gospels appears last in the Bible?", "correct": "John", "reference": "John 21:25"},
+    {"question": "What is the only sin that cannot be forgiven?", "correct": "Blasphemy against the Holy Spirit", "reference": "Mark 3:29"},
+    {"question": "How did David defeat Goliath?", "correct": "He hit him with a stone from his sling", "reference": "1 Sam 17:49-50"},
+    {"question": "What did Joseph's brothers do to get rid of him?", "correct": "Threw him in a pit and then sold him to strangers", "reference": "Gen 37:24-27"},
+    {"question": "Who wrote the letter to Philemon?", "correct": "Paul", "reference": "Phm 1:1"},
+    {"question": "In what was Jesus wrapped before he was buried?", "correct": "Linen clothes", "reference": "John 19:40"},
+    {"question": "What was the name of Moses' brother?", "correct": "Aaron", "reference": "Exo 7:1"},
+    {"question": "What sin is Cain remembered for?", "correct": "Murder", "reference": "Gen 4:8"},
+    {"question": "The Lord is my Shepherd, is the opening line to which Psalm?", "correct": "Psalm 23", "reference": "Ps 23:1"},
+    {"question": "What is the last book of the New Testament?", "correct": "Revelation", "reference": "Rev 1:1-22:21"},
+    {"question": "Who wrote the majority of the New Testament letters?", "correct": "Paul", "reference": "Rom 1:1 - Jude 1:25"},
+    {"question": "What was David's occupation before he became king?", "correct": "Shepherd", "reference": "1 Sam 17:15"},
+    {"question": "Who hid two spies but claimed not to know of their whereabouts when asked?", "correct": "Rahab", "reference": "Josh 2:1-5"},
+    {"question": "Whose prayer resulted in his being thrown into a den of lions?", "correct": "Daniel", "reference": "Dan 6:7"},
+    {"question": "What was the apparent source of Samson's strength?", "correct": "Long hair", "reference": "Jdg 16:17"},
+    {"question": "From which country did Moses help the Israelites escape from their lives of slavery?", "correct": "Egypt", "reference": "Exo 13:3"},
+    {"question": "Who was the fourth person in the fiery furnace along with Daniel's friends?", "correct": "An angel", "reference": "Dan 3:28"},
+    {"question": "What did Joseph's brothers do to deceive their father to cover up that they had sold Joseph into slavery?", "correct": "Dipped his coat in the blood of a goat", "reference": "Gen 37:31"},
+    {"question": "What kind of leaves did Adam and Eve sew together to make clothes for themselves?", "correct": "Fig", "reference": "Gen 3:7"},
+    {"question": "Who did Jesus say was the 'father of lies'?", "correct": "The devil", "reference": "John 8:44"},
+    {"question": "What was the name of the tower that the people were building when God confused their language?", "correct": "Tower of Babel", "reference": "Gen 11:4,9"},
+    {"question": "What is the common name of the prayer that Jesus taught to his disciples?", "correct": "The Lord's Prayer", "reference": "Matt 6:9"},
+    {"question": "Whose name means 'father of a great multitude'?", "correct": "Abraham", "reference": "Gen 17:5"},
+    {"question": "Of what did Potiphar's wife falsely accuse Joseph resulting in him being thrown into prison?", "correct": "Rape", "reference": "Gen 39:12-20"},
+    {"question": "Which sea did the Israelites cross through to escape the Egyptians?", "correct": "Red Sea", "reference": "Exo 13:18"},
+    {"question": "What is 'more difficult than a camel going through the eye of a needle'?", "correct": "A rich man entering the Kingdom of God", "reference": "Matt 19:24"},
+    {"question": "For how many years did the Israelites wander in the wilderness?", "correct": "Forty", "reference": "Josh 5:6"},
+    {"question": "What does a 'good tree' bring forth?", "correct": "Good fruit", "reference": "Matt 7:17"},
+    {"question": "Which small body part can 'boast of great things'?", "correct": "Tongue", "reference": "Jam 3:5"},
+    {"question": "What was the name of Abraham's first wife?", "correct": "Sarah", "reference": "Gen 17:15"},
+    {"question": "What did God do on the seventh day, after he had finished creating everything?", "correct": "Rested", "reference": "Gen 2:1-3"},
+    {"question": "On what day did the apostles receive the Holy Spirit?", "correct": "Day of Pentecost", "reference": "Acts 2:1-4"},
+    {"question": "At the Last Supper, what items of food and drink did Jesus give thanks for?", "correct": "Bread and wine", "reference": "Matt 26:26-27"},
+    {"question": "When Jesus was in the wilderness, what was he tempted to turn into loaves of bread?", "correct": "Stones", "reference": "Matt 4:3"},
+    {"question": "What were the religious leaders called who continually tried to trap Jesus with their questions?", "correct": "Pharisees and Sadducees", "reference": "Mark 10:2"},
+    {"question": "What miracle did Jesus do for Lazarus?", "correct": "Raised him from the dead", "reference": "John 11:43-44"},
+    {"question": "On which mountain were the Israelites given the Ten Commandments?", "correct": "Mt. Sinai", "reference": "Exo 34:32"},
+    {"question": "Who was Solomon's father?", "correct": "David", "reference": "1 Ki 2:12"},
+    {"question": "What job did Jesus' earthly father, Joseph, do?", "correct": "Carpenter", "reference": "Matt 13:55"},
+    {"question": "How did Judas betray Christ?", "correct": "With a kiss", "reference": "Luke 22:48"},
+    {"question": "Solomon judged wisely over the rightful mother of a child, but how did he determine who the child belonged to?", "correct": "Threatened to divide the child (with a sword)", "reference": "1 Ki 3:25"},
+    {"question": "Whose father was prepared to sacrifice him on an altar?", "correct": "Isaac", "reference": "Gen 22:9"},
+    {"question": "At the age of twelve, Jesus was left behind in Jerusalem. Where did his parents find him?", "correct": "In the temple", "reference": "Luke 2:42-46"},
+    {"question": "When the disciples saw Jesus walking on water, what did they think he was?", "correct": "A ghost", "reference": "Matt 14:26"},
+    {"question": "What gift did Salome, daughter of Herodias, ask for after she danced for Herod?", "correct": "John the Baptist's head", "reference": "Matt 14:6-8"},
+    {"question": "How did Samson kill all the people in the temple?", "correct": "Pushed the pillars over and the temple collapsed", "reference": "Jdg 16:30"},
+    {"question": "Which musical instrument did David play for Saul?", "correct": "Harp", "reference": "1 Sam 16:23"},
+    {"question": "What was Esau doing while Jacob stole his blessing?", "correct": "Hunting", "reference": "Gen 27:1-3,23"},
+    {"question": "Why did Jacob initially send Joseph's brothers into Egypt?", "correct": "To buy corn", "reference": "Gen 42:2-3"},
+    {"question": "Who was David's great friend?", "correct": "Jonathan", "reference": "1 Sam 18:1"},
+    {"question": "Who said 'thy God shall be my God'?", "correct": "Ruth", "reference": "Ruth 1:16"},
+    {"question": "Which of Christ's belongings did the soldiers cast lots for after they had crucified him?", "correct": "His (seamless) coat", "reference": "Matt 27:35"},
+    {"question": "What does the name Emmanuel mean?", "correct": "God with us", "reference": "Matt 1:23"},
+    {"question": "What does James say we should do if we lack wisdom?", "correct": "Ask God for wisdom, in faith", "reference": "Jam 1:5"},
+    {"question": "Where did Jesus meet the woman of Samaria?", "correct": "By a well", "reference": "John 4:7"},
+    {"question": "Which disciple tried to walk on water, as Jesus did?", "correct": "Peter", "reference": "Matt 14:29"},
+    {"question": "Why did Elimelech go to live in Moab with his family?", "correct": "Famine in his home town", "reference": "Ruth 1:1-2"},
+    {"question": "Who lied about the price they received for a piece of land and died as a result?", "correct": "Ananias & Sapphira", "reference": "Acts 5:1-11"},
+    {"question": "With whom did David commit adultery?", "correct": "Bathsheba", "reference": "2 Sam 11:4"},
+    {"question": "When the Prodigal Son returned, his father gave him a robe, shoes and what other item?", "correct": "Ring", "reference": "Luke 15:22"},
+    {"question": "How many books are there in the Bible?", "correct": "Sixty-six", "reference": "Gen 1:1 - Rev 22:21"},
+    {"question": "What are the names of Lazarus's sisters?", "correct": "Mary and Martha", "reference": "John 11:1-3"},
+    {"question": "Where did Jonah go after being thrown overboard and reaching dry land?", "correct": "Nineveh", "reference": "Jon 3:3"},
+    {"question": "For what did Esau sell his birthright to Jacob?", "correct": "A meal", "reference": "Gen 25:30-34"},
+    {"question": "What happened to Elimelech in Moab?", "correct": "He died", "reference": "Ruth 1:3"},
+    {"question": "What does the shepherd in the parable of the lost sheep do once he realizes one is missing?", "correct": "Goes and looks for it", "reference": "Matt 18:12"},
+    {"question": "What is the name of the disciple who betrayed Jesus?", "correct": "Judas Iscariot", "reference": "Mark 14:10"},
+    {"question": "What golden animal did the Israelites make as an idol?", "correct": "Calf", "reference": "Exo 32:4"},
+    {"question": "Who did Jesus appear to first after his resurrection?", "correct": "Mary Magdalene", "reference": "Mark 16:9"},
+    {"question": "What job did Peter and Andrew do?", "correct": "Fishermen", "reference": "Matt 4:18"},
+    {"question": "Which prophet tried to flee from God when asked to preach God's message in Nineveh?", "correct": "Jonah", "reference": "Jon 1:2-3"},
+    {"question": "What is the collective name of the stories Jesus told to convey his message?", "correct": "Parables", "reference": "Matt 13:10-13"},
+    {"question": "What was noticeable about Jacob's twin brother, Esau, at birth?", "correct": "He was red and hairy", "reference": "Gen 25:25"},
+    {"question": "Who wanted to kill Jesus when he was a baby?", "correct": "Herod (the Great)", "reference": "Matt 2:13"},
+    {"question": "What did the earth look like in the beginning?", "correct": "Without form and empty", "reference": "Gen 1:2"},
+    {"question": "How did the father first respond upon seeing the Prodigal Son returning home?", "correct": "He ran out and embraced him", "reference": "Luke 15:20"},
+    {"question": "Which well known Psalm of David contains the line, 'he maketh me to lie down in green pastures'?", "correct": "Psalm 23", "reference": "Ps 23:2"},
+    {"question": "Abraham's wife, Sarah, bore a special son. What was his name?", "correct": "Isaac", "reference": "Gen 17:19"},
+    {"question": "Which son did Jacob love more than all the others?", "correct": "Joseph", "reference": "Gen 37:3"},
+    {"question": "Who was Jacob's grandfather?", "correct": "Abraham", "reference": "Matt 1:2"},
+    {"question": "To which city will all nations one day go to worship God?", "correct": "Jerusalem", "reference": "Zec 14:16"},
+    {"question": "Who said, 'I am the true vine'?", "correct": "Jesus", "reference": "John 15:1"},
+    {"question": "When there was no water to drink in the wilderness, how did Moses provide it?", "correct": "God told him to strike a rock", "reference": "Exo 17:6"},
+    {"question": "To which tribe did Jesus belong?", "correct": "Judah", "reference": "Heb 7:14"},
+    {"question": "What tragedy did Jacob think had happened to Joseph?", "correct": "An evil beast had devoured him", "reference": "Gen 37:33"},
+    {"question": "What affliction did Hannah suffer from, that allowed Peninnah to provoke her?", "correct": "She was barren", "reference": "1 Sam 1:6"},
+    {"question": "Which is the gate that 'leads to life'?", "correct": "The narrow gate", "reference": "Matt 7:14"},
+    {"question": "What happened to the man who built his house upon the sand?", "correct": "His house fell flat", "reference": "Matt 7:27"},
+    {"question": "What was the relationship of Mary (mother of Jesus) to Elisabeth?", "correct": "Cousin", "reference": "Luke 1:36"},
+    {"question": "How should we treat those who are our enemies, according to Jesus?", "correct": "Love your enemies, bless them that curse you", "reference": "Matt 5:44"},
+    {"question": "Who said, 'Thou art my beloved Son, in thee I am well pleased'?", "correct": "God", "reference": "Mark 1:11"},
+    {"question": "Which son did Jacob not send to Egypt for grain during the famine?", "correct": "Benjamin", "reference": "Gen 42:4"},
+    {"question": "What does the word 'gospel' mean?", "correct": "Good news", "reference": "Mark 1:1"},
+    {"question": "Who suggested that Jonah be thrown overboard?", "correct": "Jonah himself", "reference": "Jon 1:12"},
+    {"question": "What did Ruth do to Boaz while he was sleeping?", "correct": "Uncovered his feet and lay down next to him", "reference": "Ruth 3:7"},
+    {"question": "As Esau grew, he was described as a what...?", "correct": "Cunning hunter", "reference": "Gen 25:27"},
+    {"question": "When Jesus went to dinner at Simon the Pharisee's house, what did a woman do for him?", "correct": "Washed and anointed his feet with precious ointment", "reference": "Luke 7:36-46"},
+    {"question": "What was Bathsheba doing when David first saw her?", "correct": "Washing herself", "reference": "2 Sam 11:2"},
+    {"question": "When the law was given to the children of Israel, what were they told not to worship?", "correct": "Other gods", "reference": "Exo 34:14"},
+    {"question": "Who ran from Mount Carmel to Samaria faster than Ahab could drive his chariot?", "correct": "Elijah", "reference": "1 Ki 18:44-46"},
+    {"question": "How many sons did Jacob (Israel) have?", "correct": "Twelve", "reference": "Gen 35:22"},
+    {"question": "Which disciple wanted to see the imprint of the nails before he would believe?", "correct": "Thomas", "reference": "John 20:24-25"},
+    {"question": "Which king dreamed about a large statue of a man made from different metals?", "correct": "Nebuchadnezzar", "reference": "Dan 2"},
+    {"question": "What form did the Holy Spirit take at the baptism of Jesus?", "correct": "Dove", "reference": "Luke 3:22"},
+    {"question": "Complete the saying of Jesus: 'for the tree is known by his ____'", "correct": "Fruit", "reference": "Matt 12:33"},
+    {"question": "What miracle did Jesus perform at the marriage in Cana?", "correct": "Water into wine", "reference": "John 2:1-11"},
+    {"question": "What was the first thing Noah built when he came out of the ark?", "correct": "Altar", "reference": "Gen 8:20"},
+    {"question": "Who claimed that the golden calf simply came out of the fire?", "correct": "Aaron", "reference": "Exo 32:24"},
+    {"question": "Towards which city was Saul travelling when he encountered a light from heaven?", "correct": "Damascus", "reference": "Acts 9:3"},
+    {"question": "What did the sailors of the ship Jonah was on do to increase their chances of survival?", "correct": "Threw the cargo overboard", "reference": "Jon 1:5"},
+    {"question": "Who was Jacob's mother?", "correct": "Rebekah", "reference": "Gen 27:11"},
+    {"question": "How long will the Kingdom of God last?", "correct": "Forever", "reference": "2 Pe 1:11"},
+    {"question": "Which is the longest Psalm?", "correct": "Psalm 119", "reference": "Ps 119"},
+    {"question": "In which town was Jesus born?", "correct": "Bethlehem", "reference": "Matt 2:1"},
+    {"question": "How were sins forgiven in the Old Testament?", "correct": "Animal sacrifice", "reference": "Lev 4"},
+    {"question": "How were the Thessalonians told to pray?", "correct": "Without ceasing", "reference": "1 Th 5:17"},
+    {"question": "What happened to the city of Jericho after the priests blew their trumpets?", "correct": "Walls fell down", "reference": "Josh 6:20"},
+    {"question": "Which garden did Jesus go to, to pray in before his arrest?", "correct": "Gethsemane", "reference": "Matt 26:36"},
+    {"question": "Who was instructed by God to leave his home and family to travel to a country he did not know?", "correct": "Abraham", "reference": "Gen 12:1"},
+    {"question": "What was Jesus teaching about when he said, 'What therefore God hath joined together, let not man put asunder'?", "correct": "Marriage", "reference": "Matt 19:6"},
+    {"question": "In the Lord’s Prayer, what follows the line, 'Hallowed be thy name'?", "correct": "Thy kingdom come", "reference": "Matt 6:10"},
+    {"question": "What was Jonah found doing on the ship while the storm was raging?", "correct": "Sleeping", "reference": "Jon 1:5"},
+    {"question": "Five of the Ten Virgins did not take enough of what?", "correct": "Oil", "reference": "Matt 25:3"},
+    {"question": "What was the name of Joseph’s master in Egypt?", "correct": "Potiphar", "reference": "Gen 37:36"},
+    {"question": "Aaron turned his rod into a serpent before Pharaoh, and Pharaoh’s magicians did likewise, but what happened to their serpents?", "correct": "Aaron’s rod swallowed them", "reference": "Exo 7:12"},
+    {"question": "To which country did Mary and Joseph escape when Herod killed all the babies in Bethlehem?", "correct": "Egypt", "reference": "Matt 2:13-14"},
+    {"question": "What is the name of the angel who appeared to Mary?", "correct": "Gabriel", "reference": "Luke 1:26"},
+    {"question": "Which land did the Lord promise to Abram?", "correct": "Canaan", "reference": "Gen 17:8"},
+    {"question": "What should we 'seek first'?", "correct": "The Kingdom of God and his righteousness", "reference": "Matt 6:33"},
+    {"question": "Which Psalm contains the line, 'He leads me beside the still waters'?", "correct": "Psalm 23", "reference": "Ps 23:2"},
+    {"question": "In the parable of the ten virgins, what were they waiting for?", "correct": "Bridegroom", "reference": "Matt 25:1"},
+    {"question": "What event occurred to help release Paul and Silas from prison?", "correct": "Earthquake", "reference": "Acts 16:26"},
+    {"question": "Which prisoner did the crowd call for to be released when Pilate asked them?", "correct": "Barabbas", "reference": "Matt 27:21"},
+    {"question": "How does James say we should 'treat the rich and the poor'?", "correct": "Do not judge them, but treat them impartially", "reference": "Jam 2:1-4"},
+    {"question": "How many plagues did God send on Egypt?", "correct": "Ten", "reference": "Exo 7:14-12:30"},
+    {"question": "When Jesus asked 'whom say ye that I am?' what did Peter reply?", "correct": "Thou art the Christ, the Son of the Living God", "reference": "Matt 16:16"},
+    {"question": "What did King Solomon ask for when God appeared to him in a dream?", "correct": "Wisdom", "reference": "1 Ki 3:9"},
+    {"question": "Who said, 'Whosoever shall not receive the kingdom of God as a little child shall not enter therein'?", "correct": "Jesus", "reference": "Luke 18:16-17"},
+    {"question": "How did the angel of the Lord appear to Moses, when he was a shepherd?", "correct": "From within a burning bush", "reference": "Exo 3:2"},
+    {"question": "Which of David’s descendants will reign forever?", "correct": "Jesus", "reference": "Luke 1:32-33"},
+    {"question": "On what mountain did Moses receive the law from God?", "correct": "Mount Sinai", "reference": "Lev 26:46"},
+    {"question": "Which of his wives did Jacob love the most?", "correct": "Rachel", "reference": "Gen 29:30"},
+    {"question": "What was the name of the ark where the commandments given to Moses were to be kept?", "correct": "Ark of the Covenant", "reference": "Deut 10:2,8"},
+    {"question": "What did Jesus say to those who accused the adulteress?", "correct": "He that is without sin, let him first cast a stone", "reference": "John 8:7"},
+    {"question": "Where is the 'best place to pray'?", "correct": "In your closet with the door shut", "reference": "Matt 6:6"},
+    {"question": "What does James say happens if we 'draw nigh to God'?", "correct": "He will draw nigh to us", "reference": "Jam 4:8"},
+    {"question": "Where was Jesus baptized?", "correct": "River Jordan", "reference": "Mark 1:9"},
+    {"question": "Which plant is 'the least of all seeds, but when it is grown, it is the greatest among herbs'?", "correct": "Mustard", "reference": "Matt 13:31-32"},
+    {"question": "Which city 'came down from heaven prepared as a bride'?", "correct": "New Jerusalem", "reference": "Rev 21:2"},
+    {"question": "At Capernaum, how did the man sick of the palsy gain access to the house in which Jesus was?", "correct": "Through the roof", "reference": "Mark 2:4"},
+    {"question": "What did God breathe into Adam’s nostrils?", "correct": "The breath of life", "reference": "Gen 2:7"},
+    {"question": "What did Pharaoh’s dream of good and bad ears of wheat represent?", "correct": "Seven years of plenty followed by seven years of famine", "reference": "Gen 41:29"},
+    {"question": "To whom was the Revelation of Jesus Christ given?", "correct": "John", "reference": "Rev 1:1"},
+    {"question": "How long was Jonah stuck inside the great fish for?", "correct": "Three days", "reference": "Jon 1:17"},
+    {"question": "When Jesus walked on water, which sea was it?", "correct": "Sea of Galilee", "reference": "John 6:1-19"},
+    {"question": "Who told Joseph that Jesus would save his people from their sins?", "correct": "Angel of the Lord", "reference": "Matt 1:21"},
+    {"question": "Where did the man who received one talent from his master hide it?", "correct": "In the ground", "reference": "Matt 25:25"},
+    {"question": "To whom did Jesus say, 'Why are ye fearful, O ye of little faith'?", "correct": "The disciples", "reference": "Matt 8:26"},
+    {"question": "What was the name of Hagar’s son?", "correct": "Ishmael", "reference": "Gen 16:15"},
+    {"question": "Who was Jacob’s first wife?", "correct": "Leah", "reference": "Gen 29"},
+    {"question": "What was Jesus wrapped in when he was born?", "correct": "Swaddling clothes", "reference": "Luke 2:7"},
+    {"question": "What did the Israelites do whilst Moses was receiving the Ten Commandments from God?", "correct": "Made a golden calf", "reference": "Deut 9:15-16"},
+    {"question": "What guided the Israelites through the wilderness?", "correct": "A pillar of cloud and of fire", "reference": "Exo 13:21"},
+    {"question": "At what age did Jesus start his ministry?", "correct": "Thirty", "reference": "Luke 3:23"},
+    {"question": "What animal spoke to Balaam?", "correct": "Donkey", "reference": "Num 22:28"},
+    {"question": "What is the last book of the Old Testament?", "correct": "Malachi", "reference": "Mal 4:6 - Matt 1:1"},
+    {"question": "What happened to Daniel after he gave thanks to God by his open window?", "correct": "He was thrown into the lions’ den", "reference": "Dan 6:10,16"},
+    {"question": "What was Jonah’s reaction to the way the people of the city of Nineveh responded to God’s message?", "correct": "He was angry", "reference": "Jon 4:1"},
+    {"question": "Zacharias and Elizabeth were told by an angel that they would have a son. What was he to be called?", "correct": "John", "reference": "Luke 1:13"},
+    {"question": "How did Jesus say we should receive the Kingdom of God?", "correct": "As a little child", "reference": "Luke 18:17"},
+    {"question": "What happened to anyone who was not found written in the book of life?", "correct": "They were cast in the lake of fire", "reference": "Rev 20:15"},
+    {"question": "In his Sermon on the Mount, what does Jesus say about tomorrow?", "correct": "Take no thought for it", "reference": "Matt 6:34"},
+    {"question": "What did Joseph instruct to be put in Benjamin’s sack?", "correct": "His grain money and a silver cup", "reference": "Gen 44:2"},
+    {"question": "What did Paul do to the soothsayer which made her masters unhappy?", "correct": "Commanded the spirit of divination to leave her", "reference": "Acts 16:18-19"},
+    {"question": "What was the name of the place where Jesus Christ was crucified?", "correct": "Golgotha", "reference": "John 19:17"},
+    {"question": "What object featured in Jacob’s dream at Bethel?", "correct": "Ladder", "reference": "Gen 28:12"},
+    {"question": "What are the names of Joseph’s parents?", "correct": "Jacob and Rachel", "reference": "Gen 46:19"},
+    {"question": "What animal did Samson kill on his way to Timnah?", "correct": "Lion", "reference": "Jdg 14:6"},
+    {"question": "What was the name of Ruth’s second husband?", "correct": "Boaz", "reference": "Ruth 4:13"},
+    {"question": "Complete this common phrase of thanksgiving found in the Bible: “O give thanks unto the Lord; for he is good: for his _____ endureth for ever.”", "correct": "Mercy", "reference": "Ps 106:1"},
+    {"question": "Who wrote the majority of the Psalms?", "correct": "David", "reference": "Ps 1 - 150"},
+    {"question": "Which prophet anointed David as king?", "correct": "Samuel", "reference": "1 Sam 16:13"},
+    {"question": "A “soft answer turneth away...” what?", "correct": "Wrath", "reference": "Pro 15:1"},
+    {"question": "What job did the Prodigal Son end up taking after he had spent his inheritance?", "correct": "Pig feeder", "reference": "Luke 15:15"},
+    {"question": "Why shouldn’t we give anyone the title of “Father”?", "correct": "We have one father, who is in heaven", "reference": "Matt 23:9"},
+    {"question": "What kind of water does Jesus discuss with the Samaritan woman at the well?", "correct": "Living water", "reference": "John 4:10"},
+    {"question": "How did Jesus heal the blind man?", "correct": "He covered his eyes with clay and told him to wash", "reference": "John 9:6-7"},
+    {"question": "Where did Jesus find Zacchaeus, the tax collector?", "correct": "Up a tree", "reference": "Luke 19:4-5"},
+    {"question": "What is the name of Jesus’ cousin, born six months before him?", "correct": "John", "reference": "Luke 1:36"},
+    {"question": "Who was the first child born?", "correct": "Cain", "reference": "Gen 4:1"},
+    {"question": "Which Apostle, who was described as “full of grace and power, and doing great wonders and signs among the people”, was stoned to death?", "correct": "Stephen", "reference": "Acts 7:59"},
+    {"question": "Who deceived Jacob by giving Leah as a wife instead of Rachel?", "correct": "Laban", "reference": "Gen 29:25"},
+    {"question": "What did Jesus send disciples to fetch on his triumphal entry into Jerusalem?", "correct": "Donkey and colt", "reference": "Matt 21:1-2"},
+    {"question": "In the parable of the lost sheep, how many sheep did the shepherd count safely into the fold?", "correct": "Ninety-nine", "reference": "Matt 18:12"},
+    {"question": "What does James say we should say when we make our future plans?", "correct": "If the Lord will, I will do this or that", "reference": "Jam 4:15"},
+    {"question": "What type of coin did Judas accept as payment for betraying Jesus?", "correct": "Silver", "reference": "Matt 26:15"},
+    {"question": "What was the writer of the letter asking of Philemon?", "correct": "To receive his slave back as a brother in Christ", "reference": "Phm 1:17"},
+    {"question": "What was the covenant between God and Noah?", "correct": "Never to flood the earth again", "reference": "Gen 9:11"},
+    {"question": "Which prophet said, “Behold, a virgin shall be with child, and shall bring forth a son”?", "correct": "Isaiah", "reference": "Isa 7:14"},
+    {"question": "To what object does James compare the tongue?", "correct": "The rudder on a ship", "reference": "Jam 3:4"},
+    {"question": "Which of David’s sons rebelled against him?", "correct": "Absalom", "reference": "2 Sam 15"},
+    {"question": "What does Paul say about women’s long hair?", "correct": "It is a glory to her", "reference": "1 Cor 11:15"},
+    {"question": "What did Naomi tell the people in Bethlehem to call her?", "correct": "Mara", "reference": "Ruth 1:20"},
+    {"question": "When Jesus told his disciples to beware of the “leaven of the Pharisees and Sadducees”, to what was he referring?", "correct": "The doctrines of the Pharisees and Sadducees", "reference": "Matt 16:12"},
+    {"question": "How was Daniel protected from the lions in the den?", "correct": "An angel shut their mouths", "reference": "Dan 6:22"},
+    {"question": " “Everyone that is proud in heart” is what to the Lord?", "correct": "An abomination", "reference": "Pro 16:5"},
+    {"question": "What did John the Baptist say when he saw Jesus?", "correct": "Behold the Lamb of God!", "reference": "John 1:29"},
+    {"question": "How did the city that Jonah was sent to react to God’s message of destruction?", "correct": "They repented", "reference": "Jon 3:8"},
+    {"question": "Who asked Jesus to remember him when he came into his kingdom?", "correct": "The criminal on the cross", "reference": "Luke 23:42"},
+    {"question": "Of what, specifically, was man not allowed to eat in the Garden of Eden?", "correct": "Tree of knowledge of good and evil", "reference": "Gen 2:17"},
+    {"question": "What was Solomon famous for building?", "correct": "Temple", "reference": "1 Ki 7:51"},
+    {"question": "Jesus asked: “Can the blind lead the....?”", "correct": "Blind", "reference": "Luke 6:39"},
+    {"question": "Who told Peter to “watch and pray that he entered not into temptation”?", "correct": "Jesus", "reference": "Matt 26:40-41"},
+    {"question": "What is Paul’s command to husbands in his letter to the Colossians?", "correct": "Love your wives, and do not be bitter towards them", "reference": "Col 3:19"},
+    {"question": "What are the names of Joseph’s parents?", "correct": "Jacob and Rachel", "reference": "Gen 46:19"},
+    {"question": "Who was the first child born?", "correct": "Cain", "reference": "Gen 4:1"},
+    {"question": "What is the name of Jesus’ cousin, born six months before him?", "correct": "John", "reference": "Luke 1:36"},
+    {"question": "Who deceived Jacob by giving Leah as a wife instead of Rachel?", "correct": "Laban", "reference": "Gen 29:25"},
+    {"question": "Which of David’s sons rebelled against him?", "correct": "Absalom", "reference": "2 Sam 15"},
+    {"question": "Who was the father of Isaac?", "correct": "Abraham", "reference": "Gen 21:3"},
+    {"question": "Who was the mother of Solomon?", "correct": "Bathsheba", "reference": "2 Sam 12:24"},
+    {"question": "Who was the grandfather of Noah?", "correct": "Methuselah", "reference": "Gen 5:25-27"},
+    {"question": "What was the name of Ruth’s second husband?", "correct": "Boaz", "reference": "Ruth 4:13"},
+    {"question": "Who was the father of Esau and Jacob?", "correct": "Isaac", "reference": "Gen 25:26"},
+    {"question": "Which river was Naaman told to wash in to rid himself of leprosy?", "correct": "Jordan", "reference": "2 Ki 5:10"},
+    {"question": "What miracle had Jesus performed when he said, 'It is I; be not afraid'?", "correct": "Walking on water", "reference": "John 6:19-20"},
+    {"question": "Why did Solomon turn away from God when he was old?", "correct": "His foreign wives turned his heart after other gods", "reference": "1 Ki 11:4"},
+    {"question": "What is the 'chorus' in Psalm 136 which is repeated in every verse?", "correct": "For his mercy endureth forever", "reference": "Ps 136"},
+    {"question": "In what city was Jesus brought up as a child?", "correct": "Nazareth", "reference": "Matt 2:23"},
+    {"question": "Which female judge described herself as 'a mother in Israel'?", "correct": "Deborah", "reference": "Jdg 5:7"},
+    {"question": "After the angels had announced the birth of Christ and left the shepherds, what did the shepherds do?", "correct": "Went quickly to Bethlehem", "reference": "Luke 2:15-16"},
+    {"question": "According to Peter, what 'covers a multitude of sins'?", "correct": "Love", "reference": "1 Pe 4:8"},
+    {"question": "In prison, for whom did Joseph interpret dreams?", "correct": "The butler and the baker", "reference": "Gen 40:5"},
+    {"question": "To what preservative does the Lord compare his disciples?", "correct": "Salt", "reference": "Matt 5:13"},
+    {"question": "What was Jesus’ first miracle?", "correct": "Changing water into wine", "reference": "John 2:11"},
+    {"question": "Who spotted Moses in the Nile placed in an ark of bulrushes?", "correct": "Pharaoh’s daughter", "reference": "Exo 2:5"},
+    {"question": "Who was Bathsheba’s first husband?", "correct": "Uriah", "reference": "2 Sam 11:3"},
+    {"question": "Why were Daniel’s three friends thrown into the fiery furnace?", "correct": "They wouldn’t bow down to Nebuchadnezzar’s golden image", "reference": "Dan 3:11-12"},
+    {"question": "Out of the ten lepers who Jesus healed, how many came back to say thank you?", "correct": "One", "reference": "Luke 17:15"},
+    {"question": "What did Jesus say the sellers had turned his house of prayer into?", "correct": "A den of thieves", "reference": "Luke 19:46"},
+    {"question": "In the New Jerusalem where are the names of the twelve tribes written?", "correct": "On the twelve gates", "reference": "Rev 21:12"},
+    {"question": "How often was the year of the Lord’s release?", "correct": "Every seven years", "reference": "Deut 15:1-2"},
+    {"question": "Which tribe of Israel looked after the religious aspects of life?", "correct": "Levi", "reference": "Num 18:20-24"},
+    {"question": "Where was Paul when he wrote the letter to Philemon?", "correct": "In prison", "reference": "Phm 1:23"},
+    {"question": "Who preached, 'Repent ye: for the kingdom of heaven is at hand'?", "correct": "John the Baptist", "reference": "Matt 3:1-2"},
+    {"question": "What was the name of James’ and John’s father?", "correct": "Zebedee", "reference": "Mark 10:35"},
+    {"question": "What bird did God provide to the Israelites for meat in the wilderness?", "correct": "Quail", "reference": "Exo 16:13"},
+    {"question": "Who closed the door of Noah’s ark?", "correct": "God", "reference": "Gen 7:16"},
+    {"question": "'Hate stirs up strife', but what does love cover?", "correct": "All sins", "reference": "Pro 10:12"},
+    {"question": "Who wrote the line: 'The Lord is my Shepherd, I shall not want'?", "correct": "David", "reference": "Ps 23:1"},
+    {"question": "Which prisoners experienced an earthquake after their prayer?", "correct": "Paul and Silas", "reference": "Acts 16:26"},
+    {"question": "What was the name of Joseph’s youngest brother?", "correct": "Benjamin", "reference": "Gen 44:12"},
+    {"question": "Who did Jesus pray for that his faith failed not?", "correct": "(Simon) Peter", "reference": "Luke 22:32"},
+    {"question": "What was the new name given to Daniel while in captivity?", "correct": "Belteshazzar", "reference": "Dan 1:7"},
+    {"question": "Which wise man wrote the majority of Proverbs?", "correct": "Solomon", "reference": "Pro 1:1"},
+    {"question": "Which king asked for the foreskins of 100 Philistines?", "correct": "Saul", "reference": "1 Sam 18:25"},
+    {"question": "Who rolled away the tomb stone?", "correct": "An Angel", "reference": "Matt 28:2"},
+    {"question": "What did Samson find in the carcass of the animal he had killed at a later time?", "correct": "Bees and honey", "reference": "Jdg 14:8"},
+    {"question": "What is 'friendship with the world', according to James?", "correct": "Enmity with God", "reference": "Jam 4:4"},
+    {"question": "Who said 'glory to God in the highest, and on earth peace, goodwill to men'?", "correct": "Angels", "reference": "Luke 2:13-14"},
+    {"question": "In which book of the Bible does the story of Noah’s ark appear?", "correct": "Genesis", "reference": "Gen 6 - 8"},
+    {"question": "When Samuel was called by the Lord as a child, who did he think was calling?", "correct": "Eli, the priest", "reference": "1 Sam 3:2-6"},
+    {"question": "To whom did Jesus say 'Truly, truly, I say to you, unless one is born again he cannot see the kingdom of God'?", "correct": "Nicodemus", "reference": "John 3:3"},
+    {"question": "Who does Paul say is head of the woman?", "correct": "Man", "reference": "1 Cor 11:3"},
+    {"question": "Who sang a song celebrating the downfall of Sisera?", "correct": "Deborah & Barak", "reference": "Jdg 5:1"},
+    {"question": "What happens to 'treasure laid up on earth'?", "correct": "Becomes corrupted and thieves steal it", "reference": "Matt 6:19"},
+    {"question": "Whose mother was instructed to drink no wine or strong drink during her pregnancy?", "correct": "Samson’s", "reference": "Jdg 13:7"},
+    {"question": "Who was the successor to Moses?", "correct": "Joshua", "reference": "Josh 1:1-6"},
+    {"question": "What should you not 'throw before swine'?", "correct": "Pearls", "reference": "Matt 7:6"},
+    {"question": "What was the name of the woman who hid the spies at Jericho?", "correct": "Rahab", "reference": "Josh 2:3-4"},
+    {"question": "In the letter to the Corinthians, who does Paul say is a 'new creature'?", "correct": "Any man in Christ", "reference": "2 Cor 5:17"},
+    {"question": "Which prophet is recorded as having an earnest prayer for no rain answered?", "correct": "Elijah", "reference": "Jam 5:17"},
+    {"question": "According to Thessalonians, what will happen to the believers alive at the return of Christ?", "correct": "They will be caught up together in the clouds", "reference": "1 Th 4:17"},
+    {"question": "How did the Philistines discover the answer to Samson’s riddle?", "correct": "They threatened Samson’s bride, who told them", "reference": "Jdg 14:15"},
+    {"question": "When he was approached by Jesus, who said, 'What have you to do with me, Jesus, Son of the Most High God? I adjure you by God, do not torment me.'?", "correct": "Legion", "reference": "Mark 5:7"},
+    {"question": "What was the reason that Jacob and his family began a new life in Egypt?", "correct": "Famine in Canaan", "reference": "Gen 47:4"},
+    {"question": "How was Isaac’s wife chosen?", "correct": "His father sent a servant back to Mesopotamia to choose a wife from his own family", "reference": "Gen 24"},
+    {"question": "Whose father was so pleased to see him that he gave him the best robe and killed the fatted calf?", "correct": "Prodigal son", "reference": "Luke 15:23-24"},
+    {"question": "What was the name of Solomon’s son who succeeded him as king?", "correct": "Rehoboam", "reference": "1 Ki 11:43"},
+    {"question": "How did the people listening to the Sermon on the Mount view Jesus’ teachings?", "correct": "He taught as one with authority", "reference": "Matt 7:29"},
+    {"question": "What does faith require to make it a living faith?", "correct": "Works", "reference": "Jam 2:17"},
+    {"question": "What did Jesus say you should do if someone asks you to go with them for a mile?", "correct": "Go with them for two miles", "reference": "Matt 5:41"},
+    {"question": "In the parable of the grain of mustard seed, when it becomes a tree birds come and do what?", "correct": "Build nests", "reference": "Matt 13:32"},
+    {"question": "The field that Judas Iscariot purchased with his betrayal money was called Aceldama, but as what was it also known?", "correct": "Field of Blood", "reference": "Acts 1:19"},
+    {"question": "Who did Jesus raise from the dead by a prayer of thanks to God?", "correct": "Lazarus", "reference": "John 11:41"},
+    {"question": "The king’s wrath is as 'the roaring' of what?", "correct": "A lion", "reference": "Pro 19:12"},
+    {"question": "What was the name of Ruth’s son?", "correct": "Obed", "reference": "Ruth 4:17"},
+    {"question": "According to James, what happens if you break one commandment of the law?", "correct": "You are guilty of breaking the whole law", "reference": "Jam 2:10"},
+    {"question": "'Go to the ____, thou sluggard; consider her ways, and be wise.' What animal should we take lessons from?", "correct": "Ant", "reference": "Pro 6:6"},
+    {"question": "How did the wise men know that the King of the Jews had been born?", "correct": "They saw a star in the East", "reference": "Matt 2:2"},
+    {"question": "What test did Elijah set the prophets of Baal, which failed, proving their god to be false?", "correct": "Lighting a fire under the sacrifice on the altar", "reference": "1 Ki 18:24"},
+    {"question": "Who was the tax collector that climbed up a tree so he could see Jesus?", "correct": "Zacchaeus", "reference": "Luke 19:5"},
+    {"question": "What is Jesus’ final commission to his disciples?", "correct": "Teach all nations, baptizing them", "reference": "Matt 28:19"},
+    {"question": "The Lord said that Jacob and Esau were two what in the womb?", "correct": "Nations", "reference": "Gen 25:23"},
+    {"question": "When a man said to Jesus, 'Who is my neighbor?' what parable did Jesus reply with?", "correct": "The good Samaritan", "reference": "Luke 10:29"},
+    {"question": "What happens to the man who 'puts his hand to the plough and looks back'?", "correct": "He is not fit for the Kingdom of God", "reference": "Luke 9:62"},
+    {"question": "What did Samson do to the Philistines’ crops after discovering his bride had been given to someone else?", "correct": "Burned them", "reference": "Jdg 15:5"},
+    {"question": "Who was Jesus talking to when he taught the Lord’s Prayer?", "correct": "Disciples", "reference": "Matt 5:1"},
+    {"question": "Ananias and Sapphira sold some property and secretly kept part of the proceeds for themselves. What happened to them?", "correct": "They died", "reference": "Acts 5:1-11"},
+    {"question": "To the beauty of which plant did Jesus compare to King Solomon?", "correct": "Lilies (of the field)", "reference": "Luke 12:27"},
+    {"question": "What was on top of the Ark of the Covenant?", "correct": "The mercy seat and two cherubim", "reference": "Exo 25:22"},
+    {"question": "Who came to see Jesus by night?", "correct": "Nicodemus", "reference": "John 19:39"},
+    {"question": "For how long was the dragon bound in the bottomless pit?", "correct": "1,000 years", "reference": "Rev 20:1-3"},
+    {"question": "Complete the Beatitude: 'Blessed are the pure in heart...'", "correct": "…for they shall see God.", "reference": "Matt 5:8"},
+    {"question": "For how many pieces of silver did Judas betray Christ?", "correct": "Thirty", "reference": "Matt 26:15"},
+    {"question": "Who did Abram marry?", "correct": "Sarai", "reference": "Gen 11:29"},
+    {"question": "What did Jesus say he would leave with the disciples?", "correct": "Peace", "reference": "John 14:27"},
+    {"question": "What did Paul ask Philemon to have ready for him?", "correct": "A room", "reference": "Phm 1:22"},
+    {"question": "In Egypt, what did Joseph accuse his brothers of at their first meeting?", "correct": "Being spies", "reference": "Gen 42:9"},
+    {"question": "Where did Jesus first see Nathanael?", "correct": "Under the fig tree", "reference": "John 1:48"},
+    {"question": "Which disciple was a tax collector?", "correct": "Matthew (Levi)", "reference": "Luke 5:27"},
+    {"question": "Which city was the letter to Philemon written from?", "correct": "Rome (while under house arrest)", "reference": "Phm 1:23"},
+    {"question": "What horrific act did the women do to their children during the Babylonian siege of Jerusalem?", "correct": "Boiled and ate them", "reference": "Lam 4:10"},
+    {"question": "What does the name Abraham mean?", "correct": "Father of a multitude", "reference": "Gen 17:5"},
+    {"question": "When the Pharisees asked Jesus whether it was lawful to pay taxes to Caesar, what object did he use to answer their question?", "correct": "A penny (denarius)", "reference": "Matt 22:19"},
+    {"question": "When Philip and the Ethiopian eunuch arrive at some water, what does the eunuch say?", "correct": "What is there to stop me getting baptized?", "reference": "Acts 8:36"},
+    {"question": "Who said to Mary, 'Blessed are you among women, and blessed is the fruit of your womb!'?", "correct": "Elisabeth", "reference": "Luke 1:41-42"},
+    {"question": "Seven fat and seven thin of what type of animal appeared to Pharaoh in a dream?", "correct": "Cattle (or Cows)", "reference": "Gen 41:1-4"},
+    {"question": "How old was Sarah when her son Isaac was born?", "correct": "Ninety", "reference": "Gen 17:17; 21:5"},
+    {"question": "About what age was Jesus when he was baptized?", "correct": "Thirty", "reference": "Luke 3:23"},
+    {"question": "Which book comes after the book of Job?", "correct": "Psalms", "reference": "Job 42:17 - Ps 1:1"},
+    {"question": "How many horsemen are there in Revelation chapter 6?", "correct": "Four", "reference": "Rev 6:2-8"},
+    {"question": "What was the first temptation of Christ?", "correct": "To turn a stone into bread", "reference": "Matt 4:3"},
+    {"question": "After the first king of Israel failed God, what was the name of the second man who was anointed king?", "correct": "David", "reference": "1 Sam 16:1,13"},
+    {"question": "What type of tree did Zacchaeus climb to see Jesus?", "correct": "Sycamore", "reference": "Luke 19:4"},
+    {"question": "When Jesus forgave the sins of the sick man let down through the roof to him, to what did the Pharisees object?", "correct": "They thought only God could forgive sins", "reference": "Mark 2:7"},
+    {"question": "What was the name of Abraham’s nephew?", "correct": "Lot", "reference": "Gen 12:5"},
+    {"question": "Israel split into two kingdoms after the reign of King Solomon, with Israel in the north, but what was the name of the southern kingdom?", "correct": "Judah", "reference": "1 Ki 11:31-36; 12:20-21"},
+    {"question": "What did James’ and John’s mother ask of Jesus?", "correct": "For her sons to sit on Jesus’ right and left hands in the kingdom", "reference": "Matt 20:21"},
+    {"question": "What did the dove bring back to Noah?", "correct": "Olive leaf", "reference": "Gen 8:11"},
+    {"question": "How many books are there in the New Testament?", "correct": "Twenty-seven", "reference": "Matt 1:1 - Rev 22:21"},
+    {"question": "Who was appointed to replace Judas Iscariot as a disciple?", "correct": "Matthias", "reference": "Acts 1:26"},
+    {"question": "What did Abraham’s son carry for his sacrifice?", "correct": "The wood", "reference": "Gen 22:6"},
+    {"question": "In which book of the Bible would we find Haman, the son of Hammedatha?", "correct": "Esther", "reference": "Est 3:1"},
+    {"question": "What did Elisha do for the Shunammite’s son?", "correct": "Raised him back to life", "reference": "2 Ki 4:32-37"},
+    {"question": "Which book of the Bible precedes Philemon?", "correct": "Titus", "reference": "Tit 3:15 - Phm 1:1"},
+    {"question": "What were the names of Elimelech’s two sons?", "correct": "Mahlon & Chilion", "reference": "Ruth 1:2"},
+    {"question": "Until when did Jesus remain in Egypt with his parents, when he was a baby?", "correct": "Until the death of Herod the Great", "reference": "Matt 2:15"},
+    {"question": "In the parable of the sower, what does the seed represent?", "correct": "Word of God", "reference": "Luke 8:11"},
+    {"question": "What was the first plague the Lord sent upon Egypt?", "correct": "Water turned into blood", "reference": "Exo 7:21"},
+    {"question": "What did the disciples do when people brought their young children to Jesus?", "correct": "They rebuked them", "reference": "Matt 19:13"},
+    {"question": "Who does Jesus say are the two most important people to love?", "correct": "God and your neighbor", "reference": "Luke 10:27"},
+    {"question": "What happened to Jesus on the 8th day of his life?", "correct": "He was circumcised", "reference": "Luke 2:21"},
+    {"question": "Who looked after the coats of the men who stoned Stephen?", "correct": "Saul", "reference": "Acts 7:58"},
+    {"question": "What profession did Zebedee, father of James and John, have?", "correct": "Fisherman", "reference": "Matt 4:21"},
+    {"question": "Which two sisters married Jacob?", "correct": "Rachel and Leah", "reference": "Gen 29:28"},
+    {"question": "Into which land did God send Abraham to sacrifice his special son, Isaac?", "correct": "Moriah", "reference": "Gen 22:2"},
+    {"question": "In Revelation, what was the wife of the Lamb arrayed in?", "correct": "Fine white linen", "reference": "Rev 19:8"},
+    {"question": "Which Israelite woman had two Moabite daughters-in-law?", "correct": "Naomi", "reference": "Ruth 1:4"},
+    {"question": "When Peter was asked if Jesus paid temple taxes, what animal concealed a coin with which to pay the taxes?", "correct": "Fish", "reference": "Matt 17:27"},
+    {"question": "In Nebuchadnezzar’s dream what did the different metals of the statue represent?", "correct": "Kingdoms of the world", "reference": "Dan 2:37-44"},
+    {"question": "What did God initially give man to eat?", "correct": "Plants and Fruit", "reference": "Gen 2:9,16"},
+    {"question": "Which city did David pray for the peace of?", "correct": "Jerusalem", "reference": "Ps 122:6"},
+    {"question": "What did the crew of the ship Jonah was on do once the storm had ceased?", "correct": "They made sacrifices to God", "reference": "Jon 1:16"},
+    {"question": "How many people were saved in the ark?", "correct": "Eight", "reference": "1 Pe 3:20"},
+    {"question": "What disease did the Lord send upon Miriam?", "correct": "Leprosy", "reference": "Num 12:10"},
+    {"question": "The name of the Lord is like what place of safety?", "correct": "A strong tower", "reference": "Pro 18:10"},
+    {"question": "With what was Jesus’ side pierced?", "correct": "Spear", "reference": "John 19:34"},
+    {"question": "Who wrote the book of Acts?", "correct": "Luke", "reference": "Acts 1:1 (cf Luke 1:3)"},
+    {"question": "What did Jesus say when the Pharisees asked why he ate with publicans and sinners?", "correct": "They that be whole need not a physician, but they that are sick", "reference": "Matt 9:11-12"},
+    {"question": "How did Moses command the Red Sea to divide so the Israelites could cross over?", "correct": "He lifted up his rod and stretched his hand over the sea", "reference": "Exo 14:16,21"},
+    {"question": "Where was Jonah when he prayed to God with the voice of thanksgiving?", "correct": "In the fish’s belly", "reference": "Jon 2:9"},
+    {"question": "What was Noah’s ark made out of?", "correct": "Gopher (cypress) wood", "reference": "Gen 6:14"},
+    {"question": "Who brought Elijah bread and meat to eat during the drought?", "correct": "Ravens", "reference": "1 Ki 17:4"},
+    {"question": "Whose mother-in-law did Jesus heal?", "correct": "(Simon) Peter’s", "reference": "Matt 8:14-15"},
+    {"question": "Which bird does Jesus say we have more value than?", "correct": "Sparrow", "reference": "Matt 10:31"},
+    {"question": "In which city was David’s throne over Israel?", "correct": "Jerusalem", "reference": "2 Sam 5:5"},
+    {"question": "How old was Moses when he died?", "correct": "120", "reference": "Deut 34:7"},
+    {"question": "What event did Peter, James and John witness in a mountain with Jesus?", "correct": "Transfiguration", "reference": "Matt 17:1"},
+    {"question": "Which Apostle was a Pharisee?", "correct": "Paul", "reference": "Acts 23:6"},
+    {"question": "The desolation of which city is described in Revelation chapter 18?", "correct": "Babylon", "reference": "Rev 18:2"},
+    {"question": "Which king in the Old Testament built the first temple in Jerusalem?", "correct": "Solomon", "reference": "2 Chr 3:1"},
+    {"question": "Why did Jesus say we should not 'judge people'?", "correct": "So that we are not judged", "reference": "Matt 7:1"},
+    {"question": "What happened to the prison keeper and his family after finding Paul and Silas released from their chains?", "correct": "They believed and were baptized", "reference": "Acts 16:33"},
+    {"question": "How is man 'tempted'?", "correct": "He is enticed by his own lust", "reference": "Jam 1:14"},
+    {"question": "What natural disaster happened when Abram and Sarai arrived in the land of Canaan?", "correct": "A famine", "reference": "Gen 12:10"},
+    {"question": "Which disciple did Paul commend for having 'the same faith his mother had'?", "correct": "Timothy", "reference": "2 Tim 1:5"},
+    {"question": "What did the shepherds do after they had visited Jesus?", "correct": "Spread the news about Jesus’ birth", "reference": "Luke 2:17"},
+    {"question": "Who went back to Jerusalem after the captivity to encourage the people to build the walls of the city again?", "correct": "Nehemiah", "reference": "Neh 2:17"},
+    {"question": "Who was the first of the apostles to perform a miracle in the name of Jesus?", "correct": "Peter", "reference": "Acts 3:6"},
+    {"question": "How did Korah and his family die after seeking priesthood duties beyond those they already had?", "correct": "They were swallowed up by the earth", "reference": "Num 16:1-35"},
+    {"question": "What was the name of Isaac’s wife?", "correct": "Rebekah", "reference": "Gen 24:67"},
+    {"question": "How does the Bible describe the location of the Garden of Eden?", "correct": "In the east", "reference": "Gen 2:8"},
+    {"question": "In the vision of Jesus in Revelation, what came out of Jesus’ mouth?", "correct": "A sharp sword", "reference": "Rev 19:15"},
+    {"question": "What was Paul’s home town?", "correct": "Tarsus", "reference": "Acts 21:39"},
+    {"question": "Which judge was betrayed to the Philistines by a woman?", "correct": "Samson", "reference": "Jdg 16:5-6"},
+    {"question": "What happened to forty-two of the children who made fun of Elisha’s baldness?", "correct": "Two bears came out of the woods and killed them", "reference": "2 Ki 2:24"},
+    {"question": "What came out of the fire Paul made on Malta and attacked him?", "correct": "Viper", "reference": "Acts 28:3"},
+    {"question": "Who refused to worship Nebuchadnezzar’s golden image?", "correct": "Shadrach, Meshach and Abednego", "reference": "Dan 3:12"},
+    {"question": "In the Sermon on the Mount, what did Jesus say would happen to the meek?", "correct": "They will inherit the earth", "reference": "Matt 5:5"},
+    {"question": "Where did Moses first meet his future wife?", "correct": "By a well in the land of Midian", "reference": "Exo 2:16-21"},
+    {"question": "Out of the ten lepers Jesus healed, what nationality was the one who returned to thank him?", "correct": "Samaritan", "reference": "Luke 17:16"},
+    {"question": "Who did the men of Athens ignorantly worship?", "correct": "The Unknown God", "reference": "Acts 17:22-23"},
+    {"question": "What did Saul see on the road approaching Damascus?", "correct": "A shining light from heaven", "reference": "Acts 9:3"},
+    {"question": "How long did Jonah say it would be before Nineveh was to be overthrown?", "correct": "Forty days", "reference": "Jon 3:4"},
+    {"question": "What was the name of Samson’s father?", "correct": "Manoah", "reference": "Jdg 13:24"},
+    {"question": "Who did Amnon love, and then hate even more than he had loved her?", "correct": "Tamar", "reference": "2 Sam 13:15"},
+    {"question": "Where were the Jews taken captive to when Jerusalem was destroyed?", "correct": "Babylon", "reference": "Jer 29:4"},
+    {"question": "When was the festival of Passover established?", "correct": "When the plague of the death of the firstborn was brought upon the land of Egypt", "reference": "Exo 12:27"},
+    {"question": "What sin did Noah commit after he began to be a 'man of the soil'?", "correct": "Drunkenness", "reference": "Gen 9:20-21"},
+    {"question": "Why were the Israelites afraid to enter the Promised Land?", "correct": "The inhabitants were great and tall", "reference": "Num 13:33-14:4"},
+    {"question": "What did the silversmith do with Micah’s silver?", "correct": "Made it into an idol", "reference": "Jdg 17:4"},
+    {"question": "What was Paul’s profession?", "correct": "Tentmaker", "reference": "Acts 18:3"},
+    {"question": "What was the name of Ahasuerus’ new queen?", "correct": "Esther", "reference": "Est 2:17"},
+    {"question": "According to the words of Jesus in the Sermon on the Mount, 'a city that is on a hill cannot be...' what?", "correct": "Hidden", "reference": "Matt 5:14"},
+    {"question": "What was the fate of Shechem, the prince who fell in love with Dinah, daughter of Jacob?", "correct": "He, his father, and the men of his city were slain by Dinah’s brothers", "reference": "Gen 34"},
+    {"question": "What book of the Bible follows Philemon?", "correct": "Hebrews", "reference": "Phm 1:25 - Heb 1:1"},
+    {"question": "During Jacob’s struggle with the angel, the hollow of which part of Jacob’s body was touched and put out of joint?", "correct": "Hollow of thigh / Hip", "reference": "Gen 32:25"},
+    {"question": "Which Christian doctrine did the Sadducees reject?", "correct": "Resurrection", "reference": "Matt 22:23"},
+    {"question": "For how many years had the woman with the issue of blood suffered before she was healed by Jesus?", "correct": "Twelve years", "reference": "Matt 9:20"},
+    {"question": "What was the affliction of Bartimaeus?", "correct": "Blind", "reference": "Mark 10:46"},
+    {"question": "What was the color of the robe placed on Jesus by the soldiers?", "correct": "Scarlet / Purple", "reference": "Matt 27:28; John 19:2"},
+    {"question": "How did Paul say we should let our requests be made known to God?", "correct": "By prayer and supplication with thanksgiving", "reference": "Php 4:6"},
+    {"question": "In the Sermon on the Mount, what does Jesus tell us the earth is?", "correct": "God’s footstool", "reference": "Matt 5:35"},
+    {"question": "In which book of the Bible do we find 'Nebuchadnezzar’s image'?", "correct": "Daniel", "reference": "Dan 2:31-36"},
+    {"question": "Where was Abraham born?", "correct": "Ur", "reference": "Gen 11:31"},
+    {"question": "Who was given a son following her prayer to God in the temple, during which the priest accused her of being drunk?", "correct": "Hannah", "reference": "1 Sam 1:13"},
+    {"question": "Who asked for an understanding heart to judge God’s people?", "correct": "Solomon", "reference": "1 Ki 3:9"},
+    {"question": "What is 'sin'?", "correct": "The transgression of the law", "reference": "1 Jn 3:4"},
+    {"question": "For how many years did David reign?", "correct": "Forty years", "reference": "2 Sam 5:4"},
+    {"question": "How many Psalms are there in the Bible?", "correct": "150", "reference": "Ps 1:1-150:6"},
+    {"question": "Jesus used a little child to show the futility of an argument among the disciples. What were they arguing about?", "correct": "Who is the greatest in heaven", "reference": "Matt 18:1-4"},
+    {"question": "Whose twelve year old daughter did Jesus raise from the dead?", "correct": "Jairus’", "reference": "Luke 8:41"},
+    {"question": "What was the name of Ruth’s great-grandson?", "correct": "David", "reference": "Ruth 4:22"},
+    {"question": "On what island was John when he was given the vision of Revelation?", "correct": "Patmos", "reference": "Rev 1:9"},
+    {"question": "What happened to King Nebuchadnezzar before being restored as king?", "correct": "He went mad and lived as a beast", "reference": "Dan 4:33-36"},
+    {"question": "Where did Jonah try to run to instead of going to Nineveh as God had commanded?", "correct": "Tarshish", "reference": "Jon 1:3"},
+    {"question": "Who did Paul send to Rome, requesting that she was given a welcome worthy of the saints?", "correct": "Phoebe", "reference": "Rom 16:1-2"},
+    {"question": "Whose mother took him a little coat once a year?", "correct": "Samuel", "reference": "1 Sam 2:19"},
+    {"question": "Which judge killed Eglon, King of Moab?", "correct": "Ehud", "reference": "Jdg 3:15-25"},
+    {"question": "In a parable told by Jesus, what did the rich man do with the surplus of crops that he grew?", "correct": "Built larger barns to store them", "reference": "Luke 12:18"},
+    {"question": "In the parable of the leaven, what is leaven more commonly known as?", "correct": "Yeast", "reference": "Matt 13:33"},
+    {"question": "What bird could poor people use for sacrifices if they could not afford lambs?", "correct": "Turtledoves or Pigeons", "reference": "Lev 5:7"},
+    {"question": "Which book of prophecy was the Ethiopian eunuch reading from?", "correct": "Isaiah", "reference": "Acts 8:30"},
+    {"question": "Who said, 'When I was a child, I spake as a child, I understood as a child, I thought as a child: but when I became a man, I put away childish things'?", "correct": "Paul", "reference": "1 Cor 13:11"},
+    {"question": "What is the first line of Psalm 1?", "correct": "Blessed is the man who walks not in the counsel of the ungodly", "reference": "Ps 1:1"},
+    {"question": "What was Peter's mother-in-law sick with?", "correct": "A fever", "reference": "Matt 8:14"},
+    {"question": "Who instructed her daughter to ask for the head of John the Baptist?", "correct": "Herodias", "reference": "Matt 14:8"},
+    {"question": "Who decreed that a census of the entire Roman world should be taken at the time of Jesus' birth?", "correct": "Augustus Caesar", "reference": "Luke 2:1"},
+    {"question": "Which woman, who was 'full of good works and acts of charity', was raised from the dead by Peter at Lydda?", "correct": "Tabitha", "reference": "Acts 9:40"},
+    {"question": "What did Daniel do for Nebuchadnezzar that no-one else was able to do?", "correct": "Interpret his dreams", "reference": "Dan 2"},
+    {"question": "What was on the head of the woman 'clothed with the sun'?", "correct": "A crown of twelve stars", "reference": "Rev 12:1"},
+    {"question": "How did Uriah, Bathsheba's husband, die?", "correct": "Cut down after David instructed his men to abandon Uriah in battle", "reference": "2 Sam 11:15"},
+    {"question": "When Paul was shipwrecked on Malta how many people on the ship drowned?", "correct": "None", "reference": "Acts 27:22,44"},
+    {"question": "How did Jesus say true worshippers should worship God when he was talking to the woman at the well?", "correct": "In spirit and truth", "reference": "John 4:23-24"},
+    {"question": "Which profession does Jesus compare himself to spiritually?", "correct": "Shepherd", "reference": "John 10:14"},
+    {"question": "Under the Mosaic Law, what was the punishment for someone who hit their father?", "correct": "Death", "reference": "Exo 21:15"},
+    {"question": "What presents did Pharaoh give to Joseph when he was given charge of Egypt?", "correct": "His ring, fine linen and a gold chain", "reference": "Gen 41:42"},
+    {"question": "What was taken off and handed over to signify the agreement between Boaz and the kinsman?", "correct": "Sandal", "reference": "Ruth 4:8"},
+    {"question": "Peacocks were imported by which king of Israel?", "correct": "Solomon", "reference": "1 Ki 10:22"},
+    {"question": "Why did Boaz allow Ruth to glean in his field?", "correct": "She had looked after Naomi", "reference": "Ruth 2:11"},
+    {"question": "What punishment was Zacharias given for not believing the angel?", "correct": "He was made dumb", "reference": "Luke 1:20"},
+    {"question": "Which direction did the scorching wind upon Jonah come from?", "correct": "East", "reference": "Jon 4:8"},
+    {"question": "Why did the kinsman not want to marry Ruth?", "correct": "Didn’t want to spoil his inheritance", "reference": "Ruth 4:6"},
+    {"question": "How many times did Samson lie about his source of strength to Delilah?", "correct": "Three", "reference": "Jdg 16:15"},
+    {"question": "Which book of the Bible begins with 'The book of the generation of Jesus Christ, the son of David, the son of Abraham.'?", "correct": "Matthew", "reference": "Matt 1:1"},
+    {"question": "Jephthah made a vow to God, with what effect on his daughter?", "correct": "Her life was sacrificed to God", "reference": "Jdg 11:30-40"},
+    {"question": "Who did Mary suppose Jesus to be at first after the resurrection?", "correct": "Gardener", "reference": "John 20:15"},
+    {"question": "How did Jesus reveal the one who would betray him?", "correct": "Dipped a piece of bread and passed it to him", "reference": "John 13:26"},
+    {"question": "Which two Old Testament characters appeared with Jesus at the transfiguration?", "correct": "Elijah and Moses", "reference": "Matt 17:3"},
+    {"question": "Who prayed for the fiery serpents to be taken away from Israel?", "correct": "Moses", "reference": "Num 21:7"},
+    {"question": "Which married couple did Paul become friends with at Corinth?", "correct": "Aquila and Priscilla", "reference": "Acts 18:2"},
+    {"question": "Who persuaded Delilah to betray Samson?", "correct": "Lords of the Philistines", "reference": "Jdg 16:5"},
+    {"question": "When Jesus died, for how long was there darkness over the land?", "correct": "Three hours", "reference": "Luke 23:44"},
+    {"question": "What service did Nehemiah perform for King Artaxerxes?", "correct": "Cupbearer", "reference": "Neh 1:11"},
+    {"question": "What is the next line of the Lord’s Prayer after 'Give us this day our daily bread...'?", "correct": "And forgive us our debts/sins", "reference": "Matt 6:11-12; Luke 11:4"},
+    {"question": "What did Abigail prevent David from doing to Nabal?", "correct": "Murdering him", "reference": "1 Sam 25:34-35"},
+    {"question": "Who became nurse to Ruth’s son?", "correct": "Naomi", "reference": "Ruth 4:16"},
+    {"question": "According to the law, why could the Israelites not eat blood?", "correct": "God said, 'the blood is the life.'", "reference": "Deut 12:23"},
+    {"question": "What relation was Jacob to Abraham?", "correct": "Grandson", "reference": "Matt 1:2"},
+    {"question": "What killed the plant that God had provided Jonah for shade?", "correct": "A worm", "reference": "Jon 4:7"},
+    {"question": "What did the prophet Micah say about Jesus’ birth?", "correct": "He would be born in Bethlehem", "reference": "Mic 5:2"},
+    {"question": "What did John do with the little book he took from the angel?", "correct": "He ate it", "reference": "Rev 10:10"},
+    {"question": "Who went up yearly to worship God in Shiloh, and one year prayed to God for a baby?", "correct": "Hannah", "reference": "1 Sam 1:3-11"},
+    {"question": "In which tribe was the city of Bethlehem?", "correct": "Judah", "reference": "Mic 5:2"},
+    {"question": "What was Peter doing when he denied Jesus for the second time?", "correct": "Warming himself by a fire", "reference": "John 18:25"},
+    {"question": "What did Jonah do while he waited to see Nineveh’s fate?", "correct": "He sat down on the East of the city and made a shelter", "reference": "Jon 4:5"},
+    {"question": "Who carried the cross for Christ?", "correct": "Simon of Cyrene", "reference": "Matt 27:32"},
+    {"question": "On which mountain range did Noah’s ark come to rest?", "correct": "Ararat", "reference": "Gen 8:4"},
+    {"question": "Which two tribes of Israel were not named after sons of Jacob?", "correct": "Ephraim and Manasseh", "reference": "Josh 14:4"},
+    {"question": "What did the Queen of Sheba give to Solomon?", "correct": "(120 talents of) gold, spices, and precious stones", "reference": "1 Ki 10:10"},
+    {"question": "What should Philemon do if his slave owed him anything?", "correct": "Charge it to Paul", "reference": "Phm 1:18"},
+    {"question": "How many books are there in the Old Testament?", "correct": "Thirty-nine", "reference": "Gen 1:1 - Mal 4:6"},
+    {"question": "According to Old Testament law, what should you not cook a young goat in?", "correct": "Its mother’s milk", "reference": "Ex 23:19"},
+    {"question": "What did Joseph want to do when he discovered Mary was pregnant?", "correct": "(Quietly) divorce her", "reference": "Matt 1:19"},
+    {"question": "What did Boaz say Naomi was selling?", "correct": "A parcel of land", "reference": "Ruth 4:3"},
+    {"question": "Abram was rich in gold, silver and what else?", "correct": "Cattle", "reference": "Gen 13:2"},
+    {"question": "How much of Elijah’s spirit did Elisha receive?", "correct": "Double (portion)", "reference": "2 Ki 2:9"},
+    {"question": "What was unusual about the 700 Benjamite soldiers who could sling a stone and hit their target every time?", "correct": "They were all left-handed", "reference": "Jdg 20:16"},
+    {"question": "What relation was Annas to Caiaphas?", "correct": "Father-in-law", "reference": "John 18:13"},
+    {"question": "According to James, what is “pure and undefiled religion”?", "correct": "To visit the fatherless and widows, and to keep yourself unspotted from the world", "reference": "Jam 1:27"},
+    {"question": "When in prison at what time did Paul and Silas pray and sing to God?", "correct": "Midnight", "reference": "Acts 16:25"},
+    {"question": "What did Daniel and his three friends eat instead of the king’s meat and drink?", "correct": "Pulses and water", "reference": "Dan 1:12"},
+    {"question": "What did Jesus say is the “greatest commandment in the law”?", "correct": "To love God with all your heart, soul and mind", "reference": "Mark 12:29-30"},
+    {"question": "Who was afflicted with leprosy for speaking out against Moses?", "correct": "Miriam", "reference": "Num 12:10"},
+    {"question": "After the Babylonian exile, the Jews sought wealth and possessions for themselves. What should they have been doing?", "correct": "Rebuilding the temple", "reference": "Hag 1:2-6"},
+    {"question": "What did God count Abram’s faith to him as?", "correct": "Righteousness", "reference": "Gen 15:6"},
+    {"question": "What sin stopped Moses from leading the children of Israel into the Promised Land?", "correct": "Hitting a rock twice (instead of speaking to it)", "reference": "Num 20:11"},
+    {"question": "Whose hair when cut annually weighed two hundred shekels by the king’s weight?", "correct": "Absalom", "reference": "2 Sam 14:26"},
+    {"question": "During what traumatic event did the Apostle Paul take bread and give thanks?", "correct": "Sea voyage", "reference": "Acts 27:35"},
+    {"question": "Which man killed a lion with his bare hands?", "correct": "Samson", "reference": "Jdg 14:5-6"},
+    {"question": "What was the sign that the angels gave to the shepherds, so that they would recognize Jesus?", "correct": "Wrapped in swaddling clothes, lying in a manger", "reference": "Luke 2:12"},
+    {"question": "Who was to be named Zacharias, after the name of his father, until his mother intervened?", "correct": "John", "reference": "Luke 1:60"},
+    {"question": "In what town did Jesus turn water into wine?", "correct": "Cana", "reference": "John 2:1-11"},
+    {"question": "How long had the infirm man lain at the pool of Bethesda?", "correct": "Thirty-eight years", "reference": "John 5:5"},
+    {"question": "What “doeth good like a medicine”?", "correct": "A merry heart", "reference": "Pro 17:22"},
+    {"question": "What was God to give Abraham as an everlasting possession?", "correct": "The land of Canaan", "reference": "Gen 17:8"},
+    {"question": "What lie was told about Naboth that led to him being stoned and Ahab taking possession of his vineyard?", "correct": "He had blasphemed against God and the king", "reference": "1 Ki 21:10"},
+    {"question": "Which supernatural being or beings does the Bible say the Sadducees did not believe in?", "correct": "Angels", "reference": "Acts 23:8"},
+    {"question": "Who won the hand of Caleb’s daughter, Achsah?", "correct": "Othniel", "reference": "Josh 15:16-17"},
+    {"question": "What is the “light of the body”?", "correct": "The eye", "reference": "Matt 6:22"},
+    {"question": "The southern kingdom of divided Israel eventually fell, but to which great power?", "correct": "Babylon", "reference": "2 Ki 25"},
+    {"question": "You will be healed if you “pray for one another” and what else?", "correct": "Confess your faults", "reference": "Jam 5:16"},
+    {"question": "What is in the hypocrite’s eye?", "correct": "A beam", "reference": "Matt 7:5"},
+    {"question": "Which book of the Bible follows Jonah?", "correct": "Micah", "reference": "Jon 4:11 - Mic 1:1"},
+    {"question": "What inscription was on the altar in Athens?", "correct": "To the Unknown God", "reference": "Acts 17:23"},
+    {"question": "In which book of prophecy do we read about the valley of dry bones?", "correct": "Ezekiel", "reference": "Eze 37:1"},
+    {"question": "Which baby was named after his mother’s laughter?", "correct": "Isaac", "reference": "Gen 21:6 / Strong’s H3327"},
+    {"question": "Demetrius, of Ephesus was a...?", "correct": "Silversmith", "reference": "Acts 19:24"},
+    {"question": "On which day of the year could the High Priest enter the Holiest Place, the inner most part of the temple where the covenant box was kept?", "correct": "Day of Atonement", "reference": "Lev 16"},
+    {"question": "What was the name of the temple gate at which the lame man was laid daily?", "correct": "Beautiful Gate", "reference": "Acts 3:2"},
+    {"question": "To which Jewish sect did Nicodemus belong?", "correct": "Pharisees", "reference": "John 3:1"},
+    {"question": "What is the first recorded dream of Joseph, son of Jacob?", "correct": "Sheaves of wheat bowing down to other sheaves", "reference": "Gen 37:5-7"},
+    {"question": "To which tribe did the Apostle Paul belong?", "correct": "Benjamin", "reference": "Rom 11:1"},
+    {"question": "How does James say we should 'wait for the coming of the Lord'?", "correct": "Patiently", "reference": "Jam 5:7"},
+    {"question": "The blessed man will be like a tree planted by... what?", "correct": "Rivers of water", "reference": "Ps 1:1-3"},
+    {"question": "How old was Abraham when his son Isaac was born?", "correct": "100", "reference": "Gen 21:5"},
+    {"question": "In the parable of the Pharisee and the Publican, what did the Pharisee thank God for?", "correct": "That he was not sinful like other men", "reference": "Luke 18:11"},
+    {"question": "How many times did Jesus say you should forgive your brother when he sins against you?", "correct": "Seventy times seven", "reference": "Matt 18:22"},
+    {"question": "What question concerning marriage did the Pharisees use to tempt Jesus?", "correct": "Is it lawful for a man to put away his wife? (Divorce)", "reference": "Matt 19:3"},
+    {"question": "How does Paul tell us to 'work out our own salvation'?", "correct": "With fear and trembling", "reference": "Php 2:12"},
+    {"question": "In the parable of the cloth and wine, why does no man put new wine into old bottles?", "correct": "It will burst the bottles", "reference": "Luke 5:37"},
+    {"question": "In which city did King Herod live at the time of Jesus' birth?", "correct": "Jerusalem", "reference": "Matt 2:3"},
+    {"question": "What is the 'root of all evil'?", "correct": "Love of money", "reference": "1 Tim 6:10"},
+    {"question": "What does the law say to do when you see a bird in its nest?", "correct": "Let the mother bird go free", "reference": "Deut 22:6-7"},
+    {"question": "Which tribe of Israel received no inheritance of land?", "correct": "Levi", "reference": "Deut 10:9"},
+    {"question": "In Nebuchadnezzar's dream what happened to destroy the statue made from different metals?", "correct": "A stone hit the feet and broke them into pieces", "reference": "Dan 2:34"},
+    {"question": "Which King took possession of Naboth's vineyard?", "correct": "Ahab", "reference": "1 Ki 21:16"},
+    {"question": "For how many days did Jesus appear to his disciples after his resurrection?", "correct": "Forty", "reference": "Acts 1:3"},
+    {"question": "Who did Paul write a letter to concerning his slave Onesimus?", "correct": "Philemon", "reference": "Phm 1:1-25"},
+    {"question": "How many churches of Asia Minor were listed in Revelation?", "correct": "Seven", "reference": "Rev 1:11"},
+    {"question": "What object did Gideon place on the ground to receive a sign from God?", "correct": "Fleece", "reference": "Jdg 6:37"},
+    {"question": "Why did Moses' hand become leprous?", "correct": "As a sign", "reference": "Exo 4:6-8"},
+    {"question": "In which city in Judah did Cyrus tell the Israelites to build the temple?", "correct": "Jerusalem", "reference": "Ezr 6:3"},
+    {"question": "Which missionary was described as having 'known the holy scriptures from an early age'?", "correct": "Timothy", "reference": "2 Tim 3:15"},
+    {"question": "What affliction did Paul strike Elymas the sorcerer down with?", "correct": "Blindness", "reference": "Acts 13:8,11"},
+    {"question": "Who was Boaz a kinsman of?", "correct": "Elimelech", "reference": "Ruth 2:1"},
+    {"question": "What animals were carved on Solomon's throne?", "correct": "Lions", "reference": "1 Ki 10:19"},
+    {"question": "What did Jesus and the disciples have for breakfast when Jesus appeared to them after the resurrection by the Sea of Tiberias?", "correct": "Bread and fish", "reference": "John 21:13"},
+    {"question": "Which woman was a seller of purple goods?", "correct": "Lydia", "reference": "Acts 16:14"},
+    {"question": "What were the restrictions on marriage for the daughters of Zelophehad?", "correct": "They must marry within their tribe", "reference": "Num 36:6"},
+    {"question": "Who said, 'A light to lighten the Gentiles, and the glory of thy people Israel,' when he saw Jesus?", "correct": "Simeon", "reference": "Luke 2:25,32"},
+    {"question": "How did Moses assure victory against the Amalekites?", "correct": "Kept his hands held up", "reference": "Exo 17:11-12"},
+    {"question": "What was the occupation of Hosea's wife?", "correct": "Harlot", "reference": "Hos 1:2"},
+    {"question": "In the Sermon on the Mount, what does Jesus say you should do when you fast?", "correct": "Anoint your head, and wash your face", "reference": "Matt 6:18"},
+    {"question": "Which church did Jesus accuse of being lukewarm?", "correct": "Laodicea", "reference": "Rev 3:16"},
+    {"question": "Why are the Thessalonians told not to worry about those Christians who have died?", "correct": "They will be raised to life again", "reference": "1 Th 4:13-15"},
+    {"question": "In the parable of the sower, what happened to the seed that fell on the path?", "correct": "Eaten by birds", "reference": "Matt 13:4"},
+    {"question": "What was the name of the man who requested Jesus' body for burial?", "correct": "Joseph (of Arimathaea)", "reference": "Matt 27:57-58"},
+    {"question": "How many Philistines did Samson say he had killed with the jawbone of a donkey?", "correct": "1,000", "reference": "Jdg 15:16"},
+    {"question": "Which book of the Bible precedes Jonah?", "correct": "Obadiah", "reference": "Oba 1:21 - Jon 1:1"},
+    {"question": "Who did Samuel anoint as the first King of Israel?", "correct": "Saul", "reference": "1 Sam 10:1,19-24"},
+    {"question": "What was mankind's first sin in the Bible?", "correct": "Eating some fruit", "reference": "Gen 3:6"},
+    {"question": "What was the first bird released from the ark?", "correct": "Raven", "reference": "Gen 8:7"},
+    {"question": "What nationality was Timothy's father?", "correct": "Greek", "reference": "Acts 16:1"},
+    {"question": "In Revelation, what is the 'number of a man'?", "correct": "666", "reference": "Rev 13:18"},
+    {"question": "How many elders sat around the throne of God?", "correct": "Twenty-four", "reference": "Rev 4:4"},
+    {"question": "What order did Joshua give to God while fighting the Amorites?", "correct": "Make the sun and moon stand still", "reference": "Josh 10:12-14"},
+    {"question": "How many years did the Lord add to Hezekiah's life after being healed of his sickness?", "correct": "Fifteen", "reference": "2 Ki 20:6"},
+    {"question": "What was the second plague upon Egypt?", "correct": "Frogs", "reference": "Exo 8:6"},
+    {"question": "Which disciple looked after Mary, after the death of Jesus?", "correct": "John", "reference": "John 19:26-27"},
+    {"question": "Jesus was a high priest after the order of which ancient king, mentioned in Psalm 110?", "correct": "Melchizedek", "reference": "Ps 110:4"},
+    {"question": "Which two provinces looked up to Thessalonica as an example?", "correct": "Macedonia & Achaia", "reference": "1 Th 1:7"},
+    {"question": "Who was Noah's father?", "correct": "Lamech", "reference": "Gen 5:28-29"},
+]
+
+# Distractors by question type/category
+distractors_bank = {
+    "What was the name of Jesus' mother?": ["Martha", "Elizabeth", "Sarah"],
+    "What was the name of the garden where Adam and Eve lived?": ["Gethsemane", "Canaan", "Eden (Mount Zion)"],
+    "With what food did Jesus feed 5,000 people?": ["Wine and grapes", "Lamb and herbs", "Oil and figs"],
+    "What method did the Romans use to kill Jesus?": ["Stoning", "Beheading", "Drowning"],
+    "From which part of Adam's body did God create Eve?": ["Heart", "Head", "Foot"],
+    "Who, when accused of being with Jesus, lied and said that he did not know him, three times?": ["John", "Thomas", "Judas"],
+    "Which creature tricked Eve into eating of the forbidden fruit?": ["Fox", "Raven", "Wolf"],
+    "At Christ's crucifixion what did the soldiers place on his head?": ["Helmet", "Veil", "Wreath"],
+    "What is the first line of the Lord's Prayer?": ["Hallowed be thy name", "Give us this day", "Thy kingdom come"],
+    "What relationship was Ruth to Naomi?": ["Sister", "Mother", "Cousin"],
+    "Who lied to God when he was asked where his brother was?": ["Abel", "Seth", "Enoch"],
+    "Which Old Testament character showed his faith by being willing to offer his son on an altar to God?": ["Isaac", "Jacob", "Joseph"],
+    "What significant event is recorded in Genesis chapters 1 and 2?": ["Flood", "Exodus", "Tower of Babel"],
+    "What was inscribed above Jesus' cross?": ["Son of God", "Messiah", "Lord of Lords"],
+    "Whose mother placed him in an ark of bulrushes?": ["Aaron", "Miriam", "Joshua"],
+    "For how many days and nights did it rain in the story of the flood?": ["Seven", "Ten", "Three"],
+    "What was special about Jesus' mother?": ["She was a prophetess", "She was wealthy", "She was a queen"],
+    "Who gave gifts to Jesus when he was a young child?": ["Shepherds", "Pharisees", "Herod"],
+    "What happened to Jonah after he was thrown overboard?": ["He drowned", "He swam to shore", "He was rescued by sailors"],
+    "In whose image was man created?": ["Angels'", "Nature's", "Adam's"],
+    "How many apostles did Jesus choose?": ["Seven", "Ten", "Three"],
+    "What are the wages of sin?": ["Suffering", "Exile", "Poverty"],
+    "Who is the first mother mentioned in the Bible?": ["Sarah", "Rebekah", "Rachel"],
+    "Who else, other than the wise men, came to visit Jesus when he was a small child?": ["Kings", "Priests", "Pharisees"],
+    "Who lied when he was asked to reveal the source of his great strength?": ["David", "Goliath", "Saul"],
+    "What was the name of the man Jesus' mother was engaged to at the time she became pregnant?": ["Zacharias", "Simeon", "Herod"],
+    "Which book of the Bible records many of the hymns David wrote?": ["Proverbs", "Job", "Ecclesiastes"],
+    "From what disaster did the Ark save Noah?": ["Famine", "Plague", "Earthquake"],
+    "What happened to Jesus forty days after his resurrection?": ["He preached", "He rested", "He was crucified again"],
+    "What animals did Jesus cause to run into the sea and drown?": ["Sheep", "Goats", "Camels"],
+    "On what were the Ten Commandments written?": ["Scroll", "Parchment", "Wood"],
+    "What did Jesus sleep in after he was born?": ["Crib", "Bed", "Basket"],
+    "What was man created from?": ["Clay", "Water", "Fire"],
+    "What did Jesus do to each of the disciples during the Last Supper?": ["Gave them bread", "Blessed them", "Anointed them"],
+    "To which city did God ask Jonah to take his message?": ["Jerusalem", "Babylon", "Sodom"],
+    "Who was David's father?": ["Saul", "Samuel", "Eli"],
+    "Which of the gospels appears last in the Bible?": ["Matthew", "Mark", "Luke"],
+    "What is the only sin that cannot be forgiven?": ["Murder", "Theft", "Adultery"],
+    "How did David defeat Goliath?": ["With a sword", "With a spear", "With an arrow"],
+    "What did Joseph's brothers do to get rid of him?": ["Killed him", "Left him in Egypt", "Gave him to Pharaoh"],
+    "Who wrote the letter to Philemon?": ["Peter", "James", "John"],
+    "In what was Jesus wrapped before he was buried?": ["Silk", "Wool", "Cotton"],
+    "What was the name of Moses' brother?": ["Joshua", "Caleb", "Pharaoh"],
+    "What sin is Cain remembered for?": ["Theft", "Lying", "Adultery"],
+    "The Lord is my Shepherd, is the opening line to which Psalm?": ["Psalm 1", "Psalm 51", "Psalm 100"],
+    "What is the last book of the New Testament?": ["Hebrews", "Jude", "Acts"],
+    "Who wrote the majority of the New Testament letters?": ["Peter", "John", "James"],
+    "What was David's occupation before he became king?": ["Farmer", "Fisherman", "Carpenter"],
+    "Who hid two spies but claimed not to know of their whereabouts when asked?": ["Ruth", "Esther", "Deborah"],
+    "Whose prayer resulted in his being thrown into a den of lions?": ["David", "Jonah", "Joseph"],
+    "What was the apparent source of Samson's strength?": ["Sword", "Faith", "Armor"],
+    "From which country did Moses help the Israelites escape from their lives of slavery?": ["Canaan", "Edom", "Philistia"],
+    "Who was the fourth person in the fiery furnace along with Daniel's friends?": ["Daniel", "A guard", "A king"],
+    "What did Joseph's brothers do to deceive their father to cover up that they had sold Joseph into slavery?": ["Burned his coat", "Tore his coat", "Hid his coat"],
+    "What kind of leaves did Adam and Eve sew together to make clothes for themselves?": ["Olive", "Vine", "Palm"],
+    "Who did Jesus say was the 'father of lies'?": ["Judas", "Pharaoh", "Herod"],
+    "What was the name of the tower that the people were building when God confused their language?": ["Tower of Siloam", "Tower of Jericho", "Tower of David"],
+    "What is the common name of the prayer that Jesus taught to his disciples?": ["The Beatitudes", "The Sermon", "The Grace"],
+    "Whose name means 'father of a great multitude'?": ["Jacob", "Isaac", "Joseph"],
+    "Of what did Potiphar's wife falsely accuse Joseph resulting in him being thrown into prison?": ["Theft", "Murder", "Disobedience"],
+    "Which sea did the Israelites cross through to escape the Egyptians?": ["Jordan River", "Dead Sea", "Nile River"],
+    "What is 'more difficult than a camel going through the eye of a needle'?": ["A poor man finding peace", "A wise man gaining wealth", "A child entering heaven"],
+    "For how many years did the Israelites wander in the wilderness?": ["Seven", "Ten", "Three"],
+    "What does a 'good tree' bring forth?": ["Thorns", "Leaves", "Flowers"],
+    "Which small body part can 'boast of great things'?": ["Eye", "Ear", "Hand"],
+    "What was the name of Abraham's first wife?": ["Hagar", "Rebekah", "Rachel"],
+    "What did God do on the seventh day, after he had finished creating everything?": ["Worked", "Blessed", "Slept"],
+    "On what day did the apostles receive the Holy Spirit?": ["Passover", "Sabbath", "Tabernacles"],
+    "At the Last Supper, what items of food and drink did Jesus give thanks for?": ["Fish and water", "Lamb and oil", "Fruit and juice"],
+    "When Jesus was in the wilderness, what was he tempted to turn into loaves of bread?": ["Sand", "Wood", "Water"],
+    "What were the religious leaders called who continually tried to trap Jesus with their questions?": ["Essenes", "Zealots", "Scribes"],
+    "What miracle did Jesus do for Lazarus?": ["Healed his blindness", "Fed him", "Calmed his fears"],
+    "On which mountain were the Israelites given the Ten Commandments?": ["Mount Zion", "Mount of Olives", "Mount Carmel"],
+    "Who was Solomon's father?": ["Saul", "Jesse", "Samuel"],
+    "What job did Jesus' earthly father, Joseph, do?": ["Fisherman", "Shepherd", "Tax Collector"],
+    "How did Judas betray Christ?": ["With a handshake", "With a bow", "With a shout"],
+    "Solomon judged wisely over the rightful mother of a child, but how did he determine who the child belonged to?": ["Asked for a sign", "Tested their strength", "Consulted priests"],
+    "Whose father was prepared to sacrifice him on an altar?": ["Jacob", "Joseph", "Esau"],
+    "At the age of twelve, Jesus was left behind in Jerusalem. Where did his parents find him?": ["Market", "Inn", "Garden"],
+    "When the disciples saw Jesus walking on water, what did they think he was?": ["An angel", "A prophet", "A fisherman"],
+    "What gift did Salome, daughter of Herodias, ask for after she danced for Herod?": ["Gold", "A crown", "A robe"],
+    "How did Samson kill all the people in the temple?": ["Burned it down", "Flooded it", "Struck it with a sword"],
+    "Which musical instrument did David play for Saul?": ["Flute", "Drum", "Trumpet"],
+    "What was Esau doing while Jacob stole his blessing?": ["Farming", "Sleeping", "Praying"],
+    "Why did Jacob initially send Joseph's brothers into Egypt?": ["To find Joseph", "To escape famine", "To trade goods"],
+    "Who was David's great friend?": ["Saul", "Samuel", "Goliath"],
+    "Who said 'thy God shall be my God'?": ["Rachel", "Leah", "Esther"],
+    "Which of Christ's belongings did the soldiers cast lots for after they had crucified him?": ["Sandals", "Crown", "Sword"],
+    "What does the name Emmanuel mean?": ["Prince of Peace", "Son of Man", "Light of the World"],
+    "What does James say we should do if we lack wisdom?": ["Study the law", "Seek a teacher", "Pray in silence"],
+    "Where did Jesus meet the woman of Samaria?": ["In a temple", "On a mountain", "At a market"],
+    "Which disciple tried to walk on water, as Jesus did?": ["John", "James", "Thomas"],
+    "Why did Elimelech go to live in Moab with his family?": ["War", "Plague", "Flood"],
+    "Who lied about the price they received for a piece of land and died as a result?": ["Barnabas", "Silas", "Judas"],
+    "With whom did David commit adultery?": ["Abigail", "Michal", "Tamar"],
+    "When the Prodigal Son returned, his father gave him a robe, shoes and what other item?": ["Crown", "Sword", "Staff"],
+    "How many books are there in the Bible?": ["Fifty", "Seventy", "Forty"],
+    "What are the names of Lazarus's sisters?": ["Ruth and Naomi", "Rachel and Leah", "Esther and Deborah"],
+    "Where did Jonah go after being thrown overboard and reaching dry land?": ["Jerusalem", "Tarshish", "Babylon"],
+    "For what did Esau sell his birthright to Jacob?": ["Gold", "Land", "A blessing"],
+    "What happened to Elimelech in Moab?": ["He prospered", "He remarried", "He fled"],
+    "What does the shepherd in the parable of the lost sheep do once he realizes one is missing?": ["Waits for it", "Sends a servant", "Sells the flock"],
+    "What is the name of the disciple who betrayed Jesus?": ["Thomas", "Peter", "John"],
+    "What golden animal did the Israelites make as an idol?": ["Lion", "Eagle", "Bull"],
+    "Who did Jesus appear to first after his resurrection?": ["Peter", "Mary (his mother)", "John"],
+    "What job did Peter and Andrew do?": ["Carpenters", "Tax Collectors", "Shepherds"],
+    "Which prophet tried to flee from God when asked to preach God's message in Nineveh?": ["Elijah", "Isaiah", "Jeremiah"],
+    "What is the collective name of the stories Jesus told to convey his message?": ["Miracles", "Prophecies", "Commandments"],
+    "What was noticeable about Jacob's twin brother, Esau, at birth?": ["He was small", "He was strong", "He was silent"],
+    "Who wanted to kill Jesus when he was a baby?": ["Pharaoh", "Pilate", "Caesar"],
+    "What did the earth look like in the beginning?": ["Covered in water", "Full of light", "Populated"],
+    "How did the father first respond upon seeing the Prodigal Son returning home?": ["He scolded him", "He ignored him", "He sent servants"],
+    "Which well known Psalm of David contains the line, 'he maketh me to lie down in green pastures'?": ["Psalm 1", "Psalm 51", "Psalm 100"],
+    "Abraham's wife, Sarah, bore a special son. What was his name?": ["Jacob", "Esau", "Joseph"],
+    "Which son did Jacob love more than all the others?": ["Benjamin", "Reuben", "Judah"],
+    "Who was Jacob's grandfather?": ["Isaac", "Lot", "Noah"],
+    "To which city will all nations one day go to worship God?": ["Bethlehem", "Nazareth", "Rome"],
+    "Who said, 'I am the true vine'?": ["John", "Paul", "Isaiah"],
+    "When there was no water to drink in the wilderness, how did Moses provide it?": ["Dug a well", "Prayed for rain", "Found a spring"],
+    "To which tribe did Jesus belong?": ["Levi", "Benjamin", "Ephraim"],
+    "What tragedy did Jacob think had happened to Joseph?": ["He fled", "He was enslaved", "He was lost"],
+    "What affliction did Hannah suffer from, that allowed Peninnah to provoke her?": ["Blindness", "Poverty", "Sickness"],
+    "Which is the gate that 'leads to life'?": ["The wide gate", "The high gate", "The golden gate"],
+    "What happened to the man who built his house upon the sand?": ["It stood firm", "It was blessed", "It was rebuilt"],
+    "What was the relationship of Mary (mother of Jesus) to Elisabeth?": ["Sister", "Aunt", "Mother"],
+    "How should we treat those who are our enemies, according to Jesus?": ["Ignore them", "Judge them", "Curse them"],
+    "Who said, 'Thou art my beloved Son, in thee I am well pleased'?": ["John the Baptist", "Peter", "An angel"],
+    "Which son did Jacob not send to Egypt for grain during the famine?": ["Joseph", "Judah", "Reuben"],
+    "What does the word 'gospel' mean?": ["Law", "Judgment", "Prophecy"],
+    "Who suggested that Jonah be thrown overboard?": ["The captain", "The crew", "God"],
+    "What did Ruth do to Boaz while he was sleeping?": ["Woke him", "Stole from him", "Spoke to him"],
+    "As Esau grew, he was described as a what...?": ["Wise scholar", "Gentle shepherd", "Fierce warrior"],
+    "When Jesus went to dinner at Simon the Pharisee's house, what did a woman do for him?": ["Sang to him", "Fed him", "Prayed for him"],
+    "What was Bathsheba doing when David first saw her?": ["Praying", "Dancing", "Cooking"],
+    "When the law was given to the children of Israel, what were they told not to worship?": ["The sun", "The king", "The land"],
+    "Who ran from Mount Carmel to Samaria faster than Ahab could drive his chariot?": ["Elisha", "Nathan", "Obadiah"],
+    "How many sons did Jacob (Israel) have?": ["Seven", "Ten", "Three"],
+    "Which disciple wanted to see the imprint of the nails before he would believe?": ["Peter", "John", "James"],
+    "Which king dreamed about a large statue of a man made from different metals?": ["Solomon", "David", "Ahab"],
+    "What form did the Holy Spirit take at the baptism of Jesus?": ["Flame", "Wind", "Cloud"],
+    "Complete the saying of Jesus: 'for the tree is known by his ____'": ["Roots", "Leaves", "Branches"],
+    "What miracle did Jesus perform at the marriage in Cana?": ["Healed a man", "Fed the guests", "Calmed a storm"],
+    "What was the first thing Noah built when he came out of the ark?": ["House", "Ark", "Tower"],
+    "Who claimed that the golden calf simply came out of the fire?": ["Moses", "Joshua", "Miriam"],
+    "Towards which city was Saul travelling when he encountered a light from heaven?": ["Jerusalem", "Antioch", "Corinth"],
+    "What did the sailors of the ship Jonah was on do to increase their chances of survival?": ["Prayed", "Sailed faster", "Dropped anchor"],
+    "Who was Jacob's mother?": ["Sarah", "Rachel", "Leah"],
+    "How long will the Kingdom of God last?": ["A thousand years", "Until the end", "A generation"],
+    "Which is the longest Psalm?": ["Psalm 23", "Psalm 51", "Psalm 100"],
+    "In which town was Jesus born?": ["Nazareth", "Jerusalem", "Capernaum"],
+    "How were sins forgiven in the Old Testament?": ["Prayer alone", "Fasting", "Burnt offerings"],
+    "How were the Thessalonians told to pray?": ["Once a day", "In silence", "With fasting"],
+    "What happened to the city of Jericho after the priests blew their trumpets?": ["It burned down", "It was flooded", "It stood firm"],
+    "Which garden did Jesus go to, to pray in before his arrest?": ["Eden", "Mount of Olives", "Galilee"],
+    "Who was instructed by God to leave his home and family to travel to a country he did not know?": ["Isaac", "Lot", "Noah"],
+    "What was Jesus teaching about when he said, 'What therefore God hath joined together, let not man put asunder'?": ["Friendship", "Faith", "The church"],
+    "In the Lord’s Prayer, what follows the line, 'Hallowed be thy name'?": ["Give us this day", "Forgive us our debts", "Lead us not into temptation"],
+    "What was Jonah found doing on the ship while the storm was raging?": ["Praying", "Eating", "Steering"],
+    "Five of the Ten Virgins did not take enough of what?": ["Water", "Food", "Wine"],
+    "What was the name of Joseph’s master in Egypt?": ["Pharaoh", "Amram", "Zaphnath-Paaneah"],
+    "Aaron turned his rod into a serpent before Pharaoh, and Pharaoh’s magicians did likewise, but what happened to their serpents?": ["They turned to dust", "They fled", "They multiplied"],
+    "To which country did Mary and Joseph escape when Herod killed all the babies in Bethlehem?": ["Syria", "Rome", "Greece"],
+    "What is the name of the angel who appeared to Mary?": ["Michael", "Raphael", "Uriel"],
+    "Which land did the Lord promise to Abram?": ["Egypt", "Moab", "Philistia"],
+    "What should we 'seek first'?": ["Wealth", "Wisdom", "Peace"],
+    "Which Psalm contains the line, 'He leads me beside the still waters'?": ["Psalm 1", "Psalm 51", "Psalm 100"],
+    "In the parable of the ten virgins, what were they waiting for?": ["A feast", "A king", "A storm"],
+    "What event occurred to help release Paul and Silas from prison?": ["A flood", "A fire", "A riot"],
+    "Which prisoner did the crowd call for to be released when Pilate asked them?": ["Barnabas", "Lazarus", "Judas"],
+    "How does James say we should 'treat the rich and the poor'?": ["Favor the rich", "Honor the poor only", "Separate them"],
+    "How many plagues did God send on Egypt?": ["Seven", "Three", "Twelve"],
+    "When Jesus asked 'whom say ye that I am?' what did Peter reply?": ["A prophet", "John the Baptist", "Elijah"],
+    "What did King Solomon ask for when God appeared to him in a dream?": ["Wealth", "Long life", "Victory"],
+    "Who said, 'Whosoever shall not receive the kingdom of God as a little child shall not enter therein'?": ["Paul", "John", "Peter"],
+    "How did the angel of the Lord appear to Moses, when he was a shepherd?": ["In a cloud", "As a voice", "In a dream"],
+    "Which of David’s descendants will reign forever?": ["Solomon", "Rehoboam", "Hezekiah"],
+    "On what mountain did Moses receive the law from God?": ["Mount Zion", "Mount Carmel", "Mount of Olives"],
+    "Which of his wives did Jacob love the most?": ["Leah", "Bilhah", "Zilpah"],
+    "What was the name of the ark where the commandments given to Moses were to be kept?": ["Noah’s Ark", "Ark of Testimony", "Ark of Noah"],
+    "What did Jesus say to those who accused the adulteress?": ["Judge her fairly", "Forgive her", "Punish her lightly"],
+    "Where is the 'best place to pray'?": ["In the temple", "On a mountain", "In public"],
+    "What does James say happens if we 'draw nigh to God'?": ["We will be judged", "We will be blessed", "We will be tested"],
+    "Where was Jesus baptized?": ["Dead Sea", "Nile River", "Sea of Galilee"],
+    "Which plant is 'the least of all seeds, but when it is grown, it is the greatest among herbs'?": ["Fig", "Olive", "Vine"],
+    "Which city 'came down from heaven prepared as a bride'?": ["Babylon", "Rome", "Jerusalem"],
+    "At Capernaum, how did the man sick of the palsy gain access to the house in which Jesus was?": ["Through the door", "By the window", "Over the wall"],
+    "What did God breathe into Adam’s nostrils?": ["Spirit of wisdom", "Holy fire", "Dust of life"],
+    "What did Pharaoh’s dream of good and bad ears of wheat represent?": ["A great harvest", "A war", "A flood"],
+    "To whom was the Revelation of Jesus Christ given?": ["Peter", "Paul", "James"],
+    "How long was Jonah stuck inside the great fish for?": ["One day", "Seven days", "Forty days"],
+    "When Jesus walked on water, which sea was it?": ["Red Sea", "Dead Sea", "Mediterranean Sea"],
+    "Who told Joseph that Jesus would save his people from their sins?": ["Mary", "A prophet", "The wise men"],
+    "Where did the man who received one talent from his master hide it?": ["In a tree", "In a river", "In a cave"],
+    "To whom did Jesus say, 'Why are ye fearful, O ye of little faith'?": ["The Pharisees", "The crowd", "Mary Magdalene"],
+    "What was the name of Hagar’s son?": ["Isaac", "Esau", "Jacob"],
+    "Who was Jacob’s first wife?": ["Rachel", "Rebekah", "Sarah"],
+    "What was Jesus wrapped in when he was born?": ["Linen robes", "Silk cloth", "Wool blanket"],
+    "What did the Israelites do whilst Moses was receiving the Ten Commandments from God?": ["Prayed", "Fasted", "Built a temple"],
+    "What guided the Israelites through the wilderness?": ["A star", "An angel", "A map"],
+    "At what age did Jesus start his ministry?": ["Twelve", "Twenty", "Forty"],
+    "What animal spoke to Balaam?": ["Serpent", "Camel", "Horse"],
+    "What is the last book of the Old Testament?": ["Zechariah", "Haggai", "Micah"],
+    "What happened to Daniel after he gave thanks to God by his open window?": ["He was exiled", "He was praised", "He was imprisoned"],
+    "What was Jonah’s reaction to the way the people of the city of Nineveh responded to God’s message?": ["He rejoiced", "He fled again", "He was indifferent"],
+    "Zacharias and Elizabeth were told by an angel that they would have a son. What was he to be called?": ["James", "Matthew", "Samuel"],
+    "How did Jesus say we should receive the Kingdom of God?": ["With wealth", "As a scholar", "With power"],
+    "What happened to anyone who was not found written in the book of life?": ["They were exiled", "They were forgiven", "They were judged lightly"],
+    "In his Sermon on the Mount, what does Jesus say about tomorrow?": ["Plan for it carefully", "Fear it greatly", "Rejoice in it"],
+    "What did Joseph instruct to be put in Benjamin’s sack?": ["Gold coins", "A robe", "A sword"],
+    "What did Paul do to the soothsayer which made her masters unhappy?": ["He praised her", "He paid her", "He ignored her"],
+    "What was the name of the place where Jesus Christ was crucified?": ["Bethlehem", "Jerusalem", "Nazareth"],
+    "What object featured in Jacob’s dream at Bethel?": ["Pillar", "Stone", "Ark"],
+    "What are the names of Joseph’s parents?": ["Isaac and Rebekah", "Abraham and Sarah", "Laban and Leah"],
+    "What animal did Samson kill on his way to Timnah?": ["Bear", "Wolf", "Leopard"],
+    "What was the name of Ruth’s second husband?": ["Obed", "Elimelech", "Mahlon"],
+    "Complete this common phrase of thanksgiving found in the Bible: “O give thanks unto the Lord; for he is good: for his _____ endureth for ever.”": ["Justice", "Power", "Wrath"],
+    "Who wrote the majority of the Psalms?": ["Solomon", "Asaph", "Moses"],
+    "Which prophet anointed David as king?": ["Nathan", "Elijah", "Elisha"],
+    "A “soft answer turneth away...” what?": ["Pride", "Fear", "Sorrow"],
+    "What job did the Prodigal Son end up taking after he had spent his inheritance?": ["Shepherd", "Carpenter", "Beggar"],
+    "Why shouldn’t we give anyone the title of “Father”?": ["It’s too common", "It’s disrespectful", "It’s unnecessary"],
+    "What kind of water does Jesus discuss with the Samaritan woman at the well?": ["Fresh water", "Holy water", "Well water"],
+    "How did Jesus heal the blind man?": ["He touched his hands", "He spoke a word", "He gave him bread"],
+    "Where did Jesus find Zacchaeus, the tax collector?": ["In a temple", "At a market", "On a hill"],
+    "What is the name of Jesus’ cousin, born six months before him?": ["James", "Joseph", "Peter"],
+    "Who was the first child born?": ["Abel", "Seth", "Enoch"],
+    "Which Apostle, who was described as “full of grace and power, and doing great wonders and signs among the people”, was stoned to death?": ["Paul", "Peter", "James"],
+    "Who deceived Jacob by giving Leah as a wife instead of Rachel?": ["Esau", "Isaac", "Reuben"],
+    "What did Jesus send disciples to fetch on his triumphal entry into Jerusalem?": ["A horse", "A chariot", "A robe"],
+    "In the parable of the lost sheep, how many sheep did the shepherd count safely into the fold?": ["Ninety", "One hundred", "Fifty"],
+    "What does James say we should say when we make our future plans?": ["I will succeed", "God will provide", "Tomorrow will come"],
+    "What type of coin did Judas accept as payment for betraying Jesus?": ["Gold", "Bronze", "Copper"],
+    "What was the writer of the letter asking of Philemon?": ["To punish his slave", "To free his slave", "To send his slave away"],
+    "What was the covenant between God and Noah?": ["To bless his descendants", "To give him land", "To make him king"],
+    "Which prophet said, “Behold, a virgin shall be with child, and shall bring forth a son”?": ["Jeremiah", "Ezekiel", "Daniel"],
+    "To what object does James compare the tongue?": ["A flame", "A sword", "A wheel"],
+    "Which of David’s sons rebelled against him?": ["Solomon", "Adonijah", "Amnon"],
+    "What does Paul say about women’s long hair?": ["It is a burden", "It is a shame", "It is a gift"],
+    "What did Naomi tell the people in Bethlehem to call her?": ["Ruth", "Naomi", "Bitter"],
+    "When Jesus told his disciples to beware of the “leaven of the Pharisees and Sadducees”, to what was he referring?": ["Their bread", "Their wealth", "Their pride"],
+    "How was Daniel protected from the lions in the den?": ["He fought them", "He hid", "He prayed"],
+    " “Everyone that is proud in heart” is what to the Lord?": ["A delight", "A servant", "A challenge"],
+    "What did John the Baptist say when he saw Jesus?": ["Here is the King!", "Behold the Prophet!", "This is the Son!"],
+    "How did the city that Jonah was sent to react to God’s message of destruction?": ["They ignored it", "They fled", "They mocked it"],
+    "Who asked Jesus to remember him when he came into his kingdom?": ["Peter", "Judas", "Pilate"],
+    "Of what, specifically, was man not allowed to eat in the Garden of Eden?": ["Tree of life", "Fruit of the vine", "Bread of heaven"],
+    "What was Solomon famous for building?": ["Palace", "Ark", "Wall"],
+    "Jesus asked: “Can the blind lead the....?”": ["Deaf", "Lame", "Wise"],
+    "Who told Peter to “watch and pray that he entered not into temptation”?": ["John", "Paul", "God"],
+    "What is Paul’s command to husbands in his letter to the Colossians?": ["Honor your wives", "Provide for your wives", "Teach your wives"],
+    "Which river was Naaman told to wash in to rid himself of leprosy?": ["Nile", "Euphrates", "Tigris"],
+    "What miracle had Jesus performed when he said, 'It is I; be not afraid'?": ["Feeding the 5,000", "Healing the blind", "Raising Lazarus"],
+    "Why did Solomon turn away from God when he was old?": ["He grew weary of wealth", "He was deceived by prophets", "He sought power over wisdom"],
+    "What is the 'chorus' in Psalm 136 which is repeated in every verse?": ["The Lord is my strength", "Praise ye the Lord", "His love is everlasting"],
+    "In what city was Jesus brought up as a child?": ["Bethlehem", "Jerusalem", "Capernaum"],
+    "Which female judge described herself as 'a mother in Israel'?": ["Ruth", "Esther", "Miriam"],
+    "After the angels had announced the birth of Christ and left the shepherds, what did the shepherds do?": ["Returned to their fields", "Sang hymns of praise", "Went to Jerusalem"],
+    "According to Peter, what 'covers a multitude of sins'?": ["Faith", "Repentance", "Good deeds"],
+    "In prison, for whom did Joseph interpret dreams?": ["Pharaoh’s guards", "The baker and the cook", "The cupbearer and the chef"],
+    "To what preservative does the Lord compare his disciples?": ["Oil", "Vinegar", "Honey"],
+    "What was Jesus’ first miracle?": ["Healing a leper", "Walking on water", "Feeding the 5,000"],
+    "Who spotted Moses in the Nile placed in an ark of bulrushes?": ["Miriam", "Pharaoh’s wife", "An Egyptian servant"],
+    "Who was Bathsheba’s first husband?": ["David", "Nathan", "Joab"],
+    "Why were Daniel’s three friends thrown into the fiery furnace?": ["They stole from the king", "They refused to eat the king’s food", "They prayed to false gods"],
+    "Out of the ten lepers who Jesus healed, how many came back to say thank you?": ["Three", "Five", "Ten"],
+    "What did Jesus say the sellers had turned his house of prayer into?": ["A market of fools", "A house of greed", "A place of idols"],
+    "In the New Jerusalem where are the names of the twelve tribes written?": ["On the walls", "In the book of life", "On the foundations"],
+    "How often was the year of the Lord’s release?": ["Every ten years", "Every fifty years", "Every three years"],
+    "Which tribe of Israel looked after the religious aspects of life?": ["Judah", "Benjamin", "Ephraim"],
+    "Where was Paul when he wrote the letter to Philemon?": ["In Corinth", "In Rome", "On a ship"],
+    "Who preached, 'Repent ye: for the kingdom of heaven is at hand'?": ["Peter", "Jesus", "Paul"],
+    "What was the name of James’ and John’s father?": ["Joseph", "Simon", "Andrew"],
+    "What bird did God provide to the Israelites for meat in the wilderness?": ["Dove", "Raven", "Sparrow"],
+    "Who closed the door of Noah’s ark?": ["Noah", "Shem", "Ham"],
+    "‘Hate stirs up strife’, but what does love cover?": ["All anger", "All pride", "All shame"],
+    "Who wrote the line: 'The Lord is my Shepherd, I shall not want'?": ["Solomon", "Moses", "Isaiah"],
+    "Which prisoners experienced an earthquake after their prayer?": ["Peter and John", "James and Silas", "Paul and Timothy"],
+    "What was the name of Joseph’s youngest brother?": ["Reuben", "Judah", "Levi"],
+    "Who did Jesus pray for that his faith failed not?": ["John", "James", "Thomas"],
+    "What was the new name given to Daniel while in captivity?": ["Shadrach", "Meshach", "Abednego"],
+    "Which wise man wrote the majority of Proverbs?": ["David", "Asaph", "Ethan"],
+    "Which king asked for the foreskins of 100 Philistines?": ["David", "Solomon", "Ahab"],
+    "Who rolled away the tomb stone?": ["The disciples", "Mary Magdalene", "Joseph of Arimathea"],
+    "What did Samson find in the carcass of the animal he had killed at a later time?": ["Ants and dust", "Birds and feathers", "Worms and rot"],
+    "What is 'friendship with the world', according to James?": ["A path to peace", "A sign of wisdom", "A temporary gain"],
+    "Who said 'glory to God in the highest, and on earth peace, goodwill to men'?": ["Shepherds", "Wise men", "Mary"],
+    "In which book of the Bible does the story of Noah’s ark appear?": ["Exodus", "Leviticus", "Deuteronomy"],
+    "When Samuel was called by the Lord as a child, who did he think was calling?": ["His mother", "His brother", "The king"],
+    "To whom did Jesus say 'Truly, truly, I say to you, unless one is born again he cannot see the kingdom of God'?": ["Peter", "Thomas", "Philip"],
+    "Who does Paul say is head of the woman?": ["God", "Christ", "The church"],
+    "Who sang a song celebrating the downfall of Sisera?": ["Miriam", "Rahab", "Jael"],
+    "What happens to 'treasure laid up on earth'?": ["It grows abundant", "It lasts forever", "It brings honor"],
+    "Whose mother was instructed to drink no wine or strong drink during her pregnancy?": ["Samuel’s", "John the Baptist’s", "Isaac’s"],
+    "Who was the successor to Moses?": ["Aaron", "Caleb", "Miriam"],
+    "What should you not 'throw before swine'?": ["Gold", "Bread", "Stones"],
+    "What was the name of the woman who hid the spies at Jericho?": ["Ruth", "Esther", "Deborah"],
+    "In the letter to the Corinthians, who does Paul say is a 'new creature'?": ["Any man of faith", "Any man of the law", "Any man of the church"],
+    "Which prophet is recorded as having an earnest prayer for no rain answered?": ["Isaiah", "Jeremiah", "Jonah"],
+    "According to Thessalonians, what will happen to the believers alive at the return of Christ?": ["They will ascend to heaven alone", "They will judge the earth", "They will sleep until judgment"],
+    "How did the Philistines discover the answer to Samson’s riddle?": ["They bribed Samson", "They spied on him", "They guessed it"],
+    "What are the names of Joseph’s parents?": ["Isaac and Rebekah", "Abraham and Sarah", "Laban and Leah"],
+    "Who was the first child born?": ["Abel", "Seth", "Enoch"],
+    "What is the name of Jesus’ cousin, born six months before him?": ["James", "Joseph", "Peter"],
+    "Who deceived Jacob by giving Leah as a wife instead of Rachel?": ["Esau", "Isaac", "Reuben"],
+    "Which of David’s sons rebelled against him?": ["Solomon", "Adonijah", "Amnon"],
+    "Who was the father of Isaac?": ["Jacob", "Lot", "Terah"],
+    "Who was the mother of Solomon?": ["Abigail", "Michal", "Haggith"],
+    "Who was the grandfather of Noah?": ["Lamech", "Enoch", "Jared"],
+    "What was the name of Ruth’s second husband?": ["Obed", "Elimelech", "Mahlon"],
+    "Who was the father of Esau and Jacob?": ["Abraham", "Laban", "Nahor"],
+    "When he was approached by Jesus, who said, 'What have you to do with me, Jesus, Son of the Most High God? I adjure you by God, do not torment me.'?": ["Peter", "Judas", "Thomas"],
+    "What was the reason that Jacob and his family began a new life in Egypt?": ["War in Canaan", "Plague in Canaan", "Flood in Canaan"],
+    "How was Isaac’s wife chosen?": ["He met her at a well", "She was a local Canaanite", "He chose her himself"],
+    "Whose father was so pleased to see him that he gave him the best robe and killed the fatted calf?": ["Joseph", "Lazarus", "Isaac"],
+    "What was the name of Solomon’s son who succeeded him as king?": ["Jeroboam", "Abijah", "Asa"],
+    "How did the people listening to the Sermon on the Mount view Jesus’ teachings?": ["He spoke in riddles", "He lacked authority", "He was confusing"],
+    "What does faith require to make it a living faith?": ["Words", "Wealth", "Wisdom"],
+    "What did Jesus say you should do if someone asks you to go with them for a mile?": ["Refuse them", "Go half a mile", "Send someone else"],
+    "In the parable of the grain of mustard seed, when it becomes a tree birds come and do what?": ["Eat the seeds", "Sing songs", "Fly away"],
+    "The field that Judas Iscariot purchased with his betrayal money was called Aceldama, but as what was it also known?": ["Field of Tears", "Field of Stones", "Field of Sorrow"],
+    "Who did Jesus raise from the dead by a prayer of thanks to God?": ["Jairus’s daughter", "Widow’s son", "Martha"],
+    "The king’s wrath is as 'the roaring' of what?": ["A bear", "A wolf", "A storm"],
+    "What was the name of Ruth’s son?": ["Jesse", "Boaz", "Elimelech"],
+    "According to James, what happens if you break one commandment of the law?": ["You are forgiven", "You must repent", "You are only partly guilty"],
+    "'Go to the ____, thou sluggard; consider her ways, and be wise.' What animal should we take lessons from?": ["Bee", "Bird", "Ox"],
+    "How did the wise men know that the King of the Jews had been born?": ["They heard a prophecy", "They saw an angel", "They read it in a scroll"],
+    "What test did Elijah set the prophets of Baal, which failed, proving their god to be false?": ["Walking through fire", "Raising the dead", "Calling down rain"],
+    "Who was the tax collector that climbed up a tree so he could see Jesus?": ["Matthew", "Levi", "Simon"],
+    "What is Jesus’ final commission to his disciples?": ["Build a church", "Heal the sick", "Write scriptures"],
+    "The Lord said that Jacob and Esau were two what in the womb?": ["Brothers", "Tribes", "Enemies"],
+    "When a man said to Jesus, 'Who is my neighbor?' what parable did Jesus reply with?": ["The lost sheep", "The prodigal son", "The sower"],
+    "What happens to the man who 'puts his hand to the plough and looks back'?": ["He prospers", "He is blessed", "He finds peace"],
+    "What did Samson do to the Philistines’ crops after discovering his bride had been given to someone else?": ["Flooded them", "Stole them", "Planted them"],
+    "Who was Jesus talking to when he taught the Lord’s Prayer?": ["Pharisees", "Crowds", "Sinners"],
+    "Ananias and Sapphira sold some property and secretly kept part of the proceeds for themselves. What happened to them?": ["They were exiled", "They were forgiven", "They were imprisoned"],
+    "To the beauty of which plant did Jesus compare to King Solomon?": ["Roses", "Vines", "Cedars"],
+    "What was on top of the Ark of the Covenant?": ["A golden calf", "The Ten Commandments", "A lampstand"],
+    "Who came to see Jesus by night?": ["Peter", "Judas", "Thomas"],
+    "For how long was the dragon bound in the bottomless pit?": ["Seven years", "100 years", "Forever"],
+    "Complete the Beatitude: 'Blessed are the pure in heart...'": ["…for they shall inherit the earth.", "…for they shall be comforted.", "…for they shall obtain mercy."],
+    "For how many pieces of silver did Judas betray Christ?": ["Ten", "Twenty", "Fifty"],
+    "Who did Abram marry?": ["Hagar", "Rebekah", "Rachel"],
+    "What did Jesus say he would leave with the disciples?": ["Power", "Glory", "Strength"],
+    "What did Paul ask Philemon to have ready for him?": ["A meal", "A horse", "A letter"],
+    "In Egypt, what did Joseph accuse his brothers of at their first meeting?": ["Stealing grain", "Being thieves", "Being liars"],
+    "Where did Jesus first see Nathanael?": ["On a mountain", "In a temple", "By the sea"],
+    "Which disciple was a tax collector?": ["Peter", "John", "James"],
+    "Which city was the letter to Philemon written from?": ["Jerusalem", "Corinth", "Ephesus"],
+    "What horrific act did the women do to their children during the Babylonian siege of Jerusalem?": ["Sold them", "Abandoned them", "Hid them"],
+    "What does the name Abraham mean?": ["Friend of God", "Exalted father", "Chosen one"],
+    "When the Pharisees asked Jesus whether it was lawful to pay taxes to Caesar, what object did he use to answer their question?": ["A scroll", "A sword", "A loaf of bread"],
+    "When Philip and the Ethiopian eunuch arrive at some water, what does the eunuch say?": ["Can you teach me?", "Is this holy water?", "Shall we pray?"],
+    "Who said to Mary, 'Blessed are you among women, and blessed is the fruit of your womb!'?": ["Anna", "Martha", "Salome"],
+    "Seven fat and seven thin of what type of animal appeared to Pharaoh in a dream?": ["Sheep", "Goats", "Horses"],
+    "How old was Sarah when her son Isaac was born?": ["Seventy", "Eighty", "One hundred"],
+    "About what age was Jesus when he was baptized?": ["Twenty", "Forty", "Fifty"],
+    "Which book comes after the book of Job?": ["Proverbs", "Ecclesiastes", "Genesis"],
+    "How many horsemen are there in Revelation chapter 6?": ["Three", "Five", "Seven"],
+    "What was the first temptation of Christ?": ["To worship Satan", "To leap from the temple", "To rule the world"],
+    "After the first king of Israel failed God, what was the name of the second man who was anointed king?": ["Saul", "Solomon", "Samuel"],
+    "What type of tree did Zacchaeus climb to see Jesus?": ["Fig", "Olive", "Cedar"],
+    "When Jesus forgave the sins of the sick man let down through the roof to him, to what did the Pharisees object?": ["That he healed on the Sabbath", "That he touched the sick", "That he spoke to sinners"],
+    "What was the name of Abraham’s nephew?": ["Ishmael", "Isaac", "Esau"],
+    "Israel split into two kingdoms after the reign of King Solomon, with Israel in the north, but what was the name of the southern kingdom?": ["Benjamin", "Levi", "Ephraim"],
+    "What did James’ and John’s mother ask of Jesus?": ["To heal her sons", "To make them rich", "To forgive their sins"],
+    "What did the dove bring back to Noah?": ["Twig", "Branch", "Feather"],
+    "How many books are there in the New Testament?": ["Twenty", "Thirty", "Twenty-five"],
+    "Who was appointed to replace Judas Iscariot as a disciple?": ["Barnabas", "Timothy", "Silas"],
+    "What did Abraham’s son carry for his sacrifice?": ["The knife", "The fire", "The rope"],
+    "In which book of the Bible would we find Haman, the son of Hammedatha?": ["Ruth", "Daniel", "Ezra"],
+    "What did Elisha do for the Shunammite’s son?": ["Healed his sickness", "Blessed his life", "Fed him bread"],
+    "Which book of the Bible precedes Philemon?": ["Hebrews", "Timothy", "Colossians"],
+    "What were the names of Elimelech’s two sons?": ["Ephraim & Manasseh", "Reuben & Simeon", "Cain & Abel"],
+    "Until when did Jesus remain in Egypt with his parents, when he was a baby?": ["Until he was twelve", "Until the census", "Until the wise men left"],
+    "In the parable of the sower, what does the seed represent?": ["Faith", "Hope", "Love"],
+    "What was the first plague the Lord sent upon Egypt?": ["Frogs", "Locusts", "Darkness"],
+    "What did the disciples do when people brought their young children to Jesus?": ["Blessed them", "Sent them away quietly", "Taught them"],
+    "Who does Jesus say are the two most important people to love?": ["Father and mother", "Priests and kings", "Friends and family"],
+    "What happened to Jesus on the 8th day of his life?": ["He was baptized", "He was named", "He was visited by shepherds"],
+    "Who looked after the coats of the men who stoned Stephen?": ["Peter", "John", "James"],
+    "What profession did Zebedee, father of James and John, have?": ["Carpenter", "Tax collector", "Shepherd"],
+    "Which two sisters married Jacob?": ["Ruth and Naomi", "Mary and Martha", "Sarah and Rebekah"],
+    "Into which land did God send Abraham to sacrifice his special son, Isaac?": ["Canaan", "Egypt", "Sinai"],
+    "In Revelation, what was the wife of the Lamb arrayed in?": ["Gold", "Purple silk", "Scarlet robes"],
+    "Which Israelite woman had two Moabite daughters-in-law?": ["Ruth", "Esther", "Rachel"],
+    "When Peter was asked if Jesus paid temple taxes, what animal concealed a coin with which to pay the taxes?": ["Bird", "Sheep", "Donkey"],
+    "In Nebuchadnezzar’s dream what did the different metals of the statue represent?": ["Ages of man", "Elements of earth", "God’s judgments"],
+    "What did God initially give man to eat?": ["Fish and bread", "Meat and herbs", "Grain and water"],
+    "Which city did David pray for the peace of?": ["Bethlehem", "Hebron", "Nazareth"],
+    "What did the crew of the ship Jonah was on do once the storm had ceased?": ["They sailed away", "They thanked Jonah", "They slept"],
+    "How many people were saved in the ark?": ["Four", "Six", "Ten"],
+    "What disease did the Lord send upon Miriam?": ["Blindness", "Fever", "Plague"],
+    "The name of the Lord is like what place of safety?": ["A high mountain", "A deep valley", "A wide river"],
+    "With what was Jesus’ side pierced?": ["Sword", "Arrow", "Nail"],
+    "Who wrote the book of Acts?": ["Paul", "Peter", "John"],
+    "What did Jesus say when the Pharisees asked why he ate with publicans and sinners?": ["I come to judge the wicked", "The righteous need me", "All must eat together"],
+    "How did Moses command the Red Sea to divide so the Israelites could cross over?": ["He struck it with a stone", "He prayed silently", "He shouted aloud"],
+    "Where was Jonah when he prayed to God with the voice of thanksgiving?": ["On the ship", "In Nineveh", "On the shore"],
+    "What was Noah’s ark made out of?": ["Cedar wood", "Oak wood", "Pine wood"],
+    "Who brought Elijah bread and meat to eat during the drought?": ["Angels", "Widows", "Servants"],
+    "Whose mother-in-law did Jesus heal?": ["John’s", "James’", "Andrew’s"],
+    "Which bird does Jesus say we have more value than?": ["Raven", "Dove", "Eagle"],
+    "In which city was David’s throne over Israel?": ["Hebron", "Bethlehem", "Samaria"],
+    "How old was Moses when he died?": ["80", "100", "140"],
+    "What event did Peter, James and John witness in a mountain with Jesus?": ["Sermon", "Ascension", "Baptism"],
+    "Which Apostle was a Pharisee?": ["Peter", "James", "John"],
+    "The desolation of which city is described in Revelation chapter 18?": ["Jerusalem", "Rome", "Nineveh"],
+    "Which king in the Old Testament built the first temple in Jerusalem?": ["David", "Saul", "Hezekiah"],
+    "Why did Jesus say we should not 'judge people'?": ["To show mercy", "To gain favor", "To avoid sin"],
+    "What happened to the prison keeper and his family after finding Paul and Silas released from their chains?": ["They fled", "They prayed alone", "They rebuilt the prison"],
+    "How is man 'tempted'?": ["By the devil’s whispers", "Through worldly riches", "By false prophets"],
+    "What natural disaster happened when Abram and Sarai arrived in the land of Canaan?": ["Flood", "Earthquake", "Plague"],
+    "Which disciple did Paul commend for having 'the same faith his mother had'?": ["Titus", "Luke", "Mark"],
+    "What did the shepherds do after they had visited Jesus?": ["Returned to their fields", "Kept silent", "Went to Herod"],
+    "Who went back to Jerusalem after the captivity to encourage the people to build the walls of the city again?": ["Ezra", "Zerubbabel", "Haggai"],
+    "Who was the first of the apostles to perform a miracle in the name of Jesus?": ["John", "James", "Andrew"],
+    "How did Korah and his family die after seeking priesthood duties beyond those they already had?": ["Struck by lightning", "Banished from Israel", "Killed by fire"],
+    "What was the name of Isaac’s wife?": ["Rachel", "Sarah", "Leah"],
+    "How does the Bible describe the location of the Garden of Eden?": ["In the west", "Near Egypt", "Beyond the mountains"],
+    "In the vision of Jesus in Revelation, what came out of Jesus’ mouth?": ["Fire", "A scroll", "A crown"],
+    "What was Paul’s home town?": ["Jerusalem", "Antioch", "Corinth"],
+    "Which judge was betrayed to the Philistines by a woman?": ["Gideon", "Jephthah", "Barak"],
+    "What happened to forty-two of the children who made fun of Elisha’s baldness?": ["They were exiled", "They repented", "They were blinded"],
+    "What came out of the fire Paul made on Malta and attacked him?": ["Scorpion", "Wolf", "Lion"],
+    "Who refused to worship Nebuchadnezzar’s golden image?": ["Daniel", "Esther", "Joseph"],
+    "In the Sermon on the Mount, what did Jesus say would happen to the meek?": ["They will be exalted", "They will be blessed", "They will see God"],
+    "Where did Moses first meet his future wife?": ["In Egypt", "At Mount Sinai", "In Canaan"],
+    "Out of the ten lepers Jesus healed, what nationality was the one who returned to thank him?": ["Jew", "Roman", "Greek"],
+    "Who did the men of Athens ignorantly worship?": ["Zeus", "Apollo", "The God of Israel"],
+    "What did Saul see on the road approaching Damascus?": ["An angel", "A cloud", "A vision of heaven"],
+    "How long did Jonah say it would be before Nineveh was to be overthrown?": ["Seven days", "Three days", "Ten days"],
+    "What was the name of Samson’s father?": ["Elkanah", "Jesse", "Boaz"],
+    "Who did Amnon love, and then hate even more than he had loved her?": ["Bathsheba", "Abigail", "Dinah"],
+    "Where were the Jews taken captive to when Jerusalem was destroyed?": ["Egypt", "Persia", "Assyria"],
+    "When was the festival of Passover established?": ["During the flood", "At Mount Sinai", "In Babylon"],
+    "What sin did Noah commit after he began to be a 'man of the soil'?": ["Pride", "Theft", "Lying"],
+    "Why were the Israelites afraid to enter the Promised Land?": ["Lack of water", "Wild animals", "No food"],
+    "What did the silversmith do with Micah’s silver?": ["Made a crown", "Built a temple", "Crafted a sword"],
+    "What was Paul’s profession?": ["Carpenter", "Fisherman", "Tax collector"],
+    "What was the name of Ahasuerus’ new queen?": ["Vashti", "Ruth", "Deborah"],
+    "According to the words of Jesus in the Sermon on the Mount, 'a city that is on a hill cannot be...' what?": ["Destroyed", "Moved", "Built"],
+    "What was the fate of Shechem, the prince who fell in love with Dinah, daughter of Jacob?": ["He was exiled", "He married Dinah", "He became a servant"],
+    "What book of the Bible follows Philemon?": ["James", "Titus", "Jude"],
+    "During Jacob’s struggle with the angel, the hollow of which part of Jacob’s body was touched and put out of joint?": ["Knee", "Shoulder", "Arm"],
+    "Which Christian doctrine did the Sadducees reject?": ["Trinity", "Baptism", "Sabbath"],
+    "For how many years had the woman with the issue of blood suffered before she was healed by Jesus?": ["Seven years", "Ten years", "Fifteen years"],
+    "What was the affliction of Bartimaeus?": ["Deaf", "Lame", "Leprous"],
+    "What was the color of the robe placed on Jesus by the soldiers?": ["White", "Blue", "Green"],
+    "How did Paul say we should let our requests be made known to God?": ["By fasting", "Through sacrifice", "With silence"],
+    "In the Sermon on the Mount, what does Jesus tell us the earth is?": ["God’s throne", "Man’s dominion", "A wilderness"],
+    "In which book of the Bible do we find 'Nebuchadnezzar’s image'?": ["Isaiah", "Jeremiah", "Ezekiel"],
+    "Where was Abraham born?": ["Haran", "Canaan", "Egypt"],
+    "Who was given a son following her prayer to God in the temple, during which the priest accused her of being drunk?": ["Sarah", "Rachel", "Leah"],
+    "Who asked for an understanding heart to judge God’s people?": ["David", "Saul", "Rehoboam"],
+    "What is 'sin'?": ["Ignorance", "Weakness", "Doubt"],
+    "For how many years did David reign?": ["Seven years", "Ten years", "Twenty years"],
+    "How many Psalms are there in the Bible?": ["100", "120", "200"],
+    "Jesus used a little child to show the futility of an argument among the disciples. What were they arguing about?": ["Who would betray Jesus", "Who would lead them", "Who was the wisest"],
+    "Whose twelve year old daughter did Jesus raise from the dead?": ["Lazarus’", "Peter’s", "Cornelius’"],
+    "What was the name of Ruth’s great-grandson?": ["Jesse", "Boaz", "Solomon"],
+    "On what island was John when he was given the vision of Revelation?": ["Malta", "Crete", "Cyprus"],
+    "What happened to King Nebuchadnezzar before being restored as king?": ["He was imprisoned", "He fled to Egypt", "He lost a battle"],
+    "Where did Jonah try to run to instead of going to Nineveh as God had commanded?": ["Jerusalem", "Egypt", "Damascus"],
+    "Who did Paul send to Rome, requesting that she was given a welcome worthy of the saints?": ["Lydia", "Priscilla", "Mary"],
+    "Whose mother took him a little coat once a year?": ["David", "Joseph", "Timothy"],
+    "Which judge killed Eglon, King of Moab?": ["Gideon", "Samson", "Deborah"],
+    "In a parable told by Jesus, what did the rich man do with the surplus of crops that he grew?": ["Gave them to the poor", "Burned them", "Sold them"],
+    "In the parable of the leaven, what is leaven more commonly known as?": ["Salt", "Flour", "Oil"],
+    "What bird could poor people use for sacrifices if they could not afford lambs?": ["Sparrows", "Ravens", "Eagles"],
+    "Which book of prophecy was the Ethiopian eunuch reading from?": ["Jeremiah", "Ezekiel", "Daniel"],
+    "Who said, 'When I was a child, I spake as a child, I understood as a child, I thought as a child: but when I became a man, I put away childish things'?": ["Peter", "John", "James"],
+    "What is the first line of Psalm 1?": ["The Lord is my shepherd", "Make a joyful noise", "How blessed are those"],
+    "What was Peter's mother-in-law sick with?": ["Leprosy", "Blindness", "Lameness"],
+    "Who instructed her daughter to ask for the head of John the Baptist?": ["Salome", "Mary", "Joanna"],
+    "Who decreed that a census of the entire Roman world should be taken at the time of Jesus' birth?": ["Herod", "Pilate", "Tiberius"],
+    "Which woman, who was 'full of good works and acts of charity', was raised from the dead by Peter at Lydda?": ["Lydia", "Martha", "Phoebe"],
+    "What did Daniel do for Nebuchadnezzar that no-one else was able to do?": ["Built a palace", "Led his army", "Healed him"],
+    "What was on the head of the woman 'clothed with the sun'?": ["A golden veil", "A silver crown", "A halo of light"],
+    "How did Uriah, Bathsheba's husband, die?": ["He fell ill", "He drowned", "He was poisoned"],
+    "When Paul was shipwrecked on Malta how many people on the ship drowned?": ["Half", "All", "Ten"],
+    "How did Jesus say true worshippers should worship God when he was talking to the woman at the well?": ["With sacrifices", "In Jerusalem", "With hymns"],
+    "Which profession does Jesus compare himself to spiritually?": ["Carpenter", "Fisherman", "Teacher"],
+    "Under the Mosaic Law, what was the punishment for someone who hit their father?": ["Exile", "Flogging", "Fine"],
+    "What presents did Pharaoh give to Joseph when he was given charge of Egypt?": ["A chariot", "A sword", "A crown"],
+    "What was taken off and handed over to signify the agreement between Boaz and the kinsman?": ["Cloak", "Staff", "Ring"],
+    "Peacocks were imported by which king of Israel?": ["David", "Saul", "Hezekiah"],
+    "Why did Boaz allow Ruth to glean in his field?": ["She was wealthy", "She was his cousin", "She was a priestess"],
+    "What punishment was Zacharias given for not believing the angel?": ["He was blinded", "He was exiled", "He was struck ill"],
+    "Which direction did the scorching wind upon Jonah come from?": ["West", "North", "South"],
+    "Why did the kinsman not want to marry Ruth?": ["She was barren", "She was a foreigner", "She was too old"],
+    "How many times did Samson lie about his source of strength to Delilah?": ["Two", "Four", "Five"],
+    "Which book of the Bible begins with 'The book of the generation of Jesus Christ, the son of David, the son of Abraham.'?": ["Luke", "John", "Mark"],
+    "Jephthah made a vow to God, with what effect on his daughter?": ["She was married", "She became a priestess", "She was exiled"],
+    "Who did Mary suppose Jesus to be at first after the resurrection?": ["A disciple", "An angel", "A soldier"],
+    "How did Jesus reveal the one who would betray him?": ["Pointed at him", "Named him", "Looked at him"],
+    "Which two Old Testament characters appeared with Jesus at the transfiguration?": ["Abraham and Isaac", "David and Solomon", "Isaiah and Jeremiah"],
+    "Who prayed for the fiery serpents to be taken away from Israel?": ["Aaron", "Joshua", "Caleb"],
+    "Which married couple did Paul become friends with at Corinth?": ["Ananias and Sapphira", "Mary and Joseph", "Lydia and Silas"],
+    "Who persuaded Delilah to betray Samson?": ["Her family", "The king", "Samson’s brothers"],
+    "When Jesus died, for how long was there darkness over the land?": ["One hour", "Six hours", "Twelve hours"],
+    "What service did Nehemiah perform for King Artaxerxes?": ["Scribe", "Guard", "Advisor"],
+    "What is the next line of the Lord’s Prayer after 'Give us this day our daily bread...'?": ["Thy kingdom come", "Deliver us from evil", "Hallowed be thy name"],
+    "What did Abigail prevent David from doing to Nabal?": ["Stealing from him", "Exiling him", "Cursing him"],
+    "Who became nurse to Ruth’s son?": ["Ruth", "Leah", "Rachel"],
+    "According to the law, why could the Israelites not eat blood?": ["It was unclean", "It was bitter", "It was sacred to idols"],
+    "What relation was Jacob to Abraham?": ["Son", "Brother", "Nephew"],
+    "What killed the plant that God had provided Jonah for shade?": ["A storm", "A fire", "A drought"],
+    "What did the prophet Micah say about Jesus’ birth?": ["He would be born in Jerusalem", "He would be born in Nazareth", "He would be born in Egypt"],
+    "What did John do with the little book he took from the angel?": ["He read it", "He burned it", "He hid it"],
+    "Who went up yearly to worship God in Shiloh, and one year prayed to God for a baby?": ["Sarah", "Rachel", "Rebekah"],
+    "In which tribe was the city of Bethlehem?": ["Benjamin", "Levi", "Ephraim"],
+    "What was Peter doing when he denied Jesus for the second time?": ["Fishing", "Praying", "Eating"],
+    "What did Jonah do while he waited to see Nineveh’s fate?": ["Fled again", "Prayed in the city", "Slept by the sea"],
+    "Who carried the cross for Christ?": ["John", "Peter", "Joseph of Arimathea"],
+    "On which mountain range did Noah’s ark come to rest?": ["Sinai", "Zion", "Carmel"],
+    "Which two tribes of Israel were not named after sons of Jacob?": ["Judah and Levi", "Reuben and Simeon", "Dan and Naphtali"],
+    "What did the Queen of Sheba give to Solomon?": ["Silver and horses", "Wine and garments", "Books and scrolls"],
+    "What should Philemon do if his slave owed him anything?": ["Forgive the debt", "Punish him", "Send him away"],
+    "How many books are there in the Old Testament?": ["Twenty-seven", "Forty-two", "Thirty-six"],
+    "According to Old Testament law, what should you not cook a young goat in?": ["Water", "Wine", "Olive oil"],
+    "What did Joseph want to do when he discovered Mary was pregnant?": ["Accuse her publicly", "Marry her immediately", "Send her to her family"],
+    "What did Boaz say Naomi was selling?": ["A house", "Grain", "Cattle"],
+    "Abram was rich in gold, silver and what else?": ["Camels", "Sheep", "Horses"],
+    "How much of Elijah’s spirit did Elisha receive?": ["Half", "Equal", "Triple"],
+    "What was unusual about the 700 Benjamite soldiers who could sling a stone and hit their target every time?": ["They were blind", "They were young", "They were right-handed"],
+    "What relation was Annas to Caiaphas?": ["Brother", "Son", "Uncle"],
+    "According to James, what is “pure and undefiled religion”?": ["Fasting regularly", "Giving alms", "Studying scripture daily"],
+    "When in prison at what time did Paul and Silas pray and sing to God?": ["Morning", "Evening", "Noon"],
+    "What did Daniel and his three friends eat instead of the king’s meat and drink?": ["Bread and wine", "Fruits and nuts", "Fish and water"],
+    "What did Jesus say is the “greatest commandment in the law”?": ["Honor your parents", "Keep the Sabbath", "Do not steal"],
+    "Who was afflicted with leprosy for speaking out against Moses?": ["Aaron", "Korah", "Naaman"],
+    "After the Babylonian exile, the Jews sought wealth and possessions for themselves. What should they have been doing?": ["Farming the land", "Fighting enemies", "Writing laws"],
+    "What did God count Abram’s faith to him as?": ["Wisdom", "Strength", "Honor"],
+    "What sin stopped Moses from leading the children of Israel into the Promised Land?": ["Disobeying God’s command to enter", "Killing an Egyptian", "Making an idol"],
+    "Whose hair when cut annually weighed two hundred shekels by the king’s weight?": ["Samson", "David", "Solomon"],
+    "During what traumatic event did the Apostle Paul take bread and give thanks?": ["Earthquake", "Imprisonment", "Flogging"],
+    "Which man killed a lion with his bare hands?": ["David", "Goliath", "Benaiah"],
+    "What was the sign that the angels gave to the shepherds, so that they would recognize Jesus?": ["A bright star", "A loud voice", "A halo of light"],
+    "Who was to be named Zacharias, after the name of his father, until his mother intervened?": ["Jesus", "Joseph", "Samuel"],
+    "In what town did Jesus turn water into wine?": ["Nazareth", "Bethlehem", "Capernaum"],
+    "How long had the infirm man lain at the pool of Bethesda?": ["Twelve years", "Twenty years", "Fifty years"],
+    "What “doeth good like a medicine”?": ["A kind word", "A strong hand", "A wise mind"],
+    "What was God to give Abraham as an everlasting possession?": ["Egypt", "Jerusalem", "The desert"],
+    "What lie was told about Naboth that led to him being stoned and Ahab taking possession of his vineyard?": ["He stole from the king", "He attacked a priest", "He cursed the people"],
+    "Which supernatural being or beings does the Bible say the Sadducees did not believe in?": ["Demons", "Ghosts", "Spirits"],
+    "Who won the hand of Caleb’s daughter, Achsah?": ["Joshua", "Gideon", "Samson"],
+    "What is the “light of the body”?": ["The heart", "The mind", "The soul"],
+    "The southern kingdom of divided Israel eventually fell, but to which great power?": ["Assyria", "Persia", "Rome"],
+    "You will be healed if you “pray for one another” and what else?": ["Fast", "Give offerings", "Repent daily"],
+    "What is in the hypocrite’s eye?": ["A speck", "A mote", "Dust"],
+    "Which book of the Bible follows Jonah?": ["Amos", "Hosea", "Obadiah"],
+    "What inscription was on the altar in Athens?": ["To Zeus", "To All Gods", "To Wisdom"],
+    "In which book of prophecy do we read about the valley of dry bones?": ["Isaiah", "Jeremiah", "Daniel"],
+    "Which baby was named after his mother’s laughter?": ["Jacob", "Joseph", "Esau"],
+    "Demetrius, of Ephesus was a...?": ["Carpenter", "Fisherman", "Tax collector"],
+    "On which day of the year could the High Priest enter the Holiest Place, the inner most part of the temple where the covenant box was kept?": ["Passover", "Sabbath", "Feast of Tabernacles"],
+    "What was the name of the temple gate at which the lame man was laid daily?": ["Golden Gate", "Sheep Gate", "Eastern Gate"],
+    "To which Jewish sect did Nicodemus belong?": ["Sadducees", "Essenes", "Zealots"],
+    "What is the first recorded dream of Joseph, son of Jacob?": ["A ladder to heaven", "Sun and moon bowing", "A great flood"],
+    "To which tribe did the Apostle Paul belong?": ["Judah", "Levi", "Ephraim"],
+    "How does James say we should 'wait for the coming of the Lord'?": ["Quickly", "Anxiously", "Silently"],
+    "The blessed man will be like a tree planted by... what?": ["Mountains", "Deserts", "Valleys"],
+    "How old was Abraham when his son Isaac was born?": ["70", "90", "120"],
+    "In the parable of the Pharisee and the Publican, what did the Pharisee thank God for?": ["His wealth", "His wisdom", "His health"],
+    "How many times did Jesus say you should forgive your brother when he sins against you?": ["Seven", "Twelve", "One hundred"],
+    "What question concerning marriage did the Pharisees use to tempt Jesus?": ["Should men marry multiple wives?", "Can a woman divorce her husband?", "Is marriage eternal?"],
+    "How does Paul tell us to 'work out our own salvation'?": ["With joy and gladness", "With strength and courage", "With pride and confidence"],
+    "In the parable of the cloth and wine, why does no man put new wine into old bottles?": ["It tastes better", "It ferments faster", "It spills out"],
+    "In which city did King Herod live at the time of Jesus' birth?": ["Bethlehem", "Nazareth", "Capernaum"],
+    "What is the 'root of all evil'?": ["Pride", "Lust", "Anger"],
+    "What does the law say to do when you see a bird in its nest?": ["Take the eggs", "Capture the bird", "Leave the nest alone"],
+    "Which tribe of Israel received no inheritance of land?": ["Judah", "Benjamin", "Ephraim"],
+    "In Nebuchadnezzar's dream what happened to destroy the statue made from different metals?": ["A fire burned it", "A flood washed it away", "A wind scattered it"],
+    "Which King took possession of Naboth's vineyard?": ["Saul", "David", "Solomon"],
+    "For how many days did Jesus appear to his disciples after his resurrection?": ["Seven", "Twelve", "Three"],
+    "Who did Paul write a letter to concerning his slave Onesimus?": ["Timothy", "Titus", "Barnabas"],
+    "How many churches of Asia Minor were listed in Revelation?": ["Three", "Five", "Twelve"],
+    "What object did Gideon place on the ground to receive a sign from God?": ["Stone", "Wood", "Cloth"],
+    "Why did Moses' hand become leprous?": ["As punishment", "To curse him", "To heal him"],
+    "In which city in Judah did Cyrus tell the Israelites to build the temple?": ["Bethlehem", "Hebron", "Shiloh"],
+    "Which missionary was described as having 'known the holy scriptures from an early age'?": ["Paul", "Barnabas", "Silas"],
+    "What affliction did Paul strike Elymas the sorcerer down with?": ["Deafness", "Lameness", "Muteness"],
+    "Who was Boaz a kinsman of?": ["Naomi", "Ruth", "Mahlon"],
+    "What animals were carved on Solomon's throne?": ["Eagles", "Bulls", "Horses"],
+    "What did Jesus and the disciples have for breakfast when Jesus appeared to them after the resurrection by the Sea of Tiberias?": ["Wine and grapes", "Lamb and herbs", "Oil and figs"],
+    "Which woman was a seller of purple goods?": ["Mary", "Martha", "Priscilla"],
+    "What were the restrictions on marriage for the daughters of Zelophehad?": ["They could not marry", "They must marry foreigners", "They must marry priests"],
+    "Who said, 'A light to lighten the Gentiles, and the glory of thy people Israel,' when he saw Jesus?": ["Zacharias", "Joseph", "John"],
+    "How did Moses assure victory against the Amalekites?": ["Built an altar", "Blew a trumpet", "Raised a banner"],
+    "What was the occupation of Hosea's wife?": ["Prophetess", "Seamstress", "Midwife"],
+    "In the Sermon on the Mount, what does Jesus say you should do when you fast?": ["Wear sackcloth", "Pray loudly", "Rest quietly"],
+    "Which church did Jesus accuse of being lukewarm?": ["Ephesus", "Smyrna", "Philadelphia"],
+    "Why are the Thessalonians told not to worry about those Christians who have died?": ["They are in heaven", "They were judged", "They are sleeping"],
+    "In the parable of the sower, what happened to the seed that fell on the path?": ["Grew quickly", "Was burned", "Was drowned"],
+    "What was the name of the man who requested Jesus' body for burial?": ["Nicodemus", "Pilate", "Caiaphas"],
+    "How many Philistines did Samson say he had killed with the jawbone of a donkey?": ["100", "500", "10,000"],
+    "Which book of the Bible precedes Jonah?": ["Amos", "Micah", "Nahum"],
+    "Who did Samuel anoint as the first King of Israel?": ["David", "Jonathan", "Abner"],
+    "What was mankind's first sin in the Bible?": ["Lying", "Stealing", "Murder"],
+    "What was the first bird released from the ark?": ["Dove", "Eagle", "Sparrow"],
+    "What nationality was Timothy's father?": ["Roman", "Jewish", "Syrian"],
+    "In Revelation, what is the 'number of a man'?": ["777", "144", "1,000"],
+    "How many elders sat around the throne of God?": ["Seven", "Twelve", "Ten"],
+    "What order did Joshua give to God while fighting the Amorites?": ["Send rain", "Bring darkness", "Cause an earthquake"],
+    "How many years did the Lord add to Hezekiah's life after being healed of his sickness?": ["Seven", "Ten", "Twenty"],
+    "What was the second plague upon Egypt?": ["Lice", "Locusts", "Darkness"],
+    "Which disciple looked after Mary, after the death of Jesus?": ["Peter", "James", "Thomas"],
+    "Jesus was a high priest after the order of which ancient king, mentioned in Psalm 110?": ["David", "Solomon", "Aaron"],
+    "Which two provinces looked up to Thessalonica as an example?": ["Galatia & Phrygia", "Asia & Bithynia", "Corinth & Ephesus"],
+    "Who was Noah's father?": ["Enoch", "Methuselah", "Jared"],
+}
+
+
+@lru_cache(maxsize=1)
+def question_index():
+    """Range index from bank positions to the verses each question cites, built on first use."""
+    return ReferenceIndex((i, q["reference"]) for i, q in enumerate(static_question_bank))
+
+
+def questions_touching(reference):
+    """Bank questions citing any verse of ``reference`` ("John 3", "Gen 1:1-5")."""
+    return [static_question_bank[i] for i in question_index().touching(reference)]
+
+
+def generate_bible_trivia_questions(num_questions=5, used_questions=None, rng=random, reference=None):
+    """
+    ``rng`` may be a seeded ``random.Random`` to get a reproducible quiz;
+    ``reference`` limits the quiz to questions about that passage (an empty
+    list when none cite it). Once the bank runs low, only its own questions
+    are forgotten from ``used_questions``.
+    """
+    if used_questions is None:
+        used_questions = set()
+
+    bank = questions_touching(reference) if reference else static_question_bank
+    if not bank:
+        return []
+    available_questions = [q for q in bank if q["question"] not in used_questions]
+
+    if len(available_questions) < num_questions:
+        used_questions.difference_update(q["question"] for q in bank)
+        available_questions = bank.copy()
+
+    selected_questions = rng.sample(available_questions, min(num_questions, len(available_questions)))
+    trivia_questions = []
+
+    for q in selected_questions:
+        correct = q["correct"]
+        distractors = distractors_bank.get(q["question"], [])
+        
+        # Fallback if no specific distractors are defined
+        if not distractors:
+            if correct in people_pool:
+                distractors = rng.sample([x for x in people_pool if x != correct], 3)
+            elif correct in places_pool:
+                distractors = rng.sample([x for x in places_pool if x != correct], 3)
+            elif correct in objects_pool:
+                distractors = rng.sample([x for x in objects_pool if x != correct], 3)
+            elif correct in numbers_pool:
+                distractors = rng.sample([x for x in numbers_pool if x != correct], 3)
+        
+        options = [correct] + distractors
+        rng.shuffle(options)
+        trivia_questions.append({
+            "question": q["question"],
+            "options": options,
+            "correct": correct,
+            "reference": q["reference"]
+        })
+        used_questions.add(q["question"])
+
+    return trivia_questions
@@ -0,0 +1,179 @@
+"""
+Turn Bible references in free text into biblehub.com markdown links.
+
+The pattern is built once from the known book names and abbreviations, so
+only real references match (not every "word N:N"), and results are cached
+per text because the same messages are linked again on every rerun.
+"""
+import re
+from functools import lru_cache
+
+# Book names and common abbreviations -> biblehub URL slug
+BOOK_SLUGS = {
+    "Psalm": "psalms", "Psalms": "psalms", "Ps": "psalms", "Song of Solomon": "song_of_solomon",
+    "Song of Songs": "song_of_songs", "Jn": "john", "John": "john",
+    "Gen": "genesis", "Genesis": "genesis", "Exod": "exodus", "Exo": "exodus", "Exodus": "exodus",
+    "Lev": "leviticus", "Leviticus": "leviticus", "Num": "numbers", "Numbers": "numbers",
+    "Deut": "deuteronomy", "Deuteronomy": "deuteronomy", "Josh": "joshua", "Joshua": "joshua",
+    "Judg": "judges", "Jdg": "judges", "Judges": "judges", "Ruth": "ruth",
+    "1 Samuel": "1_samuel", "1 Sam": "1_samuel", "2 Samuel": "2_samuel", "2 Sam": "2_samuel", "1 Kings": "1_kings", "1 Ki": "1_kings", "2 Kings": "2_kings", "2 Ki": "2_kings",
+    "1 Chronicles": "1_chronicles", "2 Chronicles": "2_chronicles", "Ezra": "ezra",
+    "Nehemiah": "nehemiah", "Esther": "esther", "Job": "job", "Prov": "proverbs",
+    "Proverbs": "proverbs", "Ecclesiastes": "ecclesiastes", "Isaiah": "isaiah",
+    "Jeremiah": "jeremiah", "Lamentations": "lamentations", "Ezekiel": "ezekiel",
+    "Daniel": "daniel", "Dan": "daniel", "Hosea": "hosea", "Hos": "hosea", "Joel": "joel", "Amos": "amos",
+    "Obadiah": "obadiah", "Jonah": "jonah", "Jon": "jonah", "Micah": "micah", "Nahum": "nahum",
+    "Habakkuk": "habakkuk", "Zephaniah": "zephaniah", "Haggai": "haggai",
+    "Zechariah": "zechariah", "Malachi": "malachi", "Matthew": "matthew", "Matt": "matthew",
+    "Mark": "mark", "Luke": "luke", "Acts": "acts",
+    "Romans": "romans", "Rom": "romans", "1 Corinthians": "1_corinthians", "2 Corinthians": "2_corinthians",
+    "Galatians": "galatians", "Ephesians": "ephesians", "Philippians": "philippians",
+    "Colossians": "colossians", "1 Thessalonians": "1_thessalonians",
+    "2 Thessalonians": "2_thessalonians", "1 Timothy": "1_timothy", "1 Tim": "1_timothy", "2 Timothy": "2_timothy", "2 Tim": "2_timothy",
+    "Titus": "titus", "Philemon": "philemon", "Phm": "philemon", "Hebrews": "hebrews", "James": "james",
+    "1 Peter": "1_peter", "2 Peter": "2_peter", "1 John": "1_john", "2 John": "2_john",
+    "3 John": "3_john", "Jude": "jude", "Revelation": "revelation",
+    # Short forms used by the trivia and hangman references
+    "Ex": "exodus", "Dt": "deuteronomy", "Jdgs": "judges", "1 Kgs": "1_kings", "2 Kgs": "2_kings",
+    "1 Chr": "1_chronicles", "2 Chr": "2_chronicles", "1 Chron": "1_chronicles", "2 Chron": "2_chronicles",
+    "Ezr": "ezra", "Neh": "nehemiah", "Est": "esther", "Pro": "proverbs", "Prv": "proverbs",
+    "Eccl": "ecclesiastes", "Ecc": "ecclesiastes", "Isa": "isaiah", "Jer": "jeremiah", "Lam": "lamentations",
+    "Ezek": "ezekiel", "Eze": "ezekiel", "Oba": "obadiah", "Obad": "obadiah", "Mic": "micah",
+    "Nah": "nahum", "Hab": "habakkuk", "Zeph": "zephaniah", "Zep": "zephaniah", "Hag": "haggai",
+    "Zech": "zechariah", "Zec": "zechariah", "Mal": "malachi", "Mt": "matthew", "Mk": "mark", "Lk": "luke",
+    "1 Cor": "1_corinthians", "2 Cor": "2_corinthians", "Gal": "galatians", "Eph": "ephesians",
+    "Phil": "philippians", "Php": "philippians", "Col": "colossians", "1 Th": "1_thessalonians",
+    "1 Thess": "1_thessalonians", "2 Th": "2_thessalonians", "2 Thess": "2_thessalonians", "Tit": "titus",
+    "Philem": "philemon", "Heb": "hebrews", "Jas": "james", "Jam": "james", "1 Pe": "1_peter",
+    "1 Pet": "1_peter", "2 Pe": "2_peter", "2 Pet": "2_peter", "1 Jn": "1_john", "2 Jn": "2_john",
+    "3 Jn": "3_john", "Rev": "revelation",
+}
+
+LINK_CACHE_SIZE = 4096
+
+
+def _book_key(name):
+    """'1 Sam', '1Sam' and '1 sam' all map to the same key."""
+    return "".join(name.split()).lower()
+
+
+_SLUG_BY_KEY = {_book_key(name): slug for name, slug in BOOK_SLUGS.items()}
+
+
+def _trie_regex(names):
+    """
+    Regex matching any of ``names``, factored as a character trie.
+
+    A flat "a|b|c..." alternation makes the engine try every book at every
+    word; the trie fails after the first character for almost all of them.
+    Spaces match any whitespace, and are optional after a leading book
+    number ("1Sam 17:49"). Optional tails are greedy, so the longest name wins.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for i, ch in enumerate(name.lower()):
+            token = (r"\s?" if i == 1 and name[0] in "123" else r"\s+") if ch == " " else re.escape(ch)
+            node = node.setdefault(token, {})
+        node[""] = {}  # end of a name
+
+    def build(node):
+        ends = "" in node
+        branches = [token + build(child) for token, child in node.items() if token]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends:
+            return ("(?:" + body + ")?") if len(branches) == 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+# Any known book name or abbreviation (use with re.IGNORECASE).
+BOOK_NAME_REGEX = _trie_regex(BOOK_SLUGS)
+
+# One compiled pattern over every known book name and abbreviation.
+BIBLE_VERSE_PATTERN = re.compile(
+    r"\b(" + BOOK_NAME_REGEX + r")\s(\d{1,3}):(\d{1,3})(?:-(\d{1,3}))?\b",
+    re.IGNORECASE,
+)
+
+
+def book_slug(book):
+    """biblehub slug for a book name or abbreviation, or None if unknown."""
+    return _SLUG_BY_KEY.get(_book_key(book))
+
+
+def _link(match):
+    book, chapter, verse, end_verse = match.groups()
+    display = f"{book} {chapter}:{verse}" + (f"-{end_verse}" if end_verse else "")
+    return f"[{display}](https://biblehub.com/{_SLUG_BY_KEY[_book_key(book)]}/{chapter}-{verse}.htm)"
+
+
+@lru_cache(maxsize=LINK_CACHE_SIZE)
+def link_bible_verses(text, version="BSB"):
+    if ":" not in text:
+        return text
+    return BIBLE_VERSE_PATTERN.sub(_link, text)
+
+
+# Longest possible reference: the longest book name plus " 176:176-176".
+MAX_REFERENCE_LENGTH = max(map(len, BOOK_SLUGS)) + 12
+
+
+class IncrementalVerseLinker:
+    """
+    Link a message that arrives in chunks without rescanning all of it.
+
+    Text is released once it is far enough behind the end of the stream
+    (``MAX_REFERENCE_LENGTH``) that no reference can still change, and only
+    at a non-word character outside any match, so "John 3:" followed by
+    "16" links exactly as "John 3:16" would. Each chunk only rescans the held
+    back tail, keeping a long streamed reply linear instead of quadratic.
+
+        linker = IncrementalVerseLinker()
+        for chunk in stream:
+            linker.feed(chunk)
+            placeholder.markdown(linker.markdown())
+        final = linker.flush()
+    """
+
+    def __init__(self):
+        self._done = []      # linked text that can no longer change
+        self._pending = ""   # raw tail that may still be part of a reference
+
+    def _safe_cut(self):
+        buf = self._pending
+        cut = len(buf) - MAX_REFERENCE_LENGTH
+        while cut > 0 and (buf[cut - 1].isalnum() or buf[cut - 1] == "_"):
+            cut -= 1
+        if cut <= 0:
+            return 0
+        for match in BIBLE_VERSE_PATTERN.finditer(buf):
+            if match.start() >= cut:
+                break
+            if match.end() > cut:
+                return match.start()
+        return cut
+
+    def feed(self, chunk):
+        """Add a chunk; returns the newly finalized, linked text (possibly empty)."""
+        self._pending += chunk
+        cut = self._safe_cut()
+        if not cut:
+            return ""
+        released = BIBLE_VERSE_PATTERN.sub(_link, self._pending[:cut])
+        self._pending = self._pending[cut:]
+        self._done.append(released)
+        return released
+
+    def markdown(self):
+        """Everything so far, with the unfinished tail linked tentatively."""
+        return "".join(self._done) + BIBLE_VERSE_PATTERN.sub(_link, self._pending)
+
+    def flush(self):
+        """End of stream: link the tail and return the whole message."""
+        self._done.append(BIBLE_VERSE_PATTERN.sub(_link, self._pending))
+        self._pending = ""
+        return "".join(self._done)
@@ -0,0 +1,387 @@
+"""
+The eight prayer watches and their vectorized computation.
+
+``calculate_hours`` in app.py splits daylight and darkness into twelve equal
+hours each; every watch is one of those hours. ``watch_windows`` does the same
+arithmetic on NumPy datetime64 arrays so a month or a year of days (or many
+locations at once) is computed in a single pass. Sunrise and sunset for a
+range come from ``sun_times``, a vectorized NOAA sunrise equation accurate to
+about a minute, so schedules can be built without calling aladhan.
+"""
+import calendar
+import csv
+import io
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from keepwatch import aladhan
+from keepwatch.caching import LRUCache, SingleFlight
+
+# "hours"/"index" address calculate_hours(sunrise, sunset) -> (day_hours, night_hours).
+# "day_offset" moves a window onto the calendar day it belongs to: night_hours[11]
+# ends at the *next* sunrise, so the Sunrise Hour for a date is the previous one.
+WATCHES = [
+    {
+        "key": "sunrise",
+        "name": "Sunrise Hour",
+        "period": "day",
+        "hours": "night",
+        "index": 11,
+        "day_offset": -1,
+        "significance": "Rejoice in the new day and commit plans to the LORD (Psalm 5:3).",
+        "reflection": "Celebrate the dawning of faith and His mercies.",
+    },
+    {
+        "key": "third_hour",
+        "name": "Third Hour (The Trial)",
+        "period": "day",
+        "hours": "day",
+        "index": 2,
+        "day_offset": 0,
+        "significance": "The Holy Presence descended at Pentecost, empowering believers to fulfill their purpose (Acts 2:1-15). This is a time of purpose and power—a sacred hour to reflect on the LORD's plans, crucify the flesh (Galatians 2:20), and appropriate the benefits of the Messiah's suffering.",
+        "reflection": "Align your life with divine purpose and pursue meaningful work, avoiding idleness (Matthew 20:1-5). Let the third hour, when they brought the Messiah to face trial (Mark 15:25), remind you of His ultimate suffering—a call to dedicate your actions to endurance.",
+    },
+    {
+        "key": "sixth_hour",
+        "name": "Sixth Hour (The Crucifixion)",
+        "period": "day",
+        "hours": "day",
+        "index": 5,
+        "day_offset": 0,
+        "significance": "The Sixth Hour marks the height of the day, a time of divine clarity. The Messiah encountered the Samaritan woman at Jacob's well (John 4:6), and Peter received a vision (Acts 10:9-13).",
+        "reflection": "Reflect on the Messiah's trial before Pilate (John 19:14-16) and His crucifixion, which opened the path for forgiveness and reconciliation with God.",
+    },
+    {
+        "key": "ninth_hour",
+        "name": "Ninth Hour (The Sacrifice)",
+        "period": "day",
+        "hours": "day",
+        "index": 8,
+        "day_offset": 0,
+        "significance": "The Messiah's death on the cross tore the temple veil, symbolizing direct access to God (Matthew 27:45-51).",
+        "reflection": "Consider Cornelius's prayers (Acts 10:30-33) and Peter and John's devotion (Acts 3:1), reflecting God's grace and triumph.",
+    },
+    {
+        "key": "sunset",
+        "name": "Sunset Hour (The Burial/Resurrection)",
+        "period": "night",
+        "hours": "day",
+        "index": 11,
+        "day_offset": 0,
+        "significance": "A time of transition, symbolizing the Messiah's burial and resurrection (Mark 15:42-47).",
+        "reflection": "Trust in divine power to transform darkness into light and endings into new beginnings.",
+    },
+    {
+        "key": "second_watch",
+        "name": "Second Watch of Night",
+        "period": "night",
+        "hours": "night",
+        "index": 2,
+        "day_offset": 0,
+        "significance": "A time of intercession and vigilance (Luke 12:38).",
+        "reflection": "Pray for divine intervention and protection.",
+    },
+    {
+        "key": "third_watch",
+        "name": "Third Watch of Midnight",
+        "period": "night",
+        "hours": "night",
+        "index": 5,
+        "day_offset": 0,
+        "significance": "Seek deliverance through prayer and praise (Matthew 25:1-13, Acts 16:25, Exodus 12:29-30).",
+        "reflection": "Rise to give thanks (Psalm 119:62) as divine power brings peace and clarity.",
+    },
+    {
+        "key": "fourth_watch",
+        "name": "Fourth Watch of Night",
+        "period": "night",
+        "hours": "night",
+        "index": 8,
+        "day_offset": 0,
+        "significance": "The hour of breakthrough when the Messiah walked on water (Mark 6:48).",
+        "reflection": "Pray for victory over challenges as night transitions to dawn.",
+    },
+]
+
+# Locations within the same 0.1° cell (~11 km) see sunrise within half a minute
+# of each other, so they share one cached schedule per day.
+CELL_DEGREES = 0.1
+SCHEDULE_CACHE_SIZE = 8192
+
+SUN_ALTITUDE_DEG = -0.833  # upper limb on the horizon, with refraction
+_J2000 = np.datetime64("2000-01-01T12:00:00", "s")
+_DAY = np.timedelta64(86400, "s")
+_USES_DAY_HOURS = np.array([w["hours"] == "day" for w in WATCHES])
+_HOUR_INDEX = np.array([w["index"] for w in WATCHES])
+_DAY_OFFSET = np.array([w["day_offset"] for w in WATCHES]) * _DAY
+
+
+def sun_times(latitude, longitude, dates):
+    """
+    Sunrise and sunset (UTC datetime64[s]) for local calendar ``dates``.
+
+    ``latitude``/``longitude`` (degrees, east positive) broadcast against
+    ``dates``, so one location over many days and many locations on one day
+    are both single vectorized calls. Days without a sunrise or sunset
+    (polar day/night) come back as NaT.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.asarray(longitude, dtype=float)
+
+    n = (dates - np.datetime64("2000-01-01", "D")).astype(float)
+    j_star = n - lon / 360.0
+    m = np.radians((357.5291 + 0.98560028 * j_star) % 360)
+    c = 1.9148 * np.sin(m) + 0.02 * np.sin(2 * m) + 0.0003 * np.sin(3 * m)
+    ecliptic_lon = np.radians((np.degrees(m) + c + 180 + 102.9372) % 360)
+    transit = j_star + 0.0053 * np.sin(m) - 0.0069 * np.sin(2 * ecliptic_lon)
+
+    sin_decl = np.sin(ecliptic_lon) * np.sin(np.radians(23.4397))
+    cos_decl = np.cos(np.arcsin(sin_decl))
+    cos_hour_angle = (np.sin(np.radians(SUN_ALTITUDE_DEG)) - np.sin(lat) * sin_decl) / (np.cos(lat) * cos_decl)
+    polar = np.abs(cos_hour_angle) > 1
+    hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1, 1))) / 360.0
+
+    def to_datetime64(julian_offset):
+        seconds = np.round(julian_offset * 86400).astype("int64")
+        result = _J2000 + seconds.astype("timedelta64[s]")
+        return np.where(polar, np.datetime64("NaT", "s"), result)
+
+    return to_datetime64(transit - hour_angle), to_datetime64(transit + hour_angle)
+
+
+def watch_windows(sunrise, sunset):
+    """
+    Start/end of all eight watches for arrays of sunrise/sunset instants.
+
+    Same arithmetic as ``calculate_hours``: a day hour is 1/12 of
+    sunset - sunrise, a night hour 1/12 of the remaining 24h. Returns two
+    datetime64[s] arrays shaped ``sunrise.shape + (8,)`` in ``WATCHES`` order.
+    """
+    sunrise = np.asarray(sunrise, dtype="datetime64[s]")[..., None]
+    sunset = np.asarray(sunset, dtype="datetime64[s]")[..., None]
+    day_hour = (sunset - sunrise) / 12
+    night_hour = (_DAY - (sunset - sunrise)) / 12
+
+    base = np.where(_USES_DAY_HOURS, sunrise, sunset)
+    length = np.where(_USES_DAY_HOURS, day_hour, night_hour)
+    starts = base + length * _HOUR_INDEX + _DAY_OFFSET
+    return starts, starts + length
+
+
+def split_hours(sunrise, sunset):
+    """Twelve day hours and twelve night hours as (start, end) pairs, like ``calculate_hours``."""
+    day_hour_length = (sunset - sunrise) / 12
+    night_hour_length = (timedelta(hours=24) - (sunset - sunrise)) / 12
+    day_hours = [(sunrise + day_hour_length * i, sunrise + day_hour_length * (i + 1)) for i in range(12)]
+    night_hours = [(sunset + night_hour_length * i, sunset + night_hour_length * (i + 1)) for i in range(12)]
+    return day_hours, night_hours
+
+
+def _shift_days(moment, days):
+    moment += timedelta(days=days)
+    normalize = getattr(moment.tzinfo, "normalize", None)  # pytz: fix the UTC offset across DST
+    return normalize(moment) if normalize else moment
+
+
+def windows_from_hours(day_hours, night_hours):
+    """
+    The eight (start, end) pairs out of ``calculate_hours`` output, in ``WATCHES``
+    order, moved by each watch's ``day_offset`` exactly as ``watch_windows`` does.
+    """
+    hours = {"day": day_hours, "night": night_hours}
+    windows = []
+    for w in WATCHES:
+        start, end = hours[w["hours"]][w["index"]]
+        if w["day_offset"]:
+            start, end = _shift_days(start, w["day_offset"]), _shift_days(end, w["day_offset"])
+        windows.append((start, end))
+    return windows
+
+
+def location_cell(latitude, longitude, timezone_name):
+    return (round(latitude / CELL_DEGREES), round(longitude / CELL_DEGREES), timezone_name)
+
+
+def schedule_key(location, day):
+    """Cache key shared by every spelling of a place: (lat cell, lon cell, tz, date)."""
+    return (*location_cell(location.latitude, location.longitude, location.timezone), day.isoformat())
+
+
+# Finished per-day schedules, shared by every session in the process.
+SCHEDULE_CACHE = LRUCache(maxsize=SCHEDULE_CACHE_SIZE, name="watch_schedule")
+_month_fetches = SingleFlight("aladhan_calendar")
+_MISSING = object()
+
+
+def parse_aladhan_time(time_str, day, timezone_name):
+    """'06:12 (EDT)' on ``day`` -> timezone-aware datetime; ``aladhan.AladhanError`` for placeholders like '--:-- (--)'."""
+    try:
+        clock = datetime.strptime(time_str.split(" ")[0], "%H:%M").time()
+    except ValueError:
+        raise aladhan.AladhanError(f"No usable time in {time_str!r} for {day}")
+    return pytz.timezone(timezone_name).localize(datetime.combine(day, clock))
+
+
+def schedule_from_timings(timings, day, timezone_name):
+    sunrise = parse_aladhan_time(timings["Sunrise"], day, timezone_name)
+    sunset = parse_aladhan_time(timings["Sunset"], day, timezone_name)
+    return {"sunrise": sunrise, "sunset": sunset, "windows": windows_from_hours(*split_hours(sunrise, sunset))}
+
+
+def fetch_month_schedules(location, year, month, method=aladhan.DEFAULT_METHOD):
+    """
+    Pull a whole month from aladhan's calendar endpoint in one request and
+    store every day in ``SCHEDULE_CACHE``. Returns ``{date: schedule}``, with
+    None for days without a sunrise or sunset (polar day or night).
+    """
+    timings_by_day = aladhan.fetch_calendar(location.latitude, location.longitude, location.timezone, year, month, method)
+    schedules = {}
+    for day, timings in timings_by_day.items():
+        try:
+            schedules[day] = schedule_from_timings(timings, day, location.timezone)
+        except aladhan.AladhanError:
+            schedules[day] = None  # cached too, so polar days don't refetch the month
+        SCHEDULE_CACHE.put(schedule_key(location, day), schedules[day])
+    return schedules
+
+
+def get_day_schedule(location, day, method=aladhan.DEFAULT_METHOD):
+    """
+    Watch schedule for ``location`` on ``day``, served from the shared cache.
+
+    A miss fetches the whole month, so the rest of that month is answered
+    locally for every location in the same cell. Sunrise and sunset do not
+    depend on the calculation method, hence it is not part of the key.
+    Returns None when the sun does not rise or set that day. Raises
+    ``aladhan.AladhanError`` or ``requests.RequestException``.
+    """
+    key = schedule_key(location, day)
+    schedule = SCHEDULE_CACHE.get(key, _MISSING)
+    if schedule is _MISSING:
+        # Sessions missing the same cell-month at once wait on one calendar request.
+        month_key = (*key[:3], day.year, day.month)
+        schedules = _month_fetches.do(month_key, fetch_month_schedules, location, day.year, day.month, method)
+        schedule = schedules.get(day)
+    return schedule
+
+
+def month_range(year, month):
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def year_range(year):
+    return date(year, 1, 1), date(year, 12, 31)
+
+
+def watch_schedule(location, start_date, end_date):
+    """
+    Every watch for every day in [start_date, end_date] at ``location``.
+
+    Returns a long-form DataFrame (one row per day and watch) with
+    timezone-aware local ``start``/``end`` columns.
+    """
+    dates = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+    sunrise, sunset = sun_times(location.latitude, location.longitude, dates)
+    starts, ends = watch_windows(sunrise, sunset)
+
+    def localize(values):
+        minutes = values.ravel().astype("datetime64[m]")
+        return pd.DatetimeIndex(minutes).tz_localize("UTC").tz_convert(location.timezone)
+
+    return pd.DataFrame({
+        "date": np.repeat(dates, len(WATCHES)).astype("datetime64[D]").astype(object),
+        "key": np.tile([w["key"] for w in WATCHES], len(dates)),
+        "watch": np.tile([w["name"] for w in WATCHES], len(dates)),
+        "start": localize(starts),
+        "end": localize(ends),
+    })
+
+
+def schedule_table(schedule):
+    """One printable row per day with a 'hh:mm AM - hh:mm AM' column per watch."""
+    labels = (
+        schedule["start"].dt.strftime("%I:%M %p") + " - " + schedule["end"].dt.strftime("%I:%M %p")
+    ).where(schedule["start"].notna(), "—")
+    table = schedule.assign(time=labels).pivot(index="date", columns="watch", values="time")
+    return table[[w["name"] for w in WATCHES]].rename_axis(index="Date", columns=None)
+
+
+def schedule_to_csv(schedule):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["date", "watch", "start", "end"])
+    for row in schedule.itertuples(index=False):
+        if pd.isna(row.start):
+            continue
+        writer.writerow([row.date.isoformat(), row.watch, row.start.isoformat(), row.end.isoformat()])
+    return out.getvalue()
+
+
+def _ics_escape(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line):
+    # RFC 5545: lines longer than 75 octets continue on lines starting with a space.
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts, current = [], b""
+    for ch in line:
+        piece = ch.encode("utf-8")
+        if len(current) + len(piece) > (75 if not parts else 74):
+            parts.append(current.decode("utf-8"))
+            current = b""
+        current += piece
+    parts.append(current.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def _ics_times(values):
+    # YYYYMMDDTHHMMSSZ; NumPy's ISO formatting is much faster than Series.dt.strftime
+    utc = values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy("datetime64[s]")
+    return [text.replace("-", "").replace(":", "") + "Z" for text in np.datetime_as_string(utc, unit="s").tolist()]
+
+
+def schedule_to_ics(schedule, location):
+    """iCalendar file with one event per watch; times are written in UTC."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    cell = f"{location.latitude:.2f}_{location.longitude:.2f}"
+    place = _ics_fold(f"LOCATION:{_ics_escape(location.label)}")
+    # The text of each watch is the same every day: escape and fold it once.
+    texts = {
+        w["key"]: (
+            _ics_fold(f"SUMMARY:{_ics_escape(w['name'])}"),
+            _ics_fold(f"DESCRIPTION:{_ics_escape(w['significance'] + chr(10) * 2 + w['reflection'])}"),
+        )
+        for w in WATCHES
+    }
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//KeepWatch//Prayer Watches//EN",
+        "CALSCALE:GREGORIAN",
+        _ics_fold(f"X-WR-CALNAME:{_ics_escape(f'Prayer Watches — {location.label}')}"),
+        f"X-WR-TIMEZONE:{location.timezone}",
+    ]
+    schedule = schedule[schedule["start"].notna()]
+    for day, key, start, end in zip(schedule["date"], schedule["key"],
+                                    _ics_times(schedule["start"]), _ics_times(schedule["end"])):
+        summary, description = texts[key]
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{day.isoformat()}-{key}-{cell}@keepwatch",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start}",
+            f"DTEND:{end}",
+            summary,
+            description,
+            place,
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
@@ -0,0 +1,128 @@
+"""
+Local stand-in for the aladhan.com API.
+
+Serves ``/v1/timingsByCity``, ``/v1/timings/{DD-MM-YYYY}`` and
+``/v1/calendar/{year}/{month}`` with sunrise/sunset from
+``keepwatch.watches.sun_times``, and counts requests per endpoint at
+``/stats``. Run it and point the app at it:
+
+    python scripts/aladhan_stub.py --port 8765
+    ALADHAN_BASE_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+"""
+import argparse
+import calendar
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from keepwatch.gazetteer import resolve_location  # noqa: E402
+from keepwatch.watches import sun_times  # noqa: E402
+
+REQUEST_COUNTS = Counter()
+_counts_lock = threading.Lock()
+
+
+def _clock(instant, tz_name):
+    if np.isnat(instant):
+        return "--:-- (--)"
+    return pd.Timestamp(instant).tz_localize("UTC").tz_convert(tz_name).strftime("%H:%M (%Z)")
+
+
+def day_payload(latitude, longitude, tz_name, days):
+    sunrise, sunset = sun_times(latitude, longitude, np.array(days, dtype="datetime64[D]"))
+    return [
+        {
+            "timings": {"Sunrise": _clock(rise, tz_name), "Sunset": _clock(set_, tz_name)},
+            "date": {"gregorian": {"date": day.strftime("%d-%m-%Y")}},
+            "meta": {"latitude": latitude, "longitude": longitude, "timezone": tz_name, "method": {"id": 2}},
+        }
+        for day, rise, set_ in zip(days, sunrise, sunset)
+    ]
+
+
+class AladhanStubHandler(BaseHTTPRequestHandler):
+    latency_ms = 0
+    fail_rate = 0.0
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if parts == ["stats"]:
+            with _counts_lock:
+                return self._send(200, dict(REQUEST_COUNTS))
+
+        endpoint = parts[1] if len(parts) > 1 else ""
+        with _counts_lock:
+            REQUEST_COUNTS[endpoint] += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if random.random() < self.fail_rate:
+            return self._send(500, {"code": 500, "status": "Injected failure"})
+
+        try:
+            if endpoint == "timingsByCity":
+                location = resolve_location(query.get("city", ""), query.get("country"))
+                if not location:
+                    return self._send(400, {"code": 400, "status": "Bad Request", "data": "Unable to locate city"})
+                day = datetime.strptime(query["date"], "%d-%m-%Y").date() if "date" in query else date.today()
+                payload = day_payload(location.latitude, location.longitude, location.timezone, [day])[0]
+            elif endpoint == "timings":
+                day = datetime.strptime(parts[2], "%d-%m-%Y").date() if len(parts) > 2 else date.today()
+                payload = day_payload(float(query["latitude"]), float(query["longitude"]),
+                                      query.get("timezonestring", "UTC"), [day])[0]
+            elif endpoint == "calendar":
+                year, month = int(parts[2]), int(parts[3])
+                days = [date(year, month, d) for d in range(1, calendar.monthrange(year, month)[1] + 1)]
+                payload = day_payload(float(query["latitude"]), float(query["longitude"]),
+                                      query.get("timezonestring", "UTC"), days)
+            else:
+                return self._send(404, {"code": 404, "status": "Not Found"})
+        except (KeyError, ValueError, IndexError) as e:
+            return self._send(400, {"code": 400, "status": "Bad Request", "data": str(e)})
+        self._send(200, {"code": 200, "status": "OK", "data": payload})
+
+
+def serve(port=8765, latency_ms=0, fail_rate=0.0):
+    AladhanStubHandler.latency_ms = latency_ms
+    AladhanStubHandler.fail_rate = fail_rate
+    return ThreadingHTTPServer(("127.0.0.1", port), AladhanStubHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    args = parser.parse_args()
+    server = serve(args.port, args.latency_ms, args.fail_rate)
+    print(f"aladhan stub listening on http://127.0.0.1:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark for ``keepwatch.verses.link_bible_verses``.
+
+Compares the original per-call linker (generic "word N:N" pattern, mapping
+dict rebuilt for every match) with the precompiled alternation, uncached and
+cached, over sample chat transcripts plus the app's trivia and watch texts:
+
+    python scripts/bench_verse_linker.py --repeat 200
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from keepwatch.trivia import static_question_bank  # noqa: E402
+from keepwatch.verses import BIBLE_VERSE_PATTERN, link_bible_verses  # noqa: E402
+from keepwatch.watches import WATCHES  # noqa: E402
+
+LEGACY_PATTERN = re.compile(r'\b([1-3]?\s?[A-Za-z]+)\s(\d{1,3}):(\d{1,3})(?:-(\d{1,3}))?\b', re.IGNORECASE)
+
+
+def legacy_link_bible_verses(text, version="BSB"):
+    """The linker as it was in app.py, kept here as the baseline."""
+    def replacer(match):
+        book, chapter, verse, end_verse = match.groups()
+        book = book.strip()
+        book_mappings = {
+            "Psalm": "psalms", "Psalms": "psalms", "Ps": "psalms", "Song of Solomon": "song_of_solomon",
+            "Song of Songs": "song_of_songs", "Jn": "john", "John": "john",
+            "Gen": "genesis", "Genesis": "genesis", "Exod": "exodus", "Exo": "exodus", "Exodus": "exodus",
+            "Lev": "leviticus", "Leviticus": "leviticus", "Num": "numbers", "Numbers": "numbers",
+            "Deut": "deuteronomy", "Deuteronomy": "deuteronomy", "Josh": "joshua", "Joshua": "joshua",
+            "Judg": "judges", "Jdg": "judges", "Judges": "judges", "Ruth": "ruth",
+            "1 Samuel": "1_samuel", "1 Sam": "1_samuel", "2 Samuel": "2_samuel", "2 Sam": "2_samuel", "1 Kings": "1_kings", "1 Ki": "1_kings", "2 Kings": "2_kings", "2 Ki": "2_kings",
+            "1 Chronicles": "1_chronicles", "2 Chronicles": "2_chronicles", "Ezra": "ezra",
+            "Nehemiah": "nehemiah", "Esther": "esther", "Job": "job", "Prov": "proverbs",
+            "Proverbs": "proverbs", "Ecclesiastes": "ecclesiastes", "Isaiah": "isaiah",
+            "Jeremiah": "jeremiah", "Lamentations": "lamentations", "Ezekiel": "ezekiel",
+            "Daniel": "daniel", "Dan": "daniel", "Hosea": "hosea", "Hos": "hosea", "Joel": "joel", "Amos": "amos",
+            "Obadiah": "obadiah", "Jonah": "jonah", "Jon": "jonah", "Micah": "micah", "Nahum": "nahum",
+            "Habakkuk": "habakkuk", "Zephaniah": "zephaniah", "Haggai": "haggai",
+            "Zechariah": "zechariah", "Malachi": "malachi", "Matthew": "matthew", "Matt": "matthew",
+            "Mark": "mark", "Luke": "luke", "John": "john", "Acts": "acts",
+            "Romans": "romans", "Rom": "romans", "1 Corinthians": "1_corinthians", "2 Corinthians": "2_corinthians",
+            "Galatians": "galatians", "Ephesians": "ephesians", "Philippians": "philippians",
+            "Colossians": "colossians", "1 Thessalonians": "1_thessalonians",
+            "2 Thessalonians": "2_thessalonians", "1 Timothy": "1_timothy", "1 Tim": "1_timothy", "2 Timothy": "2_timothy", "2 Tim": "2_timothy",
+            "Titus": "titus", "Philemon": "philemon", "Phm": "philemon", "Hebrews": "hebrews", "James": "james",
+            "1 Peter": "1_peter", "2 Peter": "2_peter", "1 John": "1_john", "2 John": "2_john",
+            "3 John": "3_john", "Jude": "jude", "Revelation": "revelation"
+        }
+        normalized_book = book_mappings.get(book, book.lower().replace(" ", "_"))
+        base_url = f"https://biblehub.com/{normalized_book}/{chapter}-{verse}.htm"
+        display = f"{book} {chapter}:{verse}" + (f"-{end_verse}" if end_verse else "")
+        return f"[{display}]({base_url})"
+    return LEGACY_PATTERN.sub(replacer, text)
+
+
+def load_corpus(path):
+    with open(path, encoding="utf-8") as f:
+        chat = [json.loads(line)["content"] for line in f if line.strip()]
+    trivia = [q["question"] for q in static_question_bank] + [q["reference"] for q in static_question_bank]
+    watches = [w[field] for w in WATCHES for field in ("significance", "reflection")]
+    return {"chat transcripts": chat, "trivia questions/references": trivia, "watch descriptions": watches}
+
+
+def per_call_us(fn, texts, repeat):
+    seconds = timeit.timeit(lambda: [fn(t) for t in texts], number=repeat)
+    return seconds / (repeat * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transcripts", default=os.path.join(HERE, "data", "chat_transcripts.jsonl"))
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    uncached = link_bible_verses.__wrapped__
+    print(f"{'corpus':30} {'texts':>6} {'legacy us':>10} {'compiled us':>12} {'cached us':>10}")
+    for name, texts in load_corpus(args.transcripts).items():
+        legacy = per_call_us(legacy_link_bible_verses, texts, args.repeat)
+        compiled = per_call_us(uncached, texts, args.repeat)
+        link_bible_verses.cache_clear()
+        cached = per_call_us(link_bible_verses, texts, args.repeat)
+        print(f"{name:30} {len(texts):>6} {legacy:>10.2f} {compiled:>12.2f} {cached:>10.2f}")
+
+    # Where the two disagree: false positives the generic pattern linked, and
+    # abbreviations it linked to non-existent biblehub pages.
+    texts = [t for group in load_corpus(args.transcripts).values() for t in group]
+    legacy_refs = {m.group(0).strip() for t in texts for m in LEGACY_PATTERN.finditer(t)}
+    compiled_refs = {m.group(0) for t in texts for m in BIBLE_VERSE_PATTERN.finditer(t)}
+    print(f"\nreferences linked: legacy {len(legacy_refs)}, compiled {len(compiled_refs)}")
+    print("only legacy:", sorted(legacy_refs - compiled_refs)[:15])
+    print("only compiled:", sorted(compiled_refs - legacy_refs)[:15])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Rebuild keepwatch/data/cities.tsv (and countries.tsv) from a GeoNames dump.
+
+Download ``cities1000.zip`` and ``countryInfo.txt`` from
+https://download.geonames.org/export/dump/, unzip, then run:
+
+    python scripts/build_gazetteer.py cities1000.txt --countries countryInfo.txt
+
+Timezones are resolved offline with timezonefinder; the GeoNames timezone
+column is only used where timezonefinder has no answer (e.g. small islands).
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from keepwatch.gazetteer import CITIES_PATH, COUNTRIES_PATH, timezone_at  # noqa: E402
+
+MAX_ALTERNATE_NAMES = 6
+CITIES_HEADER = "# name\tasciiname\talternatenames\tcountry_code\tadmin1_code\tlatitude\tlongitude\tpopulation\ttimezone\n"
+
+
+def _latin_alternates(alternates, name):
+    # GeoNames lists every transliteration; keep a few short Latin-script ones.
+    kept = []
+    for alt in alternates.split(","):
+        alt = alt.strip()
+        if alt and alt != name and len(alt) <= 40 and all(ord(ch) < 0x250 for ch in alt):
+            kept.append(alt)
+        if len(kept) >= MAX_ALTERNATE_NAMES:
+            break
+    return ",".join(kept)
+
+
+def build_cities(source, dest, min_population):
+    count = 0
+    with open(source, encoding="utf-8") as src, open(dest, "w", encoding="utf-8") as out:
+        out.write(CITIES_HEADER)
+        for line in src:
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) < 18:
+                continue
+            name, ascii_name, alternates = cols[1], cols[2], cols[3]
+            lat, lon = float(cols[4]), float(cols[5])
+            country_code, admin1 = cols[8], cols[10]
+            population = int(cols[14] or 0)
+            if population < min_population:
+                continue
+            tz = timezone_at(lat, lon) or cols[17]
+            out.write("\t".join([
+                name, ascii_name, _latin_alternates(alternates, name), country_code, admin1,
+                f"{lat:.5f}", f"{lon:.5f}", str(population), tz,
+            ]) + "\n")
+            count += 1
+    return count
+
+
+def build_countries(source, dest):
+    # Keep hand-maintained aliases ("USA", "UK", ...) from the existing file.
+    aliases = {}
+    if os.path.exists(dest):
+        with open(dest, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#") or not line.strip():
+                    continue
+                cols = line.rstrip("\n").split("\t")
+                aliases[cols[0]] = cols[3] if len(cols) > 3 else ""
+
+    rows = []
+    with open(source, encoding="utf-8") as src:
+        for line in src:
+            if line.startswith("#") or not line.strip():
+                continue
+            cols = line.rstrip("\n").split("\t")
+            rows.append((cols[0], cols[1], cols[4], aliases.get(cols[0], "")))
+
+    with open(dest, "w", encoding="utf-8") as out:
+        out.write("# iso2\tiso3\tname\taliases (comma separated)\n")
+        for row in sorted(rows):
+            out.write("\t".join(row) + "\n")
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cities", help="GeoNames citiesNNNN.txt")
+    parser.add_argument("--countries", help="GeoNames countryInfo.txt")
+    parser.add_argument("--min-population", type=int, default=1000)
+    parser.add_argument("--out", default=CITIES_PATH)
+    args = parser.parse_args()
+
+    print(f"Wrote {build_cities(args.cities, args.out, args.min_population)} cities to {args.out}")
+    if args.countries:
+        print(f"Wrote {build_countries(args.countries, COUNTRIES_PATH)} countries to {COUNTRIES_PATH}")
+
+
+if __name__ == "__main__":
+    main()
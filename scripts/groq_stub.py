@@ -0,0 +1,199 @@
+"""
+Local stand-in for the Groq chat completions API.
+
+Serves ``POST /openai/v1/chat/completions``, streamed (server-sent events,
+usage on the final chunk as Groq sends it) or not, with answers taken from
+``scripts/data/chat_transcripts.jsonl``. Time to first token is drawn from a
+log-normal distribution, tokens then arrive at ``--tokens-per-s``, and a
+fraction of requests can be answered 429 (with ``Retry-After``), 500, or left
+hanging to exercise client timeouts. ``/stats`` reports request counts and
+peak concurrency. The Groq SDK reads ``GROQ_BASE_URL``:
+
+    python scripts/groq_stub.py --port 8787 --ttft-ms 400 --rate-429 0.05
+    GROQ_BASE_URL=http://127.0.0.1:8787 streamlit run app.py
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from keepwatch.chat_context import estimate_tokens  # noqa: E402
+
+TRANSCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "chat_transcripts.jsonl")
+COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+_TOKEN = re.compile(r"\S+\s*")
+_ids = itertools.count(1)
+_stats_lock = threading.Lock()
+STATS = Counter()
+
+
+def _answers():
+    with open(TRANSCRIPTS, encoding="utf-8") as f:
+        messages = [json.loads(line) for line in f if line.strip()]
+    return [m["content"] for m in messages if m["role"] == "assistant"]
+
+
+ANSWERS = _answers()
+
+
+def answer_for(messages, max_tokens=None):
+    """A canned answer chosen by the last user message, so repeated questions get the same reply."""
+    question = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+    pick = int(hashlib.sha1(question.encode("utf-8")).hexdigest(), 16) % len(ANSWERS)
+    tokens = _TOKEN.findall(ANSWERS[pick])
+    return tokens[:max_tokens] if max_tokens else tokens
+
+
+def _usage(messages, completion_tokens):
+    prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens}
+
+
+def _count(key, value=1):
+    with _stats_lock:
+        STATS[key] += value
+
+
+class GroqStubHandler(BaseHTTPRequestHandler):
+    ttft_ms = 300.0
+    ttft_sigma = 0.5        # log-normal spread; 0 means every request waits exactly ttft_ms
+    tokens_per_s = 250.0
+    rate_429 = 0.0
+    rate_500 = 0.0
+    rate_timeout = 0.0
+    timeout_s = 90.0        # longer than the SDK's 60 s default, so the client gives up first
+    in_flight = 0
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, payload, headers=()):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message, code, headers=()):
+        self._send(status, {"error": {"message": message, "type": "stub", "code": code}}, headers)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            with _stats_lock:
+                return self._send(200, dict(STATS))
+        self._error(404, "Not found", "not_found")
+
+    def do_POST(self):
+        if self.path.rstrip("/") != COMPLETIONS_PATH:
+            return self._error(404, "Not found", "not_found")
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        _count("requests")
+        with _stats_lock:
+            GroqStubHandler.in_flight += 1
+            STATS["peak_in_flight"] = max(STATS["peak_in_flight"], GroqStubHandler.in_flight)
+        try:
+            self._complete(request)
+        except (BrokenPipeError, ConnectionResetError):
+            _count("client_disconnects")  # e.g. a cancelled hedge or a client timeout
+        finally:
+            with _stats_lock:
+                GroqStubHandler.in_flight -= 1
+
+    def _complete(self, request):
+        roll = random.random()
+        if roll < self.rate_429:
+            _count("injected_429")
+            return self._error(429, "Rate limit reached (stub)", "rate_limit_exceeded", [("retry-after", "1")])
+        if roll < self.rate_429 + self.rate_500:
+            _count("injected_500")
+            return self._error(500, "Internal server error (stub)", "internal_server_error")
+        if roll < self.rate_429 + self.rate_500 + self.rate_timeout:
+            _count("injected_timeouts")
+            time.sleep(self.timeout_s)
+            return self._error(504, "Timed out (stub)", "timeout")
+
+        messages, model = request.get("messages", []), request.get("model", "stub")
+        tokens = answer_for(messages, request.get("max_tokens"))
+        ttft = self.ttft_ms * math.exp(random.gauss(0, self.ttft_sigma)) if self.ttft_sigma else self.ttft_ms
+        time.sleep(ttft / 1000)
+        _count("completion_tokens", len(tokens))
+        usage = _usage(messages, len(tokens))
+        completion_id, created = f"chatcmpl-stub-{next(_ids)}", int(time.time())
+        if not request.get("stream"):
+            time.sleep(len(tokens) / self.tokens_per_s)
+            return self._send(200, {
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)},
+                             "finish_reason": "stop"}],
+                "usage": usage,
+            })
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def event(delta, finish_reason=None, **extra):
+            chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}], **extra}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for token in tokens:
+            event({"content": token})
+            time.sleep(1 / self.tokens_per_s)
+        event({}, "stop", x_groq={"id": completion_id, "usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def serve(port=8787, ttft_ms=300.0, ttft_sigma=0.5, tokens_per_s=250.0, rate_429=0.0, rate_500=0.0,
+          rate_timeout=0.0, timeout_s=90.0):
+    GroqStubHandler.ttft_ms = ttft_ms
+    GroqStubHandler.ttft_sigma = ttft_sigma
+    GroqStubHandler.tokens_per_s = tokens_per_s
+    GroqStubHandler.rate_429 = rate_429
+    GroqStubHandler.rate_500 = rate_500
+    GroqStubHandler.rate_timeout = rate_timeout
+    GroqStubHandler.timeout_s = timeout_s
+    return ThreadingHTTPServer(("127.0.0.1", port), GroqStubHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="median time to first token")
+    parser.add_argument("--ttft-sigma", type=float, default=0.5, help="log-normal spread of the time to first token")
+    parser.add_argument("--tokens-per-s", type=float, default=250.0, help="streaming speed after the first token")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered 429")
+    parser.add_argument("--rate-500", type=float, default=0.0, help="fraction of requests answered 500")
+    parser.add_argument("--rate-timeout", type=float, default=0.0, help="fraction of requests left hanging")
+    parser.add_argument("--timeout-s", type=float, default=90.0, help="how long a hanging request hangs")
+    args = parser.parse_args()
+    server = serve(args.port, args.ttft_ms, args.ttft_sigma, args.tokens_per_s, args.rate_429, args.rate_500,
+                   args.rate_timeout, args.timeout_s)
+    print(f"groq stub listening on http://127.0.0.1:{args.port} (set GROQ_BASE_URL to this)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
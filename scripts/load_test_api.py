@@ -0,0 +1,110 @@
+"""
+Load test for ``keepwatch.api``.
+
+Fires a mix of watch, verse-link and trivia requests from concurrent
+clients and reports throughput, latency percentiles and status codes:
+
+    python -m keepwatch.api --port 8600
+    python scripts/load_test_api.py --url http://127.0.0.1:8600 --clients 32 --requests 5000
+
+``--self-host`` starts the API and an aladhan stub in this process instead,
+so the run needs no network.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+CITIES = [
+    ("New York", "US"), ("brooklyn, ny", "USA"), ("Paris", "France"), ("London", "UK"),
+    ("Lagos", "Nigeria"), ("Nairobi", "Kenya"), ("Tokyo", "Japan"), ("Sao Paulo", "Brazil"),
+    ("Manila", "Philippines"), ("Seoul", "South Korea"), ("Accra", "Ghana"), ("Sydney", "Australia"),
+]
+TEXTS = [
+    "Pray without ceasing (1 Thessalonians 5:17).",
+    "Could you not watch with me one hour? Matthew 26:40-41",
+    "My soul waits for the Lord more than watchmen for the morning, Psalm 130:6.",
+    "Continue in prayer, and watch in the same with thanksgiving - Col 4:2 and Luke 21:36.",
+]
+
+
+def _request(session, base_url, rng):
+    roll = rng.random()
+    if roll < 0.6:
+        city, country = rng.choice(CITIES)
+        return session.get(f"{base_url}/v1/watches", params={"city": city, "country": country}, timeout=30)
+    if roll < 0.85:
+        return session.get(f"{base_url}/v1/verses", params={"text": rng.choice(TEXTS)}, timeout=30)
+    return session.get(f"{base_url}/v1/trivia", params={"count": 5, "seed": rng.randrange(50)}, timeout=30)
+
+
+def run(base_url, clients, total, seed=0):
+    latencies, statuses = [], Counter()
+    lock = threading.Lock()
+    per_client = total // clients
+
+    def client(index):
+        rng = random.Random(seed + index)
+        session = requests.Session()
+        for _ in range(per_client):
+            started = time.perf_counter()
+            try:
+                status = _request(session, base_url, rng).status_code
+            except requests.RequestException as e:
+                status = type(e).__name__
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(client, range(clients)))
+    wall = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (0, 0, 0)
+    print(f"{len(latencies)} requests from {clients} clients in {wall:.2f}s -> {len(latencies) / wall:.0f} req/s")
+    print(f"latency ms: p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}  max {max(latencies or [0]):.1f}")
+    print("status:", dict(statuses))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8600")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--self-host", action="store_true", help="run the API and an aladhan stub in-process")
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    if args.self_host:
+        from aladhan_stub import serve as serve_stub
+        from keepwatch import aladhan
+        from keepwatch.api import serve
+        stub = serve_stub(port=0)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+        aladhan.ALADHAN_BASE_URL = f"{stub_url}/v1"  # _get reads it per request
+        api = serve(port=0)
+        threading.Thread(target=api.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{api.server_address[1]}"
+
+    run(base_url, args.clients, args.requests)
+    if args.self_host:
+        print("aladhan requests:", requests.get(f"{stub_url}/stats", timeout=5).json())
+        snapshot = requests.get(f"{base_url}/metrics", timeout=5).json()
+        hits, misses = (snapshot["counters"].get(f"cache.api_response.{k}", 0) for k in ("hit", "miss"))
+        print(f"response cache: {hits:.0f} hits, {misses:.0f} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Load test for the Faith Companion chat.
+
+Runs ``--sessions`` concurrent chat sessions through ``app.py`` with
+Streamlit's ``AppTest`` (the same script, session state, LLM queue, router
+and caches the server uses, all in this process). Each session asks
+``--turns`` questions from ``scripts/data/chat_transcripts.jsonl``. The test
+reports turns per second, turn latency percentiles, failed turns, and the
+app's own TTFT, queue wait and hedge numbers:
+
+    python scripts/groq_stub.py --port 8787 --ttft-ms 400 --rate-429 0.05
+    GROQ_BASE_URL=http://127.0.0.1:8787 python scripts/load_test_chat.py --sessions 20 --turns 3
+
+``--self-host`` starts a Groq stub in this process instead. The LLM queue
+keeps its limits (``KEEPWATCH_LLM_RPM`` and the rest), so set those to the
+quota being tested. The response cache and call log go to a temporary
+directory unless ``KEEPWATCH_RESPONSE_CACHE`` or ``KEEPWATCH_LLM_ACCOUNTING``
+is set.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(SCRIPTS, "..")
+sys.path.insert(0, ROOT)
+
+FAILURE_MARKERS = {"❌": "error", "⏳": "rate_limited"}
+
+
+def questions():
+    with open(os.path.join(SCRIPTS, "data", "chat_transcripts.jsonl"), encoding="utf-8") as f:
+        messages = [json.loads(line) for line in f if line.strip()]
+    return [m["content"] for m in messages if m["role"] == "user"]
+
+
+def run(sessions, turns, timeout=300):
+    from streamlit.testing.v1 import AppTest
+
+    asked = questions()
+    latencies, outcomes = [], Counter()
+    lock = threading.Lock()
+
+    def session(index):
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+        at.secrets["api_keys"] = {"GROQ_API_TOKEN": os.environ.get("GROQ_API_TOKEN", "stub")}
+        at.session_state["authenticated"] = True
+        at.session_state["username"] = f"loadtest-{index}"
+        at.run()
+        at.sidebar.radio(key="sidebar_navigation").set_value("💬 Faith Companion").run()
+        for turn in range(turns):
+            started = time.perf_counter()
+            at.chat_input[0].set_value(asked[(index + turn) % len(asked)]).run()
+            elapsed = (time.perf_counter() - started) * 1000
+            reply = at.session_state["messages"][-1]["content"]
+            outcome = "exception" if at.exception else next(
+                (name for marker, name in FAILURE_MARKERS.items() if marker in reply), "ok")
+            with lock:
+                latencies.append(elapsed)
+                outcomes[outcome] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        list(pool.map(session, range(sessions)))
+    wall = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (0, 0, 0)
+    print(f"{len(latencies)} turns from {sessions} sessions in {wall:.2f}s -> {len(latencies) / wall:.2f} turns/s")
+    print(f"turn latency ms: p50 {p50:.0f}  p95 {p95:.0f}  p99 {p99:.0f}  max {max(latencies or [0]):.0f}")
+    print("outcomes:", dict(outcomes))
+
+
+def report_metrics():
+    from keepwatch import metrics
+    snapshot = metrics.snapshot()
+    for name in ("chat.ttft_ms", "chat.reply_ms", "llm.queue_wait_ms"):
+        summary = snapshot["summaries"].get(name)
+        if summary:
+            print(f"{name}: p50 {summary['p50']:.0f}  p95 {summary['p95']:.0f}  max {summary['max']:.0f}")
+    counters = {name: int(value) for name, value in snapshot["counters"].items()
+                if name.startswith(("chat.hedge", "chat.route.", "llm.rate_limited", "llm.retries", "llm.errors",
+                                    "cache.chat_response"))}
+    print("counters:", dict(sorted(counters.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=3, help="questions asked by each session")
+    parser.add_argument("--self-host", action="store_true", help="run a Groq stub in-process")
+    parser.add_argument("--ttft-ms", type=float, default=300.0, help="stub median time to first token")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="stub fraction of 429 answers")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="keepwatch-load-")
+    os.environ.setdefault("KEEPWATCH_RESPONSE_CACHE", os.path.join(scratch, "response_cache.sqlite3"))
+    os.environ.setdefault("KEEPWATCH_LLM_ACCOUNTING", os.path.join(scratch, "llm_calls.sqlite3"))
+    if args.self_host:
+        from groq_stub import serve as serve_stub
+        stub = serve_stub(port=0, ttft_ms=args.ttft_ms, rate_429=args.rate_429)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{stub.server_address[1]}"
+    elif "GROQ_BASE_URL" not in os.environ:
+        sys.exit("Set GROQ_BASE_URL to a Groq stub (or pass --self-host) so the test doesn't spend real quota.")
+
+    run(args.sessions, args.turns)
+    report_metrics()
+    if args.self_host:
+        from groq_stub import STATS
+        print("stub:", dict(STATS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import threading
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+from keepwatch import aladhan
+from keepwatch.gazetteer import resolve_location
+from keepwatch.watches import get_day_schedule
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from aladhan_stub import REQUEST_COUNTS, serve  # noqa: E402
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(aladhan, "ALADHAN_BASE_URL", f"{url}/v1")
+    REQUEST_COUNTS.clear()
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def _calendar_requests(url):
+    return requests.get(f"{url}/stats", timeout=5).json().get("calendar", 0)
+
+
+def test_month_of_days_costs_one_calendar_request(stub):
+    location = resolve_location("Paris", "France")
+    first = date(2031, 3, 1)
+    schedules = [get_day_schedule(location, first + timedelta(days=i)) for i in range(31)]
+    assert all(schedule is not None for schedule in schedules)
+    assert _calendar_requests(stub) == 1
+
+
+def test_polar_night_has_no_schedule(stub):
+    location = resolve_location("Tromso", "Norway")
+    assert get_day_schedule(location, date(2031, 12, 21)) is None
+    assert get_day_schedule(location, date(2031, 12, 22)) is None
+    assert _calendar_requests(stub) == 1
@@ -0,0 +1,48 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from keepwatch import api
+
+
+@pytest.fixture
+def api_url():
+    server = api.serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"ab"', False),
+    ('"abcd"', False),
+    ('"xabcx"', False),
+])
+def test_etag_matches(header, matches):
+    assert api.etag_matches(header, '"abc"') is matches
+
+
+def test_if_none_match(api_url):
+    url = f"{api_url}/v1/verses?text=John+3:16"
+    etag = requests.get(url, timeout=5).headers["ETag"]
+    assert requests.get(url, headers={"If-None-Match": f'"other", {etag}'}, timeout=5).status_code == 304
+    assert requests.get(url, headers={"If-None-Match": etag[:-3] + '"'}, timeout=5).status_code == 200
+
+
+def test_metrics_localhost_only(api_url):
+    assert requests.get(f"{api_url}/metrics", timeout=5).status_code == 200
+
+    def allowed(client, public_metrics=False):
+        handler = SimpleNamespace(server=SimpleNamespace(public_metrics=public_metrics), client_address=(client, 50000))
+        return api.ApiHandler._metrics_allowed(handler)
+
+    assert allowed("127.0.0.1") and allowed("::1")
+    assert not allowed("203.0.113.7")
+    assert allowed("203.0.113.7", public_metrics=True)
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1.element_tree import Block, Markdown  # noqa: E402
+
+from keepwatch.chat import COPY_BUTTON, SPEAKERS  # noqa: E402
+from keepwatch.llm_accounting import LEDGER  # noqa: E402
+
+PAYLOAD = "<img src=x onerror=alert(1)> 2 < 3"
+
+
+def _streamed(*args, **kwargs):
+    return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=f"Reply {PAYLOAD}"))])])
+
+
+def _blocks(node):
+    if isinstance(node, Block):
+        yield node
+        for child in node.children.values():
+            yield from _blocks(child)
+
+
+def test_chat_bubbles_render_without_unsafe_html(monkeypatch, tmp_path):
+    monkeypatch.setattr(LEDGER, "path", str(tmp_path / "llm_calls.sqlite3"))
+    monkeypatch.setattr(LEDGER, "_db", None)
+    at = AppTest.from_file("../app.py", default_timeout=30)
+    at.secrets["api_keys"] = {"GROQ_API_TOKEN": "test"}
+    at.session_state["authenticated"] = True
+    at.session_state["username"] = "tester"
+    # A prior turn, so the new question isn't an opening one and skips the shared response cache
+    at.session_state["messages"] = [
+        {"role": "system", "content": "You are Watcher."},
+        {"role": "user", "content": f"Earlier {PAYLOAD}"},
+        {"role": "assistant", "content": f"Answer {PAYLOAD}"},
+    ]
+    with mock.patch("groq.resources.chat.completions.Completions.create", side_effect=_streamed):
+        at.run()
+        at.sidebar.radio(key="sidebar_navigation").set_value("💬 Faith Companion").run()
+        at.chat_input[0].set_value(f"Now {PAYLOAD}").run()
+    LEDGER.flush()  # into tmp_path, not the real call log
+    assert not at.exception
+
+    bubbles = []
+    for block in _blocks(at.main):
+        children = list(block.children.values())
+        if any(isinstance(child, Markdown) and child.value == COPY_BUTTON for child in children):
+            # The copy handler copies the first markdown element in the button's container
+            message, button = children
+            assert button.value == COPY_BUTTON and button.allow_html
+            assert not message.allow_html
+            bubbles.append(message.value)
+    assert [bubble.split(":**")[0] for bubble in bubbles] == [f"**{SPEAKERS[role]}" for role in ("user", "assistant") * 2]
+    assert all(PAYLOAD in bubble for bubble in bubbles)
+    assert not any(PAYLOAD in element.value for element in at.markdown if element.allow_html)
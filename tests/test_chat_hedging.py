@@ -0,0 +1,105 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from keepwatch import chat, metrics
+from keepwatch.llm_accounting import CallLedger
+from keepwatch.llm_dispatch import LLMDispatcher
+
+MESSAGES = [{"role": "user", "content": "What is the fourth watch?"}]
+
+
+def _chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class FakeClient:
+    """Each call streams "<name>: reply" after that call's delay; closed streams stop at once."""
+
+    def __init__(self, *delays):
+        self.delays = list(delays)
+        self.calls = 0
+        self.closed = []
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, messages, model, stream):
+        self.calls += 1
+        delay, name = self.delays.pop(0), f"call{self.calls}"
+        closed = threading.Event()
+        client = self
+
+        class Stream:
+            def __init__(self):
+                self.chunks = iter([_chunk(None), _chunk(f"{name}: "), _chunk("reply")])
+                self.waited = False
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                if self.waited:
+                    return next(self.chunks)
+                chunk = next(self.chunks)  # the role-only first chunk comes at once
+                if closed.wait(delay):
+                    raise ConnectionError("closed")
+                self.waited = True
+                return chunk
+
+            def close(self):
+                if not closed.is_set():
+                    client.closed.append(name)
+                closed.set()
+
+        return Stream()
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, tmp_path):
+    monkeypatch.setattr(chat, "DISPATCHER", LLMDispatcher(max_concurrency=4, requests_per_minute=0))
+    monkeypatch.setattr(chat, "LEDGER", CallLedger(path=str(tmp_path / "llm_calls.sqlite3")))
+    monkeypatch.setattr(chat, "HEDGE_DEFAULT_MS", 200)
+    metrics.reset()
+
+
+def _reply(client, **kwargs):
+    started = time.monotonic()
+    text = "".join(chat.stream_reply(client, MESSAGES, session="s", **kwargs))
+    return text, time.monotonic() - started
+
+
+def test_fast_call_is_not_hedged():
+    text, elapsed = _reply(FakeClient(0.05))
+    assert text == "call1: reply" and elapsed < 0.2
+    assert metrics.counter("chat.hedges") == 0
+    assert metrics.percentiles(f"chat.call_ms.{chat.CHAT_MODEL}", (50,))
+
+
+def test_slow_call_loses_to_its_hedge():
+    client = FakeClient(3.0, 0.05)
+    text, elapsed = _reply(client)
+    assert text == "call2: reply"  # the duplicate
+    assert elapsed < 1
+    assert metrics.counter("chat.hedges") == 1 and metrics.counter("chat.hedge_wins") == 1
+    assert "call1" in client.closed  # the slow primary was cancelled and its stream closed
+    rows = chat.LEDGER.recent()
+    assert sorted((row["hedged"], row["error"]) for row in rows) == [(0, "Cancelled"), (1, None)]
+
+
+def test_primary_can_still_win_the_race():
+    text, _ = _reply(FakeClient(0.25, 3.0))
+    assert text == "call1: reply"
+    assert metrics.counter("chat.hedges") == 1 and metrics.counter("chat.hedge_primary_wins") == 1
+
+
+def test_no_hedge_without_a_free_slot(monkeypatch):
+    monkeypatch.setattr(chat, "DISPATCHER", LLMDispatcher(max_concurrency=1, requests_per_minute=0))
+    text, elapsed = _reply(FakeClient(0.4))
+    assert text == "call1: reply" and elapsed >= 0.4
+    assert metrics.counter("chat.hedges") == 0 and metrics.counter("chat.hedges_skipped") == 1
+
+
+def test_hedging_can_be_turned_off():
+    text, elapsed = _reply(FakeClient(0.4), hedge=False)
+    assert text == "call1: reply" and elapsed >= 0.4 and metrics.counter("chat.hedges") == 0
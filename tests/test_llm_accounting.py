@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from keepwatch import llm_dispatch, metrics
+from keepwatch.llm_accounting import CallLedger, cost_usd
+from keepwatch.llm_dispatch import LLMDispatcher
+
+LARGE, FAST = "llama-3.3-70b-versatile", "llama-3.1-8b-instant"
+
+
+class TooManyRequests(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={})
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return CallLedger(path=str(tmp_path / "llm_calls.sqlite3"), ring_size=10)
+
+
+def test_flush_and_aggregate(ledger):
+    ledger.record("s1", "chat", LARGE, 1000, 200, ttft_ms=300, latency_ms=2000)
+    ledger.record("s1", "chat", LARGE, 1000, 100, ttft_ms=500, latency_ms=3000, hedged=True)
+    ledger.record("s3", "chat", LARGE, 100, 100, ttft_ms=400, latency_ms=2500)
+    ledger.record("s2", "summary", FAST, 400, 50, latency_ms=400)
+    ledger.record("s2", "chat", FAST, 10, None, error="RateLimited")
+    assert ledger.flush() == 5
+    assert ledger.flush() == 0
+
+    models = ledger.by_model()
+    assert models.loc[LARGE, ["calls", "errors", "hedges", "prompt_tokens", "completion_tokens"]].tolist() == [3, 0, 1, 2100, 400]
+    assert models.loc[FAST, ["calls", "errors", "hedges"]].tolist() == [2, 1, 0]
+    assert models.loc[LARGE, "ttft_p50_ms"] == 400 and models.loc[LARGE, "latency_p95_ms"] == 3000
+    assert pd.isna(models.loc[FAST, "ttft_p50_ms"])  # no fast call streamed a token
+
+    sessions = ledger.by_session()
+    assert sessions.index.tolist() == ["s1", "s3", "s2"]  # most expensive first
+    assert sessions.loc["s1", "tokens"] == 2300
+    assert sessions.loc["s1", "cost_usd"] == round(cost_usd(LARGE, 1000, 200) + cost_usd(LARGE, 1000, 100), 4)
+
+
+def test_every_dispatched_attempt_is_recorded(ledger, monkeypatch):
+    monkeypatch.setattr(llm_dispatch, "BASE_BACKOFF_S", 0.01)
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TooManyRequests()
+        usage = SimpleNamespace(prompt_tokens=12, completion_tokens=3)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Amen"))], usage=usage)
+
+    tracked = ledger.track(call, "s", "summary", FAST, prompt_tokens=10)
+    LLMDispatcher(requests_per_minute=0).call("s", tracked)
+    rows = [(row["error"], row["prompt_tokens"], row["completion_tokens"], row["usage_estimated"])
+            for row in reversed(ledger.recent())]
+    assert rows == [("TooManyRequests", 10, None, 1), ("TooManyRequests", 10, None, 1), (None, 12, 3, 0)]
+
+
+def test_failed_flush_keeps_rows_and_is_reported(tmp_path, caplog):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    ledger = CallLedger(path=str(blocker / "llm_calls.sqlite3"), ring_size=3)
+    for _ in range(5):
+        ledger.record("s", "chat", LARGE)
+    assert ledger.flush() == 0
+    assert len(ledger._pending) == 3  # retried next time, up to the ring size
+    assert metrics.counter("llm.accounting.flush_errors") == 1
+    assert metrics.counter("llm.accounting.dropped_rows") == 2
+    assert "Could not write 5 LLM call records" in caplog.text
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from keepwatch import llm_dispatch, metrics
+from keepwatch.llm_dispatch import LLMDispatcher, RateLimited, TokenBucket
+
+
+class TooManyRequests(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={})
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(llm_dispatch, "BASE_BACKOFF_S", 0.01)
+    metrics.reset()
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_rate_limited_call_is_retried():
+    dispatcher = LLMDispatcher(requests_per_minute=0)
+    attempts = []
+
+    def call():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise TooManyRequests()
+        return "answer"
+
+    assert dispatcher.call("s", call) == "answer"
+    assert len(attempts) == 3
+    assert metrics.counter("llm.rate_limited") == 2 and metrics.counter("llm.retries") == 2
+
+
+def test_gives_up_after_max_retries():
+    dispatcher = LLMDispatcher(requests_per_minute=0, max_retries=2)
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        raise TooManyRequests()
+
+    with pytest.raises(RateLimited):
+        dispatcher.call("s", call)
+    assert len(attempts) == 3
+
+
+def test_other_errors_are_not_retried():
+    dispatcher = LLMDispatcher(requests_per_minute=0)
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        dispatcher.call("s", call)
+    assert len(attempts) == 1 and metrics.counter("llm.errors") == 1
+
+
+def test_sessions_are_served_round_robin():
+    dispatcher = LLMDispatcher(max_concurrency=1, requests_per_minute=0)
+    release, started = threading.Event(), []
+
+    def call(name):
+        def run():
+            started.append(name)
+            if name == "a1":
+                release.wait(5)
+            return name
+        return run
+
+    first = dispatcher.submit("a", call("a1"))
+    second = dispatcher.submit("a", call("a2"))
+    _wait_for(lambda: dispatcher._next is second)  # waiting for the only slot
+    jobs = [dispatcher.submit(session, call(name)) for session, name in
+            (("a", "a3"), ("a", "a4"), ("b", "b1"), ("b", "b2"))]
+    assert [job.position() for job in (first, second, *jobs)] == [0, 1, 2, 4, 3, 5]
+    release.set()
+    for job in (first, second, *jobs):
+        job.result()
+    assert started == ["a1", "a2", "a3", "b1", "a4", "b2"]
+
+
+def test_token_bucket_spaces_out_starts():
+    async def take_three():
+        bucket = TokenBucket(per_minute=600, capacity=2)   # 10 per second, 2 at once
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.take()
+        return time.monotonic() - started
+
+    assert 0.08 <= asyncio.run(take_three()) < 0.5
+
+
+class _SlowStream:
+    """Yields one chunk, then blocks until closed, like a Groq stream waiting on the socket."""
+
+    def __init__(self):
+        self.closed = threading.Event()
+        self.sent = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.sent:
+            self.sent = True
+            return "first"
+        if self.closed.wait(60):
+            raise ConnectionError("stream closed")
+        raise StopIteration
+
+    def close(self):
+        self.closed.set()
+
+
+def test_cancel_closes_the_stream_and_frees_the_slot():
+    dispatcher = LLMDispatcher(max_concurrency=1, requests_per_minute=0)
+    stream = _SlowStream()
+    job = dispatcher.submit("s", lambda: stream, stream=True)
+    assert job.get(5) == "first"
+    started = time.monotonic()
+    job.cancel()
+    _wait_for(lambda: dispatcher.running == 0)
+    assert time.monotonic() - started < 1
+    assert stream.closed.is_set() and metrics.counter("llm.cancelled") == 1
+    assert dispatcher.call("s", lambda: "next") == "next"
@@ -0,0 +1,50 @@
+import pytest
+
+from keepwatch import metrics, model_router
+from keepwatch.model_router import FAST_MODEL, LARGE_MODEL, MIN_LATENCY_SAMPLES, complexity, route
+
+MIDDLING = "How should I keep the night watches?"  # between COMPLEXITY_THRESHOLD and BUSY_THRESHOLD
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics(monkeypatch):
+    monkeypatch.setattr(model_router, "MODEL_OVERRIDE", "auto")
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _replies(model, call_ms, queue_ms=0.0):
+    for _ in range(MIN_LATENCY_SAMPLES):
+        metrics.incr(f"chat.replies.{model}")
+        metrics.observe(f"chat.reply_ms.{model}", call_ms + queue_ms)
+        metrics.observe(f"chat.call_ms.{model}", call_ms)
+
+
+def test_complexity_orders_prompts():
+    assert complexity("Thanks!") == 0.0
+    assert complexity("What does John 3:16 say?") < model_router.COMPLEXITY_THRESHOLD
+    assert complexity("Why did Jesus tell the disciples to watch and pray, and how does it relate "
+                      "to the night watches?") >= model_router.COMPLEXITY_THRESHOLD
+    assert complexity("I'm struggling with grief") >= model_router.COMPLEXITY_THRESHOLD
+
+
+def test_routes_by_complexity_and_override():
+    assert route("Thanks!") == (FAST_MODEL, "simple", 0.0)
+    assert route(MIDDLING).model == LARGE_MODEL
+    assert route("Thanks!", override=LARGE_MODEL) == (LARGE_MODEL, "override", None)
+
+
+def test_slow_large_model_sends_middling_prompts_to_the_fast_one():
+    _replies(LARGE_MODEL, call_ms=12000)
+    _replies(FAST_MODEL, call_ms=2000)
+    decision = route(MIDDLING)
+    assert decision.model == FAST_MODEL and decision.reason == "large_model_slow"
+    assert metrics.counter("chat.route.latency_saved_ms") == 10000
+
+
+def test_queue_wait_does_not_count_as_model_latency():
+    # A backlog makes every reply slow, whichever model answers it
+    _replies(LARGE_MODEL, call_ms=3000, queue_ms=20000)
+    _replies(FAST_MODEL, call_ms=1000, queue_ms=20000)
+    assert route(MIDDLING).model == LARGE_MODEL
@@ -0,0 +1,40 @@
+import pytest
+
+from keepwatch.response_cache import ResponseCache, anchors, normalize_prompt
+
+MODEL = "llama-3.3-70b-versatile"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"), near_threshold=0.75)
+    for question in ("What is the fourth watch?", "Who was Moses?", "How should I pray at night?"):
+        cache.put(question, MODEL, "system", "other answer")
+    return cache
+
+
+def test_rephrasing_is_a_near_hit(cache):
+    cache.put("Explain Psalm 23", MODEL, "system", "The Lord is my shepherd ...")
+    assert cache.get("Explain Psalm 23 please", MODEL, "system") == "The Lord is my shepherd ..."
+    assert cache.stats()["near_hits"] == 1
+
+
+@pytest.mark.parametrize("cached, asked", [
+    ("How do I pray the third watch of the night?", "How do I pray the fourth watch of the night?"),
+    ("Explain Psalm 23", "Explain Psalm 24"),
+    ("What did Moses see on the mountain?", "What did Elijah see on the mountain?"),
+])
+def test_different_anchor_is_a_miss(cache, cached, asked):
+    cache.put(cached, MODEL, "system", "cached answer")
+    assert cache.get(asked, MODEL, "system") is None
+
+
+def test_near_matching_is_off_by_default(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"))
+    cache.put("Who was Moses?", MODEL, "system", "A prophet ...")
+    assert cache.get("Who was Moses really?", MODEL, "system") is None
+    assert cache.get("who was moses", MODEL, "system") == "A prophet ..."
+
+
+def test_anchors():
+    assert anchors(normalize_prompt("What does John 3:16 say about the second coming?")) == {"john", "3:16", "second"}
@@ -0,0 +1,20 @@
+from datetime import date
+
+from keepwatch.gazetteer import resolve_location
+from keepwatch.schedule_cli import render_location
+from keepwatch.watches import WATCHES
+
+
+def test_polar_location_renders_without_windows():
+    location = resolve_location("Tromso", "Norway")
+    location_id, csv_rows, ics, days = render_location(("tromso", location, date(2026, 12, 20), date(2026, 12, 22), True))
+    assert (location_id, csv_rows, days) == ("tromso", "", 3)
+    assert "BEGIN:VEVENT" not in ics
+
+
+def test_location_renders_one_row_per_watch():
+    location = resolve_location("Paris", "France")
+    _, csv_rows, _, days = render_location(("paris", location, date(2026, 12, 20), date(2026, 12, 22), False))
+    rows = csv_rows.splitlines()
+    assert days == 3 and len(rows) == 3 * len(WATCHES)
+    assert rows[0].endswith("+01:00")
@@ -0,0 +1,19 @@
+import random
+
+from keepwatch.trivia import generate_bible_trivia_questions, questions_touching, static_question_bank
+
+
+def test_reference_without_questions_leaves_used_set_alone():
+    used = {q["question"] for q in static_question_bank[:50]}
+    assert generate_bible_trivia_questions(5, used, reference="Nahum 2") == []
+    assert len(used) == 50
+
+
+def test_small_passage_only_recycles_its_own_questions():
+    passage = {q["question"] for q in questions_touching("John 3")}
+    assert 0 < len(passage) < 5
+    general = {q["question"] for q in static_question_bank[:50]} - passage
+    used = set(general)
+    quiz = generate_bible_trivia_questions(5, used, rng=random.Random(1), reference="John 3")
+    assert {q["question"] for q in quiz} == passage
+    assert used == general | passage
@@ -0,0 +1,39 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytz
+
+from keepwatch import batch
+from keepwatch.batch import WatchTable, compute_watch_table, write_watch_table
+from keepwatch.gazetteer import resolve_location
+from keepwatch.watches import WATCHES, schedule_from_timings, schedule_key, sun_times
+
+
+def _minute_sun_times(latitudes, longitudes, dates):
+    # aladhan reports whole minutes; give the batch path the same inputs
+    sunrise, sunset = sun_times(latitudes, longitudes, dates)
+    return sunrise.astype("datetime64[m]").astype("datetime64[s]"), sunset.astype("datetime64[m]").astype("datetime64[s]")
+
+
+def _aladhan_clock(instant, tz):
+    moment = datetime.fromtimestamp(int(instant.astype("datetime64[s]").astype(np.int64)), timezone.utc)
+    return moment.astimezone(tz).strftime("%H:%M (%Z)")
+
+
+def test_batch_and_aladhan_paths_agree(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "sun_times", _minute_sun_times)
+    location = resolve_location("New York", "US")
+    day = date(2026, 10, 20)
+    table = compute_watch_table(["u1"], [location.latitude], [location.longitude], [location.timezone],
+                                np.array([day], dtype="datetime64[D]"))
+    write_watch_table(str(tmp_path / "watch_table.npz"), table)
+    from_batch = WatchTable(str(tmp_path / "watch_table.npz")).schedules_by_key()[schedule_key(location, day)]
+
+    tz = pytz.timezone(location.timezone)
+    sunrise, sunset = _minute_sun_times(location.latitude, location.longitude, np.array([day], dtype="datetime64[D]"))
+    timings = {"Sunrise": _aladhan_clock(sunrise[0], tz), "Sunset": _aladhan_clock(sunset[0], tz)}
+    from_aladhan = schedule_from_timings(timings, day, location.timezone)
+
+    assert from_aladhan["windows"] == from_batch["windows"]
+    sunrise_hour = dict(zip((w["key"] for w in WATCHES), from_aladhan["windows"]))["sunrise"]
+    assert sunrise_hour[1].date() == day  # the Sunrise Hour ends on the morning of its own date